@@ -0,0 +1,146 @@
+"""
+Model Tiering Benchmark
+
+Compares routing latency, routing accuracy and token usage of the orchestrator
+across model tiers on a labeled query set.
+
+Only the routing decision is measured: the orchestrator's routing tools are
+replaced by recorders and the run stops at the first tool call, so no
+specialist agent or Parts API call is made.
+
+Usage:
+    python benchmarks/model_tiering.py --tiers gpt-4.1-nano gpt-4.1-mini gpt-4.1
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.orchestrator_agent import create_orchestrator
+from src.api.config import openai_config, AgentModelConfig
+from agents import Agent, FunctionTool, Runner
+
+DEFAULT_QUERIES = Path(__file__).parent / "data" / "routing_queries.json"
+
+
+def routing_probe(orchestrator: Agent) -> Tuple[Agent, List[str]]:
+    """
+    Clone the orchestrator with recording routing tools.
+
+    Args:
+        orchestrator: Orchestrator agent configured for the tier under test
+
+    Returns:
+        tuple: Probe agent and the list that receives routed tool names
+    """
+    routed: List[str] = []
+
+    def recorder(tool: FunctionTool) -> FunctionTool:
+        async def on_invoke_tool(ctx, arguments: str) -> str:
+            routed.append(tool.name)
+            return "routed"
+
+        return FunctionTool(
+            name=tool.name,
+            description=tool.description,
+            params_json_schema=tool.params_json_schema,
+            on_invoke_tool=on_invoke_tool,
+            strict_json_schema=tool.strict_json_schema,
+        )
+
+    probe = orchestrator.clone(
+        tools=[recorder(tool) for tool in orchestrator.tools],
+        tool_use_behavior="stop_on_first_tool",
+    )
+    return probe, routed
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def benchmark_tier(
+    tier: AgentModelConfig, queries: List[Dict[str, str]], repeat: int
+) -> Dict[str, float]:
+    """
+    Run the labeled query set against one model tier.
+
+    Args:
+        tier: Orchestrator model settings
+        queries: Labeled queries (``query`` / ``expected`` tool name)
+        repeat: Number of passes over the query set
+
+    Returns:
+        dict: Accuracy, latency percentiles and average tokens per query
+    """
+    probe, routed = routing_probe(create_orchestrator(tier))
+    latencies: List[float] = []
+    tokens: List[int] = []
+    correct = 0
+
+    for _ in range(repeat):
+        for item in queries:
+            routed.clear()
+            start = time.perf_counter()
+            result = await Runner.run(probe, item["query"])
+            latencies.append(time.perf_counter() - start)
+            tokens.append(result.context_wrapper.usage.total_tokens)
+            if routed and routed[0] == item["expected"]:
+                correct += 1
+
+    return {
+        "accuracy": correct / len(latencies),
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "mean": statistics.mean(latencies),
+        "tokens": statistics.mean(tokens),
+    }
+
+
+async def main():
+    """Run the benchmark for every requested tier and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tiers", nargs="+", required=True, help="Model names")
+    parser.add_argument("--queries", type=Path, default=DEFAULT_QUERIES)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--temperature", type=float, default=None)
+    parser.add_argument("--max-output-tokens", type=int, default=None)
+    args = parser.parse_args()
+
+    if not openai_config.is_configured:
+        print("❌ OPENAI_API_KEY is not set; the benchmark calls the real models.")
+        sys.exit(1)
+
+    queries = json.loads(args.queries.read_text())
+
+    print("=" * 70)
+    print(f"{'Tier':<24}{'Accuracy':>10}{'p50 (s)':>10}{'p95 (s)':>10}{'Tokens':>10}")
+    print("-" * 70)
+    for model in args.tiers:
+        tier = AgentModelConfig(model, args.temperature, args.max_output_tokens)
+        stats = await benchmark_tier(tier, queries, args.repeat)
+        print(
+            f"{model:<24}{stats['accuracy']:>10.1%}{stats['p50']:>10.2f}"
+            f"{stats['p95']:>10.2f}{stats['tokens']:>10.0f}"
+        )
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
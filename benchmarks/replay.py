@@ -0,0 +1,64 @@
+"""
+Conversation Replay
+
+Replays conversations recorded with ``examples/demo_cli.py --record`` through
+the current code, with the model and the Parts API answering from the
+recording, and reports per-turn latency, model-call and token deltas.
+
+By default recorded model and API latencies are reproduced, so latency deltas
+show the framework's own overhead and any change in how many calls a turn
+makes; ``--latency-scale 0`` replays as fast as possible.
+
+Usage:
+    python examples/demo_cli.py --record slow_session.json.gz
+    python benchmarks/replay.py slow_session.json.gz
+    python benchmarks/replay.py recordings/*.json.gz --latency-scale 0 --profile
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.client import api_client
+from src.serving.replay import RecordedAPI, replay_conversation
+from src.utils.profiling import add_profile_arguments, profiled
+from src.testing.stubs import LocalAPIStub
+from src.utils.recording import ConversationRecorder
+
+
+def replay_file(path: str, latency_scale: float) -> None:
+    """Replay one recording against a stub serving its API responses."""
+    recording = ConversationRecorder.load(path)
+    api = RecordedAPI(recording.turns, latency_scale)
+    with LocalAPIStub(responder=api.respond) as stub:
+        api_client.config.base_url = stub.base_url
+        report = asyncio.run(replay_conversation(recording, latency_scale))
+    print(report.summary())
+    if api.misses:
+        print(f"API requests not in the recording: {api.misses}")
+
+
+def main():
+    """Replay each recording and print its comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("recordings", nargs="+", help="Recording files")
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier for recorded model/API latency (0 disables)",
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    with profiled(args.profile, args.profile_output, args.profile_top):
+        for path in args.recordings:
+            replay_file(path, args.latency_scale)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Response Model Benchmark
+
+Compares decode + serialize cost, retained memory and LLM payload size of the
+typed response models against the previous dict path (``response.json()``
+followed by ``str(dict)``, which is what a dict-returning tool hands the model).
+
+Usage:
+    python benchmarks/response_models.py --parts 20 --iterations 20000
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api import models
+from src.api.models import OrderStatusResponse
+
+
+def order_status_body(parts: int) -> bytes:
+    """Build a realistic ``/parts/status`` response body with N part lines."""
+    return json.dumps(
+        {
+            "statusCode": 200,
+            "body": {
+                "partOrderDetails": {
+                    "orderNumber": "W174191",
+                    "status": "Shipped",
+                    "partsDetail": [
+                        {
+                            "partNumber": f"53044953{i:02d}",
+                            "description": "Door gasket",
+                            "quantity": 1,
+                            "shipDate": "2025-06-01",
+                            "arrivalDate": None,
+                            "trackingNumber": "",
+                        }
+                        for i in range(parts)
+                    ],
+                    "customer": {
+                        "name": "Jane Doe",
+                        "address": "1 Main St",
+                        "zip": "60179",
+                        "phone": None,
+                    },
+                },
+                "message": "Order found",
+            },
+        }
+    ).encode()
+
+
+def dict_path(body: bytes) -> str:
+    return str(json.loads(body))
+
+
+def typed_path(body: bytes) -> str:
+    return OrderStatusResponse.from_dict(models.decode_json(body)).to_llm()
+
+
+def time_per_call(fn: Callable[[bytes], Any], body: bytes, iterations: int) -> float:
+    """Mean wall time per call in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(body)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def retained_bytes(build: Callable[[bytes], Any], body: bytes, count: int) -> float:
+    """Mean bytes retained per decoded response."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(body) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def main():
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--parts", type=int, default=20, help="Part lines per order")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--memory-samples", type=int, default=2000)
+    args = parser.parse_args()
+
+    body = order_status_body(args.parts)
+    fast_codec = models.orjson
+    results: Dict[str, Dict[str, float]] = {}
+
+    paths = [("dict (json + str)", dict_path, json.loads, False)]
+    if fast_codec is not None:
+        paths.append(("typed (orjson)", typed_path, None, True))
+    paths.append(("typed (stdlib json)", typed_path, None, False))
+
+    for name, fn, decode, use_fast in paths:
+        models.orjson = fast_codec if use_fast else None
+        build = decode or (
+            lambda data: OrderStatusResponse.from_dict(models.decode_json(data))
+        )
+        results[name] = {
+            "us": time_per_call(fn, body, args.iterations),
+            "bytes": retained_bytes(build, body, args.memory_samples),
+            "chars": len(fn(body)),
+        }
+    models.orjson = fast_codec
+
+    print("=" * 70)
+    print(f"Order status response with {args.parts} part lines ({len(body)} bytes)")
+    print("-" * 70)
+    print(f"{'Path':<24}{'µs/resp':>12}{'Retained B':>14}{'LLM chars':>12}")
+    for name, stats in results.items():
+        print(
+            f"{name:<24}{stats['us']:>12.1f}{stats['bytes']:>14.0f}{stats['chars']:>12}"
+        )
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
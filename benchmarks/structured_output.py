@@ -0,0 +1,260 @@
+"""
+Structured Specialist Output Benchmark
+
+Compares tokens per request with specialists returning text (stringified
+``RunResult`` handed back to the orchestrator, which rephrases it) against
+specialists returning a ``SpecialistAnswer`` the orchestrator passes through,
+over the labeled example queries.
+
+By default the real models are called (the Parts API is the configured one, or
+the local stub with ``--stub``). With ``--offline`` a scripted model stands in
+for every agent and reports usage estimated from prompt size (~4 characters per
+token), which shows the structural saving without an API key.
+
+Usage:
+    python benchmarks/structured_output.py --stub
+    python benchmarks/structured_output.py --offline
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import re
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents import Model, ModelResponse, RunConfig, Runner, Usage
+
+from src.agents.orchestrator_agent import create_orchestrator
+from src.agents.usage import usage_hooks, usage_scope
+from src.api.client import api_client
+from src.api.config import openai_config
+from src.testing.stubs import LocalAPIStub, function_call, message
+
+DEFAULT_QUERIES = Path(__file__).parent / "data" / "routing_queries.json"
+CHARS_PER_TOKEN = 4
+ROUTING_TOOLS = {"parts_support_tool", "parts_sales_tool"}
+
+
+def estimate_tokens(*parts: Any) -> int:
+    """Estimate tokens of prompt parts from their serialized size."""
+    chars = sum(
+        len(part if isinstance(part, str) else json.dumps(part, default=str))
+        for part in parts
+        if part
+    )
+    return math.ceil(chars / CHARS_PER_TOKEN)
+
+
+class EstimatingModel(Model):
+    """
+    Scripted model for every agent, reporting usage estimated from prompt size.
+
+    The orchestrator routes to the labeled tool and, given a tool result,
+    rephrases it. Specialists answer directly, as text or as the JSON of a
+    ``SpecialistAnswer`` when an output schema is requested.
+    """
+
+    def __init__(self, expected: Dict[str, str]):
+        self.expected = expected
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+        **kwargs,
+    ) -> ModelResponse:
+        items = input if isinstance(input, list) else [input]
+        query = next(
+            (
+                item if isinstance(item, str) else item.get("content")
+                for item in items
+                if isinstance(item, str) or item.get("role") == "user"
+            ),
+            "",
+        )
+        tool_output = next(
+            (
+                item["output"]
+                for item in items
+                if isinstance(item, dict) and item.get("type") == "function_call_output"
+            ),
+            None,
+        )
+        reply = (
+            f"I looked into your request ({query.splitlines()[-1]}). Everything "
+            "checks out on our side; the details are above, and I'm happy to help "
+            "with anything else."
+        )
+
+        if {tool.name for tool in tools} & ROUTING_TOOLS:
+            if tool_output is None:
+                tool = self.expected.get(query, "parts_support_tool")
+                output = [function_call(tool, {"query": query}, f"call_{tool}")]
+            else:
+                output = [message(reply)]
+        elif output_schema is not None:
+            answer = {
+                "intent": "lookup",
+                "entities": [
+                    {"kind": "identifier", "value": value}
+                    for value in re.findall(r"\b[A-Z]?\d[\d-]{3,}\b", query)
+                ],
+                "answer": reply,
+                "follow_up_needed": False,
+            }
+            output = [message(json.dumps(answer))]
+        else:
+            output = [message(reply)]
+
+        schemas = [
+            (tool.name, tool.description, getattr(tool, "params_json_schema", None))
+            for tool in tools
+        ]
+        input_tokens = estimate_tokens(
+            system_instructions,
+            input,
+            schemas,
+            output_schema.json_schema() if output_schema else None,
+        )
+        output_tokens = estimate_tokens([item.model_dump() for item in output])
+        return ModelResponse(
+            output=output,
+            usage=Usage(
+                requests=1,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
+            ),
+            response_id=None,
+        )
+
+    async def stream_response(self, *args, **kwargs):
+        raise NotImplementedError("EstimatingModel does not support streaming")
+        yield  # pragma: no cover
+
+
+async def benchmark_mode(
+    structured: bool, queries: List[Dict[str, str]], run_config: RunConfig
+) -> Dict[str, float]:
+    """
+    Run every query through the orchestrator in one output mode.
+
+    Args:
+        structured: Whether specialists return a ``SpecialistAnswer``
+        queries: Labeled queries (``query`` / ``expected`` tool name)
+        run_config: Run config shared by all runs
+
+    Returns:
+        dict: Mean model calls, tokens and handed-back characters per query
+    """
+    orchestrator = create_orchestrator(structured=structured)
+    calls, input_tokens, output_tokens, handoff = [], [], [], []
+
+    for item in queries:
+        with usage_scope(budget=0) as usage:
+            result = await Runner.run(
+                orchestrator, item["query"], run_config=run_config, hooks=usage_hooks
+            )
+        calls.append(usage.total.requests)
+        input_tokens.append(usage.total.input_tokens)
+        output_tokens.append(usage.total.output_tokens)
+        handoff.append(
+            sum(
+                len(str(run_item.output))
+                for run_item in result.new_items
+                if run_item.type == "tool_call_output_item"
+            )
+        )
+
+    return {
+        "calls": statistics.mean(calls),
+        "input": statistics.mean(input_tokens),
+        "output": statistics.mean(output_tokens),
+        "total": statistics.mean(i + o for i, o in zip(input_tokens, output_tokens)),
+        "handoff": statistics.mean(handoff),
+    }
+
+
+async def run(args, stub: Optional[LocalAPIStub]) -> None:
+    """Run both modes and print a comparison table."""
+    queries = json.loads(args.queries.read_text())
+    if stub is not None:
+        api_client.config.base_url = stub.base_url
+    if args.offline:
+        model = EstimatingModel({item["query"]: item["expected"] for item in queries})
+        run_config = RunConfig(model=model, tracing_disabled=True)
+    else:
+        run_config = RunConfig()
+
+    results = {
+        label: await benchmark_mode(structured, queries, run_config)
+        for label, structured in (("text", False), ("structured", True))
+    }
+
+    unit = "est. tokens" if args.offline else "tokens"
+    print("=" * 74)
+    print(f"{len(queries)} queries, mean per query ({unit})")
+    print(
+        f"{'Specialist output':<20}{'Calls':>8}{'Input':>10}{'Output':>10}"
+        f"{'Total':>10}{'Handoff (chars)':>16}"
+    )
+    print("-" * 74)
+    for label, stats in results.items():
+        print(
+            f"{label:<20}{stats['calls']:>8.1f}{stats['input']:>10.0f}"
+            f"{stats['output']:>10.0f}{stats['total']:>10.0f}{stats['handoff']:>16.0f}"
+        )
+    print("-" * 74)
+    saved = 1 - results["structured"]["total"] / results["text"]["total"]
+    print(f"Token reduction: {saved:.1%}")
+    print("=" * 74)
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--queries", type=Path, default=DEFAULT_QUERIES)
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use a scripted model with estimated usage (implies --stub)",
+    )
+    parser.add_argument(
+        "--stub", action="store_true", help="Serve the Parts API from a local stub"
+    )
+    args = parser.parse_args()
+
+    if not args.offline and not openai_config.is_configured:
+        print("❌ OPENAI_API_KEY is not set; use --offline for an estimate.")
+        sys.exit(1)
+
+    if args.offline or args.stub:
+        with LocalAPIStub() as stub:
+            asyncio.run(run(args, stub))
+    else:
+        asyncio.run(run(args, None))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Worker Scaling Benchmark
+
+Measures request throughput of the worker pool from 1 to N worker processes,
+using the local Parts API stub and a fake model that burns a fixed amount of
+CPU per call (standing in for prompt building, JSON handling and logging).
+
+Usage:
+    python benchmarks/worker_scaling.py --max-workers 4 --requests 200
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import wait
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents import RunConfig
+
+from src.serving import OrchestratorSessionHandler, WorkerPool
+from src.testing.stubs import LocalAPIStub, ToolThenAnswerModel
+
+QUERY = "Details on part 5304495391"
+
+
+def make_handler() -> OrchestratorSessionHandler:
+    """Worker-side factory: point the client at the stub and use the fake model."""
+    from src.api.client import api_client
+
+    api_client.config.base_url = os.environ["PARTS_API_BASE_URL"]
+    model = ToolThenAnswerModel(
+        {
+            "parts_sales_tool": {"query": QUERY},
+            "get_part_details_tool": {"part_number": "5304495391"},
+        },
+        cpu_seconds=float(os.environ.get("BENCH_CPU_SECONDS", "0.005")),
+    )
+    return OrchestratorSessionHandler(RunConfig(model=model, tracing_disabled=True))
+
+
+def measure(workers: int, requests: int, sessions: int) -> float:
+    """Return requests per second for a pool of the given size."""
+    with WorkerPool(make_handler, num_workers=workers) as pool:
+        pool.wait_ready()
+        # Exercise every worker once more so first-call costs aren't timed
+        warm = [pool.submit(f"warm-{i}", QUERY) for i in range(workers * 4)]
+        wait(warm)
+
+        start = time.perf_counter()
+        futures = [
+            pool.submit(f"session-{i % sessions}", QUERY) for i in range(requests)
+        ]
+        for future in futures:
+            future.result()
+        return requests / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark for 1..N workers and print a scaling table."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=64)
+    parser.add_argument("--cpu-ms", type=float, default=5.0, help="CPU per model call")
+    parser.add_argument("--api-latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    os.environ["BENCH_CPU_SECONDS"] = str(args.cpu_ms / 1000)
+    delays = {"/parts/lookup": args.api_latency_ms / 1000}
+
+    with LocalAPIStub(delays=delays) as stub:
+        os.environ["PARTS_API_BASE_URL"] = stub.base_url
+
+        print("=" * 70)
+        print(f"{'Workers':>8}{'Req/s':>12}{'Speedup':>12}")
+        print("-" * 70)
+        baseline = None
+        for workers in range(1, args.max_workers + 1):
+            throughput = measure(workers, args.requests, args.sessions)
+            baseline = baseline or throughput
+            print(f"{workers:>8}{throughput:>12.1f}{throughput / baseline:>11.2f}x")
+        print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Batch Runner
+
+Runs a list of queries through the orchestrator one after another and reports
+per-query latency. With ``--profile`` the whole batch is profiled and broken
+down by stage (routing, specialist, tool, HTTP, logging).
+
+``--offline`` runs against the local Parts API stub and a scripted model, so
+the framework's own overhead can be profiled without network access or keys.
+
+Usage:
+    python examples/batch_runner.py --queries benchmarks/data/routing_queries.json
+    python examples/batch_runner.py --offline --repeat 50 --profile
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import List
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file in project root
+project_root = Path(__file__).parent.parent
+load_dotenv(dotenv_path=project_root / ".env", override=True)
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(project_root))
+
+from agents import RunConfig, Runner
+
+from src.agents.orchestrator_agent import create_orchestrator
+from src.utils.profiling import add_profile_arguments, profiled
+
+DEFAULT_QUERIES = project_root / "benchmarks" / "data" / "routing_queries.json"
+
+
+def load_queries(path: Path) -> List[str]:
+    """
+    Load queries from a JSON list (strings or ``{"query": ...}``) or a text file.
+
+    Args:
+        path: Query file; text files hold one query per line, '#' for comments
+
+    Returns:
+        list: Queries in file order
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        return [
+            item["query"] if isinstance(item, dict) else item
+            for item in json.loads(text)
+        ]
+    return [
+        line.strip()
+        for line in text.splitlines()
+        if line.strip() and not line.startswith("#")
+    ]
+
+
+async def run_batch(queries: List[str], run_config=None) -> List[float]:
+    """Run each query as a fresh conversation and return per-query latencies."""
+    orchestrator = create_orchestrator()
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        await Runner.run(orchestrator, query, run_config=run_config)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def offline_run_config(stack: ExitStack) -> RunConfig:
+    """Start the local API stub and return a run config using the scripted model."""
+    from src.api.client import api_client
+    from src.testing.stubs import LocalAPIStub, ToolThenAnswerModel
+
+    stub = stack.enter_context(LocalAPIStub())
+    api_client.config.base_url = stub.base_url
+    model = ToolThenAnswerModel(
+        {
+            "parts_sales_tool": {"query": "Details on part 5304495391"},
+            "get_part_details_tool": {"part_number": "5304495391"},
+        }
+    )
+    return RunConfig(model=model, tracing_disabled=True)
+
+
+def main():
+    """Run the batch and print a latency summary."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--queries", type=Path, default=DEFAULT_QUERIES)
+    parser.add_argument("--repeat", type=int, default=1, help="Run the list N times")
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use the local API stub and a scripted model",
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    queries = load_queries(args.queries) * args.repeat
+
+    with ExitStack() as stack:
+        run_config = offline_run_config(stack) if args.offline else None
+        with profiled(args.profile, args.profile_output, args.profile_top):
+            latencies = asyncio.run(run_batch(queries, run_config))
+
+    print("=" * 70)
+    print(f"Queries: {len(latencies)}")
+    print(f"Mean latency: {statistics.mean(latencies) * 1000:.1f} ms")
+    print(f"Max latency:  {max(latencies) * 1000:.1f} ms")
+    print(f"Total:        {sum(latencies):.2f} s")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@
 Interactive CLI Demo
 
 An interactive command-line interface for testing the multi-agent orchestration framework.
+With ``--record PATH`` the conversation is recorded for ``benchmarks/replay.py``.
 """
 
+import argparse
 import asyncio
 import sys
+import uuid
+from contextlib import nullcontext
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -17,8 +21,14 @@ load_dotenv(dotenv_path=env_path, override=True)
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.agents.orchestrator_agent import create_orchestrator
-from agents import Runner
+from src.agents.answer_cache import AnswerCache, cacheable_turn
+from src.agents.usage import usage_hooks, usage_scope
+from src.api import api_client, api_config, openai_config, RequestPrefetcher
+from src.api.idempotency import current_session_id
+from src.serving.warmup import Warmup
+from src.utils.profiling import add_profile_arguments, idle_wait, profiled
+from src.utils.recording import ConversationRecorder, RecordingModelProvider
+from agents import AsyncOpenAI, RunConfig, Runner
 
 
 def print_banner():
@@ -51,17 +61,60 @@ def print_example_queries():
     print("-" * 70)
 
 
-async def main():
-    """Main CLI loop with conversation context."""
+async def main(record_path=None):
+    """
+    Warm up, then run the CLI loop with conversation context.
+
+    Args:
+        record_path: Optional file the conversation is recorded to after each turn
+    """
     print_banner()
     print_example_queries()
 
-    # Create orchestrator and runner
-    orchestrator = create_orchestrator()
+    # Build the agent graph and open API/model connections before the first query
+    warmup = Warmup(model_client=AsyncOpenAI() if openai_config.is_configured else None)
+    await warmup.run()
+    try:
+        await run_conversation(warmup.orchestrator, record_path)
+    finally:
+        warmup.shutdown()
+
+
+async def run_conversation(orchestrator, record_path=None):
+    """
+    Answer queries until the user exits.
+
+    Args:
+        orchestrator: Warmed-up orchestrator agent
+        record_path: Optional file the conversation is recorded to after each turn
+    """
     runner = Runner()
 
+    # Optionally start likely lookups while the models are routing
+    prefetcher = (
+        RequestPrefetcher(api_client, api_config.prefetch_max_calls)
+        if api_config.prefetch_enabled
+        else None
+    )
+
+    # Optionally answer repeated product questions without any model calls
+    answer_cache = (
+        AnswerCache(api_config.part_data_ttl, api_config.answer_cache_max_entries)
+        if api_config.answer_cache_enabled
+        else None
+    )
+
     # Initialize conversation context
     conversation_history = []
+    session_id = uuid.uuid4().hex
+    # Scopes idempotency keys so repeated confirmations don't repeat mutations
+    current_session_id.set(session_id)
+
+    # Optionally record model decisions, tool outputs and API calls for replay
+    recorder = ConversationRecorder(session_id) if record_path else None
+    run_config = (
+        RunConfig(model_provider=RecordingModelProvider()) if recorder else None
+    )
 
     print("\n✅ System initialized and ready!")
     print(
@@ -70,8 +123,9 @@ async def main():
 
     while True:
         try:
-            # Get user input
-            query = input("🗣️  Your query: ").strip()
+            # Get user input (think time is idle, not work, when profiling)
+            with idle_wait():
+                query = input("🗣️  Your query: ").strip()
 
             # Check for exit commands
             if query.lower() in {"quit", "exit", "q"}:
@@ -98,17 +152,54 @@ async def main():
             else:
                 context_aware_query = query
 
-            # Run the query through the orchestrator
-            result = await runner.run(orchestrator, context_aware_query)
+            has_context = bool(conversation_history)
+            recording = (
+                recorder.turn(query, context_aware_query) if recorder else nullcontext()
+            )
+            with recording as turn:
+                response = (
+                    answer_cache.get(query, has_context) if answer_cache else None
+                )
+
+                usage = None
+                if response is None:
+                    # Run the query through the orchestrator, accounting its tokens
+                    with usage_scope() as usage:
+                        if prefetcher:
+                            with prefetcher.prefetch(context_aware_query):
+                                result = await runner.run(
+                                    orchestrator,
+                                    context_aware_query,
+                                    run_config=run_config,
+                                    hooks=usage_hooks,
+                                )
+                        else:
+                            result = await runner.run(
+                                orchestrator,
+                                context_aware_query,
+                                run_config=run_config,
+                                hooks=usage_hooks,
+                            )
+
+                    response = str(result.final_output)
+                    if answer_cache and cacheable_turn(result.final_output, usage):
+                        answer_cache.put(query, response, has_context)
+
+                if turn is not None:
+                    turn.output = response
+            if recorder:
+                recorder.save(record_path)
 
             # Store in conversation history
-            conversation_history.append({"query": query, "response": str(result)})
+            conversation_history.append({"query": query, "response": response})
 
             # Display result
             print("🤖 Response:")
             print("-" * 70)
-            print(result)
+            print(response)
             print("-" * 70)
+            if usage is not None:
+                print(f"📊 {usage.summary()}")
             print()
 
         except KeyboardInterrupt:
@@ -120,7 +211,15 @@ async def main():
 
 
 if __name__ == "__main__":
-    try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        print("\n\nExiting...")
+    parser = argparse.ArgumentParser(description="Interactive CLI demo")
+    parser.add_argument(
+        "--record", metavar="PATH", help="Record the conversation for replay"
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    with profiled(args.profile, args.profile_output, args.profile_top):
+        try:
+            asyncio.run(main(args.record))
+        except KeyboardInterrupt:
+            print("\n\nExiting...")
@@ -3,9 +3,26 @@
 from .parts_support_agent import create_support_agent
 from .parts_sales_agent import create_sales_agent
 from .orchestrator_agent import create_orchestrator
+from .answer_cache import AnswerCache, cacheable_turn
+from .specialist_output import SpecialistAnswer
+from .usage import (
+    RequestUsage,
+    TokenBudgetExceeded,
+    UsageMetrics,
+    usage_hooks,
+    usage_scope,
+)
 
 __all__ = [
     "create_support_agent",
     "create_sales_agent",
     "create_orchestrator",
+    "AnswerCache",
+    "cacheable_turn",
+    "SpecialistAnswer",
+    "RequestUsage",
+    "TokenBudgetExceeded",
+    "UsageMetrics",
+    "usage_hooks",
+    "usage_scope",
 ]
@@ -0,0 +1,211 @@
+"""
+Answer Cache
+
+Caches final orchestrator answers for repeatable, read-only product questions
+(e.g. "Details on part 5304495391") so repeats skip every model and tool call.
+Only answers built from a successful part lookup are stored, so a transient API
+error or a clarifying question is never replayed to later users.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+from ..utils.entities import extract_entities
+from .specialist_output import SpecialistAnswer
+from .usage import RequestUsage
+
+# Words that signal support intents or mutations; such queries are never cached
+_NON_SALES_PATTERN = re.compile(
+    r"\b(order|refund|subscription|subscribe|membership|cancel|update|change|"
+    r"track|return|account)s?\b",
+    re.IGNORECASE,
+)
+# Words whose meaning depends on earlier turns
+_CONTEXT_DEPENDENT_PATTERN = re.compile(
+    r"\b(it|its|that|this|those|these|same|also|instead|them|one)\b", re.IGNORECASE
+)
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s-]")
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Tuple[str, ...]], ...]]
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query for cache keying.
+
+    Args:
+        query: Raw user query
+
+    Returns:
+        str: Lower-cased query without punctuation and with collapsed whitespace
+    """
+    return " ".join(_PUNCTUATION_PATTERN.sub(" ", query.lower()).split())
+
+
+def cacheable_turn(final_output: Any, usage: RequestUsage) -> bool:
+    """
+    Check whether a finished turn's answer may be cached.
+
+    Args:
+        final_output: Final output of the orchestrator run
+        usage: Ledger of the turn, with its tool calls
+
+    Returns:
+        bool: True if the sales specialist answered from a part lookup, no tool
+            call failed and (with structured output) no follow-up is needed
+    """
+    if isinstance(final_output, SpecialistAnswer) and final_output.follow_up_needed:
+        return False
+    return (
+        usage.tool_calls["parts_sales_tool"] > 0
+        and usage.tool_calls["get_part_details_tool"] > 0
+        and not usage.tool_errors
+    )
+
+
+@dataclass
+class _Entry:
+    answer: str
+    expires_at: float
+
+
+@dataclass
+class AnswerCacheMetrics:
+    """Counters for answer cache activity."""
+
+    hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of cacheable lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class AnswerCache:
+    """Size-bounded TTL cache of final answers for read-only sales queries."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the answer cache.
+
+        Args:
+            ttl_seconds: Entry lifetime; should match how long part data stays valid
+            max_entries: Maximum number of cached answers (LRU eviction)
+            clock: Time source, overridable for tests
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.metrics = AnswerCacheMetrics()
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key_for(self, query: str, has_context: bool = False) -> Optional[CacheKey]:
+        """
+        Build the cache key for a query, or None if it must bypass the cache.
+
+        A query is cacheable only if it is a read-only sales question that names
+        a part number and doesn't lean on earlier conversation turns.
+
+        Args:
+            query: Current user turn (without conversation history)
+            has_context: Whether earlier turns precede this query
+
+        Returns:
+            tuple or None: Normalized query plus extracted entities
+        """
+        entities = extract_entities(query)
+        if not entities["part_numbers"]:
+            return None
+        if (
+            entities["order_numbers"]
+            or entities["membership_ids"]
+            or entities["phone_numbers"]
+            or _NON_SALES_PATTERN.search(query)
+        ):
+            return None
+        if has_context and _CONTEXT_DEPENDENT_PATTERN.search(query):
+            return None
+
+        key_entities = tuple(
+            (name, tuple(values))
+            for name, values in sorted(entities.items())
+            if name in ("part_numbers", "model_numbers", "zips") and values
+        )
+        return normalize_query(query), key_entities
+
+    def get(self, query: str, has_context: bool = False) -> Optional[str]:
+        """
+        Return the cached answer for a query, if present and fresh.
+
+        Args:
+            query: Current user turn (without conversation history)
+            has_context: Whether earlier turns precede this query
+
+        Returns:
+            str or None: Cached final answer
+        """
+        key = self.key_for(query, has_context)
+        with self._lock:
+            if key is None:
+                self.metrics.bypasses += 1
+                return None
+
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.metrics.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.metrics.hits += 1
+            return entry.answer
+
+    def put(self, query: str, answer: str, has_context: bool = False) -> bool:
+        """
+        Store the final answer for a query if it is cacheable. Callers check
+        ``cacheable_turn`` first.
+
+        Args:
+            query: Current user turn (without conversation history)
+            answer: Final answer text returned to the user
+            has_context: Whether earlier turns precede this query
+
+        Returns:
+            bool: True if the answer was cached
+        """
+        key = self.key_for(query, has_context)
+        if key is None:
+            return False
+
+        with self._lock:
+            self._entries[key] = _Entry(
+                answer=answer, expires_at=self._clock() + self.ttl_seconds
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.metrics.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Remove every cached answer."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
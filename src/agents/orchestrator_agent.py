@@ -4,66 +4,151 @@ Orchestrator Agent
 Routes queries to specialized agents based on intent and query type.
 """
 
-from agents import Agent, Runner, function_tool
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+
+from agents import (
+    Agent,
+    FunctionTool,
+    ModelSettings,
+    Runner,
+    RunContextWrapper,
+    function_tool,
+)
+from ..api.config import openai_config, AgentModelConfig
 from .parts_support_agent import create_support_agent
 from .parts_sales_agent import create_sales_agent
+from .specialist_output import SpecialistAnswer, stop_at_specialist_answer
+from .usage import tool_attribution, usage_hooks
 
-
-# Create agent instances
-_support_agent = create_support_agent()
-_sales_agent = create_sales_agent()
 _runner = Runner()
 
 
-@function_tool
-async def parts_support_tool(query: str) -> str:
+@lru_cache(maxsize=None)
+def specialist_agents(structured: bool) -> Tuple[Agent, Agent]:
     """
-    Routes queries to the parts support agent for order status, refunds, and subscriptions.
-
-    Use this tool for:
-    - Order status inquiries
-    - Refund status checks
-    - Subscription lookups, updates, or cancellations
-    - Customer support related queries
+    Support and sales agents for an output mode, built once per mode.
 
     Args:
-        query: The customer's support query
+        structured: Whether the specialists return a ``SpecialistAnswer``
 
     Returns:
-        str: The support agent's response
+        tuple: (support agent, sales agent)
     """
-    result = await _runner.run(_support_agent, query)
-    return str(result)
+    return (
+        create_support_agent(structured=structured),
+        create_sales_agent(structured=structured),
+    )
 
 
-@function_tool
-async def parts_sales_tool(query: str) -> str:
-    """
-    Routes queries to the parts sales agent for product information and compatibility.
+def _run_config(ctx: RunContextWrapper):
+    """Run config of the orchestrator run, so specialist runs inherit it."""
+    return getattr(ctx, "run_config", None)
 
-    Use this tool for:
-    - Part specifications and details
-    - Model compatibility checks
-    - Shipping availability information
-    - Product-related inquiries
 
-    Args:
-        query: The customer's sales/product query
+async def _run_specialist(
+    ctx: RunContextWrapper, tool: str, agent: Agent, query: str
+) -> Union[str, SpecialistAnswer]:
+    """
+    Run a specialist agent as part of the orchestrator's request.
 
     Returns:
-        str: The sales agent's response
+        The specialist's ``SpecialistAnswer`` when it produces structured output,
+        otherwise its stringified run result
     """
-    result = await _runner.run(_sales_agent, query)
+    with tool_attribution(tool):
+        result = await _runner.run(
+            agent,
+            query,
+            context=ctx.context,
+            run_config=_run_config(ctx),
+            hooks=usage_hooks,
+        )
+    # Fold the nested run's usage into the orchestrator run's, so the request's
+    # RunResult reports what the whole request cost
+    ctx.usage.add(result.context_wrapper.usage)
+    if isinstance(result.final_output, SpecialistAnswer):
+        return result.final_output
     return str(result)
 
 
-def create_orchestrator() -> Agent:
+@lru_cache(maxsize=None)
+def routing_tools(structured: bool) -> Tuple[FunctionTool, FunctionTool]:
+    """
+    Routing tools that run the specialists of an output mode.
+
+    Args:
+        structured: Whether the specialists return a ``SpecialistAnswer``
+
+    Returns:
+        tuple: (parts_support_tool, parts_sales_tool)
+    """
+    support_agent, sales_agent = specialist_agents(structured)
+
+    @function_tool
+    async def parts_support_tool(
+        ctx: RunContextWrapper, query: str
+    ) -> Union[str, SpecialistAnswer]:
+        """
+        Routes queries to the parts support agent for order status, refunds, and subscriptions.
+
+        Use this tool for:
+        - Order status inquiries
+        - Refund status checks
+        - Subscription lookups, updates, or cancellations
+        - Customer support related queries
+
+        Args:
+            query: The customer's support query
+
+        Returns:
+            str or SpecialistAnswer: The support agent's response
+        """
+        return await _run_specialist(ctx, "parts_support_tool", support_agent, query)
+
+    @function_tool
+    async def parts_sales_tool(
+        ctx: RunContextWrapper, query: str
+    ) -> Union[str, SpecialistAnswer]:
+        """
+        Routes queries to the parts sales agent for product information and compatibility.
+
+        Use this tool for:
+        - Part specifications and details
+        - Model compatibility checks
+        - Shipping availability information
+        - Product-related inquiries
+
+        Args:
+            query: The customer's sales/product query
+
+        Returns:
+            str or SpecialistAnswer: The sales agent's response
+        """
+        return await _run_specialist(ctx, "parts_sales_tool", sales_agent, query)
+
+    return parts_support_tool, parts_sales_tool
+
+
+def create_orchestrator(
+    model_config: Optional[AgentModelConfig] = None, structured: Optional[bool] = None
+) -> Agent:
     """
     Create and configure the Orchestrator Agent.
 
+    Args:
+        model_config: Optional model tier settings. Uses ``openai_config.orchestrator``
+            if not provided.
+        structured: Produce a ``SpecialistAnswer`` as the final output. Uses
+            ``openai_config.structured_specialist_output`` if not provided.
+
     Returns:
         Agent: Configured orchestrator agent that routes to specialized agents
     """
+    model_config = model_config or openai_config.orchestrator
+    if structured is None:
+        structured = openai_config.structured_specialist_output
+
     return Agent(
         name="PartsOrchestratorAgent",
         instructions="""
@@ -106,5 +191,14 @@ def create_orchestrator() -> Agent:
         - If you see a phone number or membership ID in follow-up, treat it as part of a subscription query
         - Let the specialized agent handle the details once you've routed with complete info
         """,
-        tools=[parts_support_tool, parts_sales_tool],
+        tools=list(routing_tools(structured)),
+        # A structured specialist answer is returned as-is, without another
+        # model call to rephrase it
+        tool_use_behavior=stop_at_specialist_answer,
+        output_type=SpecialistAnswer if structured else None,
+        model=model_config.model,
+        model_settings=ModelSettings(
+            temperature=model_config.temperature,
+            max_tokens=model_config.max_output_tokens,
+        ),
     )
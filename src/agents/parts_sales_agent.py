@@ -4,18 +4,32 @@ Parts Sales Agent
 Handles sales inquiries including part specifications, compatibility, and shipping information.
 """
 
-from agents import Agent
+from typing import Optional
+
+from agents import Agent, ModelSettings
+from ..api.config import openai_config, AgentModelConfig
+from .specialist_output import with_structured_output
 from ..tools.parts_tools import get_part_details_tool
 
 
-def create_sales_agent() -> Agent:
+def create_sales_agent(
+    model_config: Optional[AgentModelConfig] = None, structured: Optional[bool] = None
+) -> Agent:
     """
     Create and configure the Parts Sales Agent.
 
+    Args:
+        model_config: Optional model tier settings. Uses ``openai_config.sales_agent``
+            if not provided.
+        structured: Return a ``SpecialistAnswer`` instead of text. Uses
+            ``openai_config.structured_specialist_output`` if not provided.
+
     Returns:
         Agent: Configured sales agent with appropriate tools
     """
-    return Agent(
+    model_config = model_config or openai_config.sales_agent
+
+    agent = Agent(
         name="PartsSalesAgent",
         instructions="""
         You are a sales specialist for parts and product information.
@@ -30,10 +44,19 @@ def create_sales_agent() -> Agent:
         - Be knowledgeable and helpful about product details
         - When checking compatibility, use model numbers if provided
         - Provide shipping estimates when zip code is available
+        - Only request live pricing (include_pricing) when the customer asks about price
         - Explain technical details in customer-friendly language
         - Do NOT handle order status, refunds, or subscription queries
        
         Use the available tools to provide accurate product information.
         """,
         tools=[get_part_details_tool],
+        model=model_config.model,
+        model_settings=ModelSettings(
+            temperature=model_config.temperature,
+            max_tokens=model_config.max_output_tokens,
+        ),
     )
+    if structured is None:
+        structured = openai_config.structured_specialist_output
+    return with_structured_output(agent) if structured else agent
@@ -4,7 +4,11 @@ Parts Support Agent
 Handles customer support queries including order status, refunds, and subscription management.
 """
 
-from agents import Agent
+from typing import Optional
+
+from agents import Agent, ModelSettings
+from ..api.config import openai_config, AgentModelConfig
+from .specialist_output import with_structured_output
 from ..tools.order_tools import (
     parts_get_order_status_tool,
     parts_get_refund_status_tool,
@@ -16,14 +20,24 @@ from ..tools.subscription_tools import (
 )
 
 
-def create_support_agent() -> Agent:
+def create_support_agent(
+    model_config: Optional[AgentModelConfig] = None, structured: Optional[bool] = None
+) -> Agent:
     """
     Create and configure the Parts Support Agent.
 
+    Args:
+        model_config: Optional model tier settings. Uses ``openai_config.support_agent``
+            if not provided.
+        structured: Return a ``SpecialistAnswer`` instead of text. Uses
+            ``openai_config.structured_specialist_output`` if not provided.
+
     Returns:
         Agent: Configured support agent with appropriate tools
     """
-    return Agent(
+    model_config = model_config or openai_config.support_agent
+
+    agent = Agent(
         name="PartsSupportAgent",
         instructions="""
         You are a customer support specialist for parts orders and subscriptions.
@@ -39,6 +53,8 @@ def create_support_agent() -> Agent:
         - If you need additional information, ask clarifying questions
         - For order lookups, use the zip code when provided for accuracy
         - Clearly explain the status and next steps to customers
+        - When a query needs several independent lookups (e.g. order status AND refund status),
+          call all of those tools in the same turn so they run concurrently
         - Do NOT handle product compatibility or sales-related queries
        
         Use the available tools to gather information and assist customers effectively.
@@ -50,4 +66,14 @@ def create_support_agent() -> Agent:
             parts_subscription_cancel_tool,
             parts_subscription_update_tool,
         ],
+        model=model_config.model,
+        # Independent tool calls from one model turn are executed concurrently
+        model_settings=ModelSettings(
+            temperature=model_config.temperature,
+            max_tokens=model_config.max_output_tokens,
+            parallel_tool_calls=True,
+        ),
     )
+    if structured is None:
+        structured = openai_config.structured_specialist_output
+    return with_structured_output(agent) if structured else agent
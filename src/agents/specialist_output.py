@@ -0,0 +1,104 @@
+"""
+Specialist Structured Output
+
+Typed answer the specialist agents return when ``STRUCTURED_SPECIALIST_OUTPUT`` is
+enabled. The routing tools hand the answer to the orchestrator as an object rather
+than a stringified ``RunResult``, and the orchestrator stops on it instead of
+spending another model call re-reading and rephrasing the specialist's reply.
+Callers get the same object as the request's final output; ``str()`` of it is the
+customer-facing answer text, so code that only wants text keeps working.
+"""
+
+from typing import List, Optional
+
+from agents import (
+    Agent,
+    FunctionToolResult,
+    RunContextWrapper,
+    ToolsToFinalOutputResult,
+)
+from pydantic import BaseModel, Field
+
+# Appended to the specialists' instructions when structured output is enabled
+STRUCTURED_INSTRUCTIONS = """
+        Response format:
+        - Put the complete reply to the customer in `answer`
+        - Set `intent` to what the customer asked for (e.g. order_status, refund_status,
+          subscription_lookup, subscription_cancel, subscription_update, part_details,
+          compatibility, shipping)
+        - List the identifiers you used or resolved in `entities` (order number, zip code,
+          membership ID, phone number, part number, model number)
+        - Set `follow_up_needed` when you need more information from the customer
+        """
+
+
+class Entity(BaseModel):
+    """An identifier resolved from the query or the tool results."""
+
+    kind: str = Field(description="e.g. order_number, zip_code, part_number")
+    value: str
+
+
+class SpecialistAnswer(BaseModel):
+    """Structured reply of a specialist agent."""
+
+    intent: str
+    entities: List[Entity]
+    answer: str
+    follow_up_needed: bool
+
+    def __str__(self) -> str:
+        return self.answer
+
+    def entity(self, kind: str) -> Optional[str]:
+        """Value of the first entity of a kind, if any."""
+        return next((e.value for e in self.entities if e.kind == kind), None)
+
+    @classmethod
+    def merge(cls, answers: List["SpecialistAnswer"]) -> "SpecialistAnswer":
+        """
+        Combine the answers of several specialists called in one turn.
+
+        Args:
+            answers: Answers in call order (at least one)
+
+        Returns:
+            SpecialistAnswer: The single answer, or one joining their texts and
+                entities, needing a follow-up if any of them does
+        """
+        if len(answers) == 1:
+            return answers[0]
+        return cls(
+            intent=",".join(dict.fromkeys(a.intent for a in answers)),
+            entities=[e for a in answers for e in a.entities],
+            answer="\n\n".join(a.answer for a in answers),
+            follow_up_needed=any(a.follow_up_needed for a in answers),
+        )
+
+
+def with_structured_output(agent: Agent) -> Agent:
+    """Copy of a specialist agent that returns a ``SpecialistAnswer``."""
+    return agent.clone(
+        instructions=agent.instructions + STRUCTURED_INSTRUCTIONS,
+        output_type=SpecialistAnswer,
+    )
+
+
+def stop_at_specialist_answer(
+    context: RunContextWrapper, tool_results: List[FunctionToolResult]
+) -> ToolsToFinalOutputResult:
+    """
+    Orchestrator ``tool_use_behavior``: finish the run with the specialists'
+    structured answers instead of another model call. Plain-text tool results
+    go back to the model as usual.
+    """
+    answers = [
+        result.output
+        for result in tool_results
+        if isinstance(result.output, SpecialistAnswer)
+    ]
+    if not answers:
+        return ToolsToFinalOutputResult(is_final_output=False)
+    return ToolsToFinalOutputResult(
+        is_final_output=True, final_output=SpecialistAnswer.merge(answers)
+    )
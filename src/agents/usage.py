@@ -0,0 +1,253 @@
+"""
+Token Usage Accounting
+
+Aggregates model token usage per request across the orchestrator run and the
+nested specialist runs it starts, broken down per agent and per routing tool,
+with an optional cost estimate and a per-request token budget. The ledger also
+counts the tool calls of the request and which of them returned an error. Run
+hooks feed the ledger of the request in the current context; outside a
+``usage_scope`` they do nothing.
+"""
+
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from agents import Agent, RunContextWrapper, RunHooks, Usage
+from agents.models import get_default_model
+
+from ..api.config import openai_config
+
+# (input, output) USD per million tokens, keyed by model name
+Prices = Dict[str, Tuple[float, float]]
+
+
+class TokenBudgetExceeded(RuntimeError):
+    """Raised when a request has used up its token budget before a model call."""
+
+
+@dataclass
+class UsageTotals:
+    """Token counts (and estimated cost) of a set of model calls."""
+
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    cost: float = 0.0
+
+    def add(self, usage: Usage, cost: float = 0.0) -> None:
+        """Add one model response's usage."""
+        self.requests += usage.requests
+        self.input_tokens += usage.input_tokens
+        self.output_tokens += usage.output_tokens
+        self.total_tokens += usage.total_tokens
+        self.cost += cost
+
+    def merge(self, other: "UsageTotals") -> None:
+        """Add another set of totals."""
+        self.requests += other.requests
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.total_tokens += other.total_tokens
+        self.cost += other.cost
+
+
+def _model_name(agent: Agent) -> str:
+    model = agent.model
+    if isinstance(model, str):
+        return model
+    return getattr(model, "model", None) or get_default_model()
+
+
+class RequestUsage:
+    """Usage ledger of one request."""
+
+    def __init__(self, budget: Optional[int] = None, prices: Optional[Prices] = None):
+        """
+        Initialize an empty ledger.
+
+        Args:
+            budget: Maximum total tokens before further model calls are refused
+                (None or 0 for no limit)
+            prices: Optional per-model prices for the cost estimate
+        """
+        self.budget = budget or None
+        self.prices = prices or {}
+        self.total = UsageTotals()
+        self.by_agent: Dict[str, UsageTotals] = defaultdict(UsageTotals)
+        self.by_tool: Dict[str, UsageTotals] = defaultdict(UsageTotals)
+        # Tool name -> calls, and calls that returned an error response
+        self.tool_calls: Counter = Counter()
+        self.tool_errors: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def exceeded(self) -> bool:
+        """Whether the budget is used up."""
+        return self.budget is not None and self.total.total_tokens >= self.budget
+
+    def record(
+        self, agent: str, model: str, usage: Usage, tool: Optional[str] = None
+    ) -> None:
+        """
+        Record a model response.
+
+        Args:
+            agent: Name of the agent that made the call
+            model: Model name, used to price the call
+            usage: Usage reported for the call
+            tool: Routing tool the call ran under, if any
+        """
+        input_price, output_price = self.prices.get(model, (0.0, 0.0))
+        cost = (
+            usage.input_tokens * input_price + usage.output_tokens * output_price
+        ) / 1_000_000
+        with self._lock:
+            self.total.add(usage, cost)
+            self.by_agent[agent].add(usage, cost)
+            if tool is not None:
+                self.by_tool[tool].add(usage, cost)
+
+    def record_tool(self, tool: str, failed: bool = False) -> None:
+        """Record a finished tool call, including those of nested runs."""
+        with self._lock:
+            self.tool_calls[tool] += 1
+            if failed:
+                self.tool_errors[tool] += 1
+
+    def check(self) -> None:
+        """
+        Refuse further model calls once the budget is used up.
+
+        Raises:
+            TokenBudgetExceeded: If the budget is used up
+        """
+        if self.exceeded:
+            raise TokenBudgetExceeded(
+                f"Token budget of {self.budget} exhausted "
+                f"({self.total.total_tokens} tokens used)"
+            )
+
+    def summary(self) -> str:
+        """One-line summary of the request's usage."""
+        parts = [
+            f"{self.total.total_tokens} tokens "
+            f"({self.total.input_tokens} in / {self.total.output_tokens} out, "
+            f"{self.total.requests} model calls)"
+        ]
+        if self.total.cost:
+            parts.append(f"${self.total.cost:.4f}")
+        parts += [f"{name}: {t.total_tokens}" for name, t in self.by_agent.items()]
+        return " | ".join(parts)
+
+
+current_usage: ContextVar[Optional[RequestUsage]] = ContextVar(
+    "current_usage", default=None
+)
+_current_tool: ContextVar[Optional[str]] = ContextVar("current_tool", default=None)
+
+
+@contextmanager
+def usage_scope(
+    budget: Optional[int] = None, prices: Optional[Prices] = None
+) -> Iterator[RequestUsage]:
+    """
+    Account the model calls made inside the block to a new request ledger.
+
+    Args:
+        budget: Token budget (TOKEN_BUDGET_PER_REQUEST if None; 0 for no limit)
+        prices: Per-model prices (MODEL_PRICES if None)
+
+    Yields:
+        RequestUsage: The request's ledger
+    """
+    ledger = RequestUsage(
+        openai_config.token_budget if budget is None else budget,
+        openai_config.model_prices if prices is None else prices,
+    )
+    token = current_usage.set(ledger)
+    try:
+        yield ledger
+    finally:
+        current_usage.reset(token)
+
+
+@contextmanager
+def tool_attribution(tool: str) -> Iterator[None]:
+    """Attribute model calls made inside the block (e.g. a nested run) to a tool."""
+    token = _current_tool.set(tool)
+    try:
+        yield
+    finally:
+        _current_tool.reset(token)
+
+
+class UsageHooks(RunHooks):
+    """Run hooks feeding the current request's ledger and enforcing its budget."""
+
+    async def on_llm_start(
+        self,
+        context: RunContextWrapper,
+        agent: Agent,
+        system_prompt: Optional[str],
+        input_items: Any,
+    ) -> None:
+        ledger = current_usage.get()
+        if ledger is not None:
+            ledger.check()
+
+    async def on_llm_end(
+        self, context: RunContextWrapper, agent: Agent, response: Any
+    ) -> None:
+        ledger = current_usage.get()
+        if ledger is not None:
+            ledger.record(
+                agent.name, _model_name(agent), response.usage, _current_tool.get()
+            )
+
+    async def on_tool_end(
+        self, context: RunContextWrapper, agent: Agent, tool: Any, result: Any
+    ) -> None:
+        ledger = current_usage.get()
+        if ledger is not None:
+            # Every tool error is serialized with an "error" field (APIResponse)
+            failed = isinstance(result, str) and '"error":' in result
+            ledger.record_tool(tool.name, failed)
+
+
+@dataclass
+class UsageMetrics:
+    """Usage totals across requests."""
+
+    requests: int = 0
+    budget_exceeded: int = 0
+    total: UsageTotals = field(default_factory=UsageTotals)
+    by_agent: Dict[str, UsageTotals] = field(
+        default_factory=lambda: defaultdict(UsageTotals)
+    )
+    by_tool: Dict[str, UsageTotals] = field(
+        default_factory=lambda: defaultdict(UsageTotals)
+    )
+
+    def record(self, ledger: RequestUsage, budget_exceeded: bool = False) -> None:
+        """Add a finished request's ledger."""
+        self.requests += 1
+        self.budget_exceeded += budget_exceeded
+        self.total.merge(ledger.total)
+        for name, totals in ledger.by_agent.items():
+            self.by_agent[name].merge(totals)
+        for name, totals in ledger.by_tool.items():
+            self.by_tool[name].merge(totals)
+
+    @property
+    def tokens_per_request(self) -> float:
+        """Mean total tokens per request."""
+        return self.total.total_tokens / self.requests if self.requests else 0.0
+
+
+# Shared by every run so nested specialist runs report into the same ledger
+usage_hooks = UsageHooks()
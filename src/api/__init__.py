@@ -1,13 +1,59 @@
 """API module for handling external API interactions."""
 
-from .config import api_config, openai_config, APIConfig, OpenAIConfig
+from .config import (
+    api_config,
+    openai_config,
+    APIConfig,
+    OpenAIConfig,
+    AgentModelConfig,
+)
 from .client import api_client, APIClient
+from .models import (
+    APIResponse,
+    OrderStatusResponse,
+    RefundStatusResponse,
+    PartDetailsResponse,
+    SubscriptionLookupResponse,
+    SubscriptionUpdateResponse,
+)
+from .catalog import part_catalog, PartCatalog
+from .prefetch import RequestPrefetcher, PrefetchMetrics, extract_prefetch_calls
+from .hedging import RequestHedger, HedgeMetrics
+from .endpoint_pool import EndpointPool, EndpointStats
+from .idempotency import (
+    IdempotencyCache,
+    DedupeMetrics,
+    idempotency_key,
+    mutation_dedupe,
+    session_scope,
+)
 
 __all__ = [
     "api_config",
     "openai_config",
     "APIConfig",
     "OpenAIConfig",
+    "AgentModelConfig",
     "api_client",
     "APIClient",
+    "APIResponse",
+    "OrderStatusResponse",
+    "RefundStatusResponse",
+    "PartDetailsResponse",
+    "SubscriptionLookupResponse",
+    "SubscriptionUpdateResponse",
+    "part_catalog",
+    "PartCatalog",
+    "RequestPrefetcher",
+    "PrefetchMetrics",
+    "extract_prefetch_calls",
+    "RequestHedger",
+    "HedgeMetrics",
+    "EndpointPool",
+    "EndpointStats",
+    "IdempotencyCache",
+    "DedupeMetrics",
+    "idempotency_key",
+    "mutation_dedupe",
+    "session_scope",
 ]
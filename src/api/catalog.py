@@ -0,0 +1,330 @@
+"""
+Part Catalog Module
+
+Local SQLite store of slowly changing part data (titles, static details and
+model compatibility) so part lookups can be answered without the network.
+Live pricing and zip-based shipping always come from the Parts API.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from .config import api_config
+
+# Fields that change too often to serve from the catalog
+LIVE_FIELDS = ("pricing", "shipping")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parts (
+    part_number TEXT PRIMARY KEY,
+    details TEXT NOT NULL,
+    models_complete INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS part_models (
+    part_number TEXT NOT NULL,
+    model_number TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (part_number, model_number)
+);
+CREATE INDEX IF NOT EXISTS idx_part_models_model ON part_models (model_number);
+"""
+
+
+def _model_numbers(models: Any) -> List[str]:
+    """Normalize the ``models`` field of a lookup response to a list of numbers."""
+    if not models:
+        return []
+    if isinstance(models, dict):
+        models = [models]
+    numbers = []
+    for model in models:
+        number = model.get("number") if isinstance(model, dict) else model
+        if number:
+            numbers.append(str(number))
+    return numbers
+
+
+class PartCatalog:
+    """SQLite-backed catalog of part details and model compatibility."""
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        max_age_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open (and create if needed) the catalog database.
+
+        Args:
+            path: SQLite database path, or ':memory:'
+            max_age_seconds: Rows older than this are treated as stale. Uses
+                ``api_config.catalog_max_age`` if not provided.
+            clock: Time source, overridable for tests
+        """
+        self.max_age_seconds = (
+            api_config.catalog_max_age if max_age_seconds is None else max_age_seconds
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def upsert(
+        self,
+        part_number: str,
+        details: Dict[str, Any],
+        models: Iterable[str] = (),
+        models_complete: bool = False,
+        updated_at: Optional[float] = None,
+    ) -> None:
+        """
+        Insert or refresh a part and its compatible models.
+
+        Args:
+            part_number: Part number
+            details: Static part details (live fields are dropped)
+            models: Model numbers the part is known to fit
+            models_complete: True if ``models`` is the part's full model list
+            updated_at: Row timestamp (defaults to now)
+        """
+        self.bulk_load(
+            [
+                {
+                    "part_number": part_number,
+                    "details": details,
+                    "models": list(models),
+                    "models_complete": models_complete,
+                }
+            ],
+            updated_at=updated_at,
+        )
+
+    def bulk_load(
+        self, records: Iterable[Dict[str, Any]], updated_at: Optional[float] = None
+    ) -> int:
+        """
+        Load many parts in a single transaction.
+
+        Each record has ``part_number``, ``details``, ``models`` and an optional
+        ``models_complete`` flag (defaults to True for exports).
+
+        Args:
+            records: Part records
+            updated_at: Row timestamp (defaults to now)
+
+        Returns:
+            int: Number of parts loaded
+        """
+        now = self._clock() if updated_at is None else updated_at
+        count = 0
+        with self._lock, self._conn:
+            for record in records:
+                part_number = str(record["part_number"])
+                details = {
+                    key: value
+                    for key, value in record.get("details", {}).items()
+                    if key not in LIVE_FIELDS and key != "models"
+                }
+                complete = bool(record.get("models_complete", True))
+                self._conn.execute(
+                    "INSERT INTO parts (part_number, details, models_complete, updated_at) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT(part_number) DO UPDATE SET "
+                    "details = excluded.details, "
+                    # A partial (model-filtered) refresh doesn't renew a full model list
+                    "updated_at = CASE WHEN excluded.models_complete "
+                    "OR NOT parts.models_complete "
+                    "THEN excluded.updated_at ELSE parts.updated_at END, "
+                    "models_complete = MAX(parts.models_complete, excluded.models_complete)",
+                    (part_number, json.dumps(details), int(complete), now),
+                )
+                if complete:
+                    self._conn.execute(
+                        "DELETE FROM part_models WHERE part_number = ?", (part_number,)
+                    )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO part_models "
+                    "(part_number, model_number, updated_at) VALUES (?, ?, ?)",
+                    [(part_number, str(m), now) for m in record.get("models", [])],
+                )
+                count += 1
+        return count
+
+    def load_export(self, path: Union[str, Path]) -> int:
+        """
+        Bulk-load a catalog export (JSON array or JSON lines of part records).
+
+        Args:
+            path: Export file path
+
+        Returns:
+            int: Number of parts loaded
+        """
+        text = Path(path).read_text()
+        if text.lstrip().startswith("["):
+            records = json.loads(text)
+        else:
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+        return self.bulk_load(records)
+
+    def record_lookup(
+        self,
+        part_number: str,
+        response: Dict[str, Any],
+        model_number: Optional[str] = None,
+    ) -> bool:
+        """
+        Fill the catalog from a live ``/parts/lookup`` response.
+
+        Args:
+            part_number: Part number that was looked up
+            response: API response dictionary
+            model_number: Model filter used for the lookup, if any
+
+        Returns:
+            bool: True if the response contained part data and was stored
+        """
+        if response.get("statusCode") != 200:
+            return False
+        message = (response.get("body") or {}).get("message")
+        if not isinstance(message, dict):
+            return False
+
+        models = _model_numbers(message.get("models"))
+        if model_number and model_number not in models:
+            # A filtered lookup that returns no match says nothing about other models
+            models = []
+        self.upsert(
+            part_number,
+            message,
+            models,
+            models_complete=model_number is None,
+        )
+        return True
+
+    def is_fresh(self, updated_at: float) -> bool:
+        """Check whether a row timestamp is within the freshness window."""
+        return self._clock() - updated_at < self.max_age_seconds
+
+    def get(self, part_number: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a part row.
+
+        Args:
+            part_number: Part number
+
+        Returns:
+            dict or None: ``details``, ``models_complete``, ``updated_at`` and ``fresh``
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT details, models_complete, updated_at FROM parts "
+                "WHERE part_number = ?",
+                (part_number,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "details": json.loads(row[0]),
+            "models_complete": bool(row[1]),
+            "updated_at": row[2],
+            "fresh": self.is_fresh(row[2]),
+        }
+
+    def is_compatible(self, part_number: str, model_number: str) -> Optional[bool]:
+        """
+        Check model compatibility from fresh catalog rows.
+
+        Args:
+            part_number: Part number
+            model_number: Appliance model number
+
+        Returns:
+            bool or None: True/False if known, None if the catalog can't tell
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_at FROM part_models "
+                "WHERE part_number = ? AND model_number = ?",
+                (part_number, model_number),
+            ).fetchone()
+        if row is not None and self.is_fresh(row[0]):
+            return True
+
+        part = self.get(part_number)
+        if part is not None and part["fresh"] and part["models_complete"]:
+            return False
+        return None
+
+    def parts_for_model(self, model_number: str) -> List[str]:
+        """
+        List fresh parts known to fit a model.
+
+        Args:
+            model_number: Appliance model number
+
+        Returns:
+            list: Part numbers
+        """
+        cutoff = self._clock() - self.max_age_seconds
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT part_number FROM part_models "
+                "WHERE model_number = ? AND updated_at > ?",
+                (model_number, cutoff),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def lookup(
+        self, part_number: str, model_number: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Answer a static part lookup in the ``/parts/lookup`` response shape.
+
+        Args:
+            part_number: Part number
+            model_number: Optional model to check compatibility for
+
+        Returns:
+            dict or None: Response built from the catalog, or None on a miss
+        """
+        part = self.get(part_number)
+        if part is None or not part["fresh"]:
+            return None
+
+        message = dict(part["details"])
+        if model_number:
+            compatible = self.is_compatible(part_number, model_number)
+            if compatible is None:
+                return None
+            message["models"] = {"number": model_number} if compatible else {}
+            message["compatible"] = compatible
+        else:
+            if not part["models_complete"]:
+                return None
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT model_number FROM part_models WHERE part_number = ?",
+                    (part_number,),
+                ).fetchall()
+            message["models"] = [{"number": row[0]} for row in rows]
+
+        return {
+            "statusCode": 200,
+            "body": {"message": message},
+            "source": "catalog",
+            "catalogUpdatedAt": part["updated_at"],
+        }
+
+
+# Global catalog instance (only when a catalog path is configured)
+part_catalog = PartCatalog(api_config.catalog_path) if api_config.catalog_path else None
@@ -4,30 +4,137 @@ API Client Module
 Handles HTTP requests to the Parts API with error handling and retry logic.
 """
 
+import asyncio
+import functools
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, List, Optional, Tuple
 from .config import api_config
+from .endpoint_config import EndpointConfig, EndpointConfigWatcher
+from .endpoint_pool import EndpointPool
+from .hedging import RequestHedger
+from .models import decode_json
+from .prefetch import get_prefetched
+from ..utils.recording import current_recorder
 
 
 class APIClient:
     """HTTP client for Parts API interactions."""
 
-    def __init__(self, config=None):
+    def __init__(
+        self,
+        config=None,
+        hedger: Optional[RequestHedger] = None,
+        endpoint_pool: Optional[EndpointPool] = None,
+    ):
         """
         Initialize the API client.
 
         Args:
             config: Optional APIConfig instance. Uses global config if not provided.
+            hedger: Optional RequestHedger for idempotent endpoints. Built from the
+                config when hedging is enabled there.
+            endpoint_pool: Optional pool of base URLs to route between. Built from
+                the config when PARTS_API_BASE_URLS lists more than one URL. Not
+                used while a base URL is set explicitly, either in the endpoint
+                config file or by assigning ``config.base_url``.
         """
         self.config = config or api_config
+        if hedger is None and self.config.hedging_enabled:
+            hedger = RequestHedger.from_config(self.config)
+        self.hedger = hedger
+        if endpoint_pool is None and len(self.config.base_url_pool) > 1:
+            endpoint_pool = EndpointPool.from_config(self.config)
+        self.endpoint_pool = endpoint_pool
 
-    def post(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        self.session = requests.Session()
+        # Mount prefix -> (pool size, adapter)
+        self._pools: Dict[str, Tuple[int, HTTPAdapter]] = {}
+        self._pools_lock = threading.Lock()
+        path = self.config.endpoint_config_path
+        self.apply_endpoint_config(
+            EndpointConfig.load(path, self.config)
+            if path
+            else EndpointConfig.from_api_config(self.config)
+        )
+        self.config_watcher: Optional[EndpointConfigWatcher] = None
+        if path and self.config.endpoint_config_interval > 0:
+            self.config_watcher = EndpointConfigWatcher(
+                path,
+                self.apply_endpoint_config,
+                self.config,
+                self.config.endpoint_config_interval,
+            ).start()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL from the endpoint config file, else from APIConfig."""
+        return self.endpoint_config.base_url or self.config.base_url
+
+    @property
+    def base_urls(self) -> List[str]:
+        """Every base URL requests may go to."""
+        return self._base_urls(self.endpoint_config)
+
+    def _active_pool(self, endpoint_config: EndpointConfig) -> Optional[EndpointPool]:
+        # A base URL in the endpoint config file or set on APIConfig (e.g. a
+        # local stub) overrides the pool
+        if endpoint_config.base_url or self.config.base_url_overridden:
+            return None
+        return self.endpoint_pool
+
+    def _base_urls(self, endpoint_config: EndpointConfig) -> List[str]:
+        pool = self._active_pool(endpoint_config)
+        if pool is not None:
+            return pool.urls
+        return [endpoint_config.base_url or self.config.base_url]
+
+    def apply_endpoint_config(self, endpoint_config: EndpointConfig) -> None:
+        """
+        Swap in new per-endpoint settings.
+
+        Requests already in flight keep the snapshot they started with. Connection
+        pools whose size is unchanged are kept; a resized pool is replaced for new
+        requests while the old one drains without being closed.
+
+        Args:
+            endpoint_config: New settings snapshot
+        """
+        sizes = {
+            "http://": endpoint_config.defaults.pool_size,
+            "https://": endpoint_config.defaults.pool_size,
+        }
+        for path, settings in endpoint_config.endpoints.items():
+            if settings.pool_size != endpoint_config.defaults.pool_size:
+                for base_url in self._base_urls(endpoint_config):
+                    sizes[f"{base_url}{path}"] = settings.pool_size
+
+        with self._pools_lock:
+            for prefix in set(self._pools) - set(sizes):
+                del self.session.adapters[prefix]
+                del self._pools[prefix]
+            for prefix, size in sizes.items():
+                if prefix not in self._pools or self._pools[prefix][0] != size:
+                    adapter = HTTPAdapter(pool_maxsize=size)
+                    self.session.mount(prefix, adapter)
+                    self._pools[prefix] = (size, adapter)
+            self.endpoint_config = endpoint_config
+
+    def post(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
         """
         Make a POST request to the API.
 
         Args:
             endpoint: API endpoint path (e.g., '/parts/status')
             payload: Request payload dictionary
+            headers: Optional extra headers (e.g. an idempotency key)
 
         Returns:
             dict: API response as dictionary
@@ -35,24 +142,102 @@ class APIClient:
         Raises:
             APIError: If the request fails
         """
-        url = self.config.get_endpoint(endpoint)
+        recorder = current_recorder.get()
+        if recorder is None:
+            return self._post(endpoint, payload, headers)
+        start = time.perf_counter()
+        response = self._post(endpoint, payload, headers)
+        recorder.record_api_call(
+            endpoint, payload, response, time.perf_counter() - start
+        )
+        return response
+
+    def _post(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Serve a POST from the prefetch cache or send it (hedged if configured)."""
+        prefetched = get_prefetched(endpoint, payload)
+        if prefetched is not None:
+            response = prefetched.result()
+            if "error" not in response:
+                return response
+
+        # One snapshot per request, so a reload never mixes settings mid-request
+        endpoint_config = self.endpoint_config
+        send = functools.partial(
+            self._send_with_retries, endpoint, payload, headers, endpoint_config
+        )
+        if self.hedger is not None and self.hedger.applies(endpoint):
+            return self.hedger.call(endpoint, send)
+        return send()
+
+    def _send_with_retries(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]],
+        endpoint_config: EndpointConfig,
+    ) -> Dict[str, Any]:
+        """
+        Retry connection errors, timeouts and 5xx responses per the endpoint settings.
+
+        With an endpoint pool, every attempt picks its base URL afresh (so a retry
+        can go to another region) and reports its outcome back to the pool.
+        """
+        settings = endpoint_config.for_endpoint(endpoint)
+        pool = self._active_pool(endpoint_config)
+        base_url = None
+        for attempt in range(settings.retries + 1):
+            if attempt:
+                time.sleep(min(0.1 * 2 ** (attempt - 1), 1.0))
+            base_url = (
+                pool.select(avoid=base_url)
+                if pool is not None
+                else endpoint_config.base_url or self.config.base_url
+            )
+            start = time.perf_counter()
+            response = self._send(
+                f"{base_url}{endpoint}", payload, headers, settings.timeout
+            )
+            retryable = _is_retryable(response)
+            if pool is not None:
+                pool.record(base_url, time.perf_counter() - start, not retryable)
+            if not retryable:
+                break
+        return response
 
+    def _send(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout=None,
+    ) -> Dict[str, Any]:
+        """Make a single POST attempt, converting failures to error dictionaries."""
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json=payload,
-                headers=self.config.headers,
-                timeout=self.config.timeout,
+                headers=(
+                    {**self.config.headers, **headers}
+                    if headers
+                    else self.config.headers
+                ),
+                timeout=timeout or self.config.timeout,
             )
 
             # Handle successful responses
             if response.status_code in [200, 201, 404]:
-                return response.json()
+                return decode_json(response.content)
 
             # Handle unexpected status codes
             return {
                 "error": f"Unexpected status code: {response.status_code}",
                 "details": response.text,
+                "statusCode": response.status_code,
             }
 
         except requests.exceptions.Timeout:
@@ -70,6 +255,61 @@ class APIClient:
         except Exception as e:
             return {"error": "Unexpected error", "details": str(e)}
 
+    async def apost(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a POST request to the API without blocking the event loop.
+
+        The blocking request runs on the default executor, so independent calls
+        awaited together (e.g. with ``asyncio.gather``) overlap their latency.
+
+        Args:
+            endpoint: API endpoint path (e.g., '/parts/status')
+            payload: Request payload dictionary
+            headers: Optional extra headers (e.g. an idempotency key)
+
+        Returns:
+            dict: API response as dictionary
+        """
+        recorder = current_recorder.get()
+        start = time.perf_counter()
+        response = await self._apost(endpoint, payload, headers)
+        if recorder is not None:
+            recorder.record_api_call(
+                endpoint, payload, response, time.perf_counter() - start
+            )
+        return response
+
+    async def _apost(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        prefetched = get_prefetched(endpoint, payload)
+        if prefetched is not None:
+            # Shield so a cancelled caller doesn't cancel the shared speculative call
+            response = await asyncio.shield(asyncio.wrap_future(prefetched))
+            if "error" not in response:
+                return response
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self._post, endpoint, payload, headers)
+        )
+
+
+def _is_retryable(response: Dict[str, Any]) -> bool:
+    """Check whether a failed attempt is worth retrying."""
+    error = response.get("error")
+    if error in ("Request timeout", "Connection error"):
+        return True
+    return error is not None and response.get("statusCode", 0) >= 500
+
 
 # Global client instance
 api_client = APIClient()
@@ -4,8 +4,10 @@ API Configuration Module
 Manages API endpoints, authentication, and configuration settings.
 """
 
+import json
 import os
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,13 +19,78 @@ class APIConfig:
 
     def __init__(self):
         """Initialize API configuration from environment variables."""
-        self.base_url = os.getenv(
+        self._base_url = os.getenv(
             "PARTS_API_BASE_URL",
             "https://75krs3hfo2.execute-api.us-east-1.amazonaws.com/dev",
         )
+        # Set when base_url is assigned after construction (e.g. to point at a
+        # local stub or a replay server); an explicit base URL disables the pool
+        self.base_url_overridden = False
+        # Optional pool of base URLs (e.g. one stage per region); with more than
+        # one, each request goes to the fastest healthy one
+        self.base_url_pool = [
+            url.strip()
+            for url in os.getenv("PARTS_API_BASE_URLS", "").split(",")
+            if url.strip()
+        ]
+        self.pool_error_threshold = float(os.getenv("POOL_ERROR_THRESHOLD", "0.5"))
+        self.pool_outlier_factor = float(os.getenv("POOL_OUTLIER_FACTOR", "3"))
+        self.pool_ejection_seconds = float(os.getenv("POOL_EJECTION_SECONDS", "30"))
         self.api_key = os.getenv("PARTS_API_KEY", "")
         self.timeout = int(os.getenv("TIMEOUT_SECONDS", "30"))
         self.max_retries = int(os.getenv("MAX_RETRIES", "3"))
+        # Per-endpoint timeouts/retries/pool sizes (JSON), watched for changes
+        self.endpoint_config_path = os.getenv("API_ENDPOINT_CONFIG", "")
+        self.endpoint_config_interval = float(
+            os.getenv("API_ENDPOINT_CONFIG_INTERVAL_SECONDS", "2")
+        )
+        self.prefetch_enabled = os.getenv("PREFETCH_ENABLED", "false").lower() == "true"
+        self.prefetch_max_calls = int(os.getenv("PREFETCH_MAX_CALLS", "3"))
+        # How long part data (details, compatibility, pricing) is considered fresh
+        self.part_data_ttl = int(os.getenv("PART_DATA_TTL_SECONDS", "300"))
+        self.answer_cache_enabled = (
+            os.getenv("ANSWER_CACHE_ENABLED", "false").lower() == "true"
+        )
+        self.answer_cache_max_entries = int(
+            os.getenv("ANSWER_CACHE_MAX_ENTRIES", "1024")
+        )
+        # Local part catalog (SQLite); empty path disables it
+        self.catalog_path = os.getenv("PART_CATALOG_PATH", "")
+        self.catalog_max_age = int(os.getenv("PART_CATALOG_MAX_AGE_SECONDS", "86400"))
+        # Hedged requests for idempotent endpoints
+        self.hedging_enabled = os.getenv("HEDGING_ENABLED", "false").lower() == "true"
+        self.hedge_endpoints = [
+            path.strip()
+            for path in os.getenv(
+                "HEDGE_ENDPOINTS", "/parts/status,/parts/lookup"
+            ).split(",")
+            if path.strip()
+        ]
+        self.hedge_percentile = float(os.getenv("HEDGE_PERCENTILE", "95"))
+        self.hedge_budget_percent = float(os.getenv("HEDGE_BUDGET_PERCENT", "10"))
+        self.hedge_min_samples = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+        # Duplicate subscription mutations within this window reuse the first result
+        self.idempotency_window = int(os.getenv("IDEMPOTENCY_WINDOW_SECONDS", "60"))
+        # Startup warm-up: pooled connections opened per endpoint, DNS cache TTL
+        self.warmup_connections = int(os.getenv("WARMUP_CONNECTIONS", "4"))
+        self.warmup_dns_ttl = int(os.getenv("WARMUP_DNS_TTL_SECONDS", "300"))
+        # Priority admission control in front of the orchestrator
+        self.admission_enabled = (
+            os.getenv("ADMISSION_ENABLED", "false").lower() == "true"
+        )
+        self.admission_initial_limit = int(os.getenv("ADMISSION_INITIAL_LIMIT", "8"))
+        self.admission_max_limit = int(os.getenv("ADMISSION_MAX_LIMIT", "64"))
+        self.admission_max_queue = int(os.getenv("ADMISSION_MAX_QUEUE", "100"))
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the Parts API (PARTS_API_BASE_URL unless overridden)."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self._base_url = value
+        self.base_url_overridden = True
 
     @property
     def headers(self) -> dict:
@@ -47,6 +114,56 @@ class APIConfig:
         return f"{self.base_url}{path}"
 
 
+def _optional_float(name: str) -> Optional[float]:
+    """Read an optional float environment variable."""
+    value = os.getenv(name, "")
+    return float(value) if value else None
+
+
+def _optional_int(name: str) -> Optional[int]:
+    """Read an optional integer environment variable."""
+    value = os.getenv(name, "")
+    return int(value) if value else None
+
+
+@dataclass
+class AgentModelConfig:
+    """Model tier settings for a single agent (None defers to the SDK default)."""
+
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+    max_output_tokens: Optional[int] = None
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "AgentModelConfig":
+        """
+        Load settings from ``<PREFIX>_MODEL``, ``<PREFIX>_TEMPERATURE`` and
+        ``<PREFIX>_MAX_OUTPUT_TOKENS``.
+
+        Args:
+            prefix: Environment variable prefix (e.g. 'ORCHESTRATOR')
+
+        Returns:
+            AgentModelConfig: Settings for the agent
+        """
+        return cls(
+            model=os.getenv(f"{prefix}_MODEL") or None,
+            temperature=_optional_float(f"{prefix}_TEMPERATURE"),
+            max_output_tokens=_optional_int(f"{prefix}_MAX_OUTPUT_TOKENS"),
+        )
+
+
+def _model_prices() -> Dict[str, Tuple[float, float]]:
+    """Read ``MODEL_PRICES``: model name -> [input, output] USD per million tokens."""
+    value = os.getenv("MODEL_PRICES", "")
+    if not value:
+        return {}
+    return {
+        model: (float(prices[0]), float(prices[1]))
+        for model, prices in json.loads(value).items()
+    }
+
+
 class OpenAIConfig:
     """Configuration for OpenAI API."""
 
@@ -58,6 +175,21 @@ class OpenAIConfig:
         if self.api_key:
             os.environ["OPENAI_API_KEY"] = self.api_key
 
+        # Per-agent model tiers (e.g. a small fast model for routing)
+        self.orchestrator = AgentModelConfig.from_env("ORCHESTRATOR")
+        self.support_agent = AgentModelConfig.from_env("SUPPORT_AGENT")
+        self.sales_agent = AgentModelConfig.from_env("SALES_AGENT")
+
+        # Token budget per request across nested agent runs (0 = no limit)
+        self.token_budget = int(os.getenv("TOKEN_BUDGET_PER_REQUEST", "0"))
+        self.model_prices = _model_prices()
+
+        # Specialists return a typed SpecialistAnswer that the orchestrator passes
+        # through, instead of a stringified run result it summarizes again
+        self.structured_specialist_output = (
+            os.getenv("STRUCTURED_SPECIALIST_OUTPUT", "false").lower() == "true"
+        )
+
     @property
     def is_configured(self) -> bool:
         """Check if OpenAI API key is configured."""
@@ -0,0 +1,239 @@
+"""
+Endpoint Configuration Module
+
+Per-endpoint connection settings (connect/read timeouts, retries, pool size)
+loaded from a JSON file that is watched and hot-reloaded. Each reload builds a
+new immutable snapshot that is swapped in with a single assignment, so requests
+already in flight keep the settings they started with.
+
+Example file::
+
+    {
+      "base_url": "https://api.example.com/dev",
+      "defaults": {"connect_timeout": 3.05, "read_timeout": 30, "pool_size": 10},
+      "endpoints": {
+        "/parts/lookup": {"read_timeout": 5, "retries": 2},
+        "/parts/status": {"read_timeout": 8, "retries": 1, "pool_size": 20}
+      }
+    }
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field, fields, replace
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class EndpointSettings:
+    """Connection settings for one endpoint."""
+
+    connect_timeout: float = 3.05
+    read_timeout: float = 30.0
+    # Extra attempts after a connection error, timeout or 5xx response
+    retries: int = 0
+    # Pooled connections kept for the endpoint
+    pool_size: int = 10
+
+    @property
+    def timeout(self) -> tuple:
+        """``(connect, read)`` timeout tuple for ``requests``."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def merged(self, overrides: Mapping[str, Any]) -> "EndpointSettings":
+        """
+        Return a copy with some settings overridden.
+
+        Args:
+            overrides: Setting names to values
+
+        Returns:
+            EndpointSettings: New settings
+
+        Raises:
+            ValueError: If a setting is unknown or invalid
+        """
+        if not isinstance(overrides, Mapping):
+            raise ValueError(f"Endpoint settings must be an object, got {overrides!r}")
+        types = {f.name: f.type for f in fields(self)}
+        unknown = set(overrides) - set(types)
+        if unknown:
+            raise ValueError(f"Unknown endpoint settings: {sorted(unknown)}")
+        for name, value in overrides.items():
+            # bool is an int subclass; "2" and 1.5 would break range(retries + 1)
+            if types[name] is int:
+                valid, kind = isinstance(value, int), "an integer"
+            else:
+                valid, kind = isinstance(value, (int, float)), "a number"
+            if isinstance(value, bool) or not valid:
+                raise ValueError(f"{name} must be {kind}, got {value!r}")
+        settings = replace(self, **overrides)
+        if settings.connect_timeout <= 0 or settings.read_timeout <= 0:
+            raise ValueError("Timeouts must be positive")
+        if settings.retries < 0 or settings.pool_size < 1:
+            raise ValueError("retries must be >= 0 and pool_size >= 1")
+        return settings
+
+
+@dataclass(frozen=True)
+class EndpointConfig:
+    """Immutable snapshot of the connection settings for every endpoint."""
+
+    defaults: EndpointSettings = EndpointSettings()
+    endpoints: Mapping[str, EndpointSettings] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    # Overrides APIConfig.base_url when set
+    base_url: Optional[str] = None
+
+    def for_endpoint(self, path: str) -> EndpointSettings:
+        """Get the settings for an endpoint path (defaults if not listed)."""
+        return self.endpoints.get(path, self.defaults)
+
+    @classmethod
+    def from_api_config(cls, config) -> "EndpointConfig":
+        """Build a snapshot that applies the APIConfig timeout to every endpoint."""
+        return cls(defaults=EndpointSettings(read_timeout=float(config.timeout)))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], config=None) -> "EndpointConfig":
+        """
+        Build a snapshot from parsed file contents.
+
+        Args:
+            data: Parsed JSON with optional "base_url", "defaults" and "endpoints"
+            config: Optional APIConfig supplying fallback defaults
+
+        Returns:
+            EndpointConfig: Validated snapshot
+
+        Raises:
+            ValueError: If the contents are invalid
+        """
+        base = cls.from_api_config(config).defaults if config else EndpointSettings()
+        defaults = base.merged(data.get("defaults", {}))
+        listed = data.get("endpoints", {})
+        if not isinstance(listed, Mapping):
+            raise ValueError("endpoints must be an object of path to settings")
+        endpoints = {
+            path: defaults.merged(overrides) for path, overrides in listed.items()
+        }
+        base_url = data.get("base_url")
+        if base_url is not None and not isinstance(base_url, str):
+            raise ValueError(f"base_url must be a string, got {base_url!r}")
+        return cls(defaults, MappingProxyType(endpoints), base_url)
+
+    @classmethod
+    def load(cls, path: str, config=None) -> "EndpointConfig":
+        """
+        Load and validate a snapshot from a JSON file.
+
+        Args:
+            path: Path to the config file
+            config: Optional APIConfig supplying fallback defaults
+
+        Returns:
+            EndpointConfig: Validated snapshot
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If the contents are invalid
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("Endpoint config must be a JSON object")
+        try:
+            return cls.from_dict(data, config)
+        except TypeError as e:
+            raise ValueError(str(e)) from e
+
+
+class EndpointConfigWatcher:
+    """Polls a config file and hands each valid new snapshot to a callback."""
+
+    def __init__(
+        self,
+        path: str,
+        on_change: Callable[[EndpointConfig], None],
+        config=None,
+        interval: float = 2.0,
+    ):
+        """
+        Initialize the watcher (polling starts with ``start``).
+
+        Args:
+            path: Path to the JSON config file
+            on_change: Called with each successfully loaded snapshot
+            config: Optional APIConfig supplying fallback defaults
+            interval: Seconds between modification checks
+        """
+        self.path = path
+        self.on_change = on_change
+        self.config = config
+        self.interval = interval
+        self.reloads = 0
+        self.last_error: Optional[str] = None
+        self._mtime = self._stat()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "EndpointConfigWatcher":
+        """Start polling on a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="endpoint-config-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop polling."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def check(self) -> bool:
+        """
+        Reload the file if it changed since the last check.
+
+        An invalid file is reported in ``last_error`` and the current snapshot
+        stays in place.
+
+        Returns:
+            bool: True if a new snapshot was applied
+        """
+        mtime = self._stat()
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        try:
+            snapshot = EndpointConfig.load(self.path, self.config)
+        except (OSError, ValueError) as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            logger.warning("Keeping previous endpoint config: %s", self.last_error)
+            return False
+        self.last_error = None
+        self.on_change(snapshot)
+        self.reloads += 1
+        return True
+
+    def _stat(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                # Keep watching: a failing callback must not end hot reload
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.exception("Endpoint config check failed")
@@ -0,0 +1,215 @@
+"""
+Endpoint Pool Module
+
+Spreads Parts API traffic over several base URLs (e.g. API Gateway stages in
+different regions). Each URL's latency and error rate are tracked as EWMAs;
+every attempt goes to the healthy URL with the lowest expected latency, and
+URLs that keep failing or are far slower than the rest are ejected for a while.
+URLs that haven't been tried for a while get an occasional probe, so a region
+that recovers is noticed.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class EndpointStats:
+    """Health of one base URL."""
+
+    url: str
+    # EWMA of successful attempt latency in seconds (None until measured)
+    latency: Optional[float] = None
+    # EWMA of failed attempts (0 = all succeed, 1 = all fail)
+    error_rate: float = 0.0
+    samples: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    ejections: int = 0
+    last_selected: float = 0.0
+
+    @property
+    def score(self) -> float:
+        """Expected seconds per successful attempt; unmeasured URLs go first."""
+        if self.latency is None:
+            return 0.0 if self.samples == 0 else float("inf")
+        return self.latency / max(1.0 - self.error_rate, 0.05)
+
+    def reset(self) -> None:
+        """Forget the measurements, so a returning URL is probed afresh."""
+        self.latency = None
+        self.error_rate = 0.0
+        self.samples = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+
+
+class EndpointPool:
+    """Latency-aware selection over a pool of base URLs with outlier ejection."""
+
+    def __init__(
+        self,
+        urls: List[str],
+        alpha: float = 0.3,
+        error_threshold: float = 0.5,
+        max_consecutive_failures: int = 3,
+        outlier_factor: float = 3.0,
+        ejection_seconds: float = 30.0,
+        min_samples: int = 5,
+        probe_interval: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            urls: Base URLs, e.g. one per region
+            alpha: EWMA weight of the newest sample
+            error_threshold: Error-rate EWMA at which a URL is ejected
+            max_consecutive_failures: Failures in a row at which a URL is ejected
+            outlier_factor: A URL whose latency exceeds this multiple of the
+                fastest healthy URL's is ejected
+            ejection_seconds: Base ejection time; repeat ejections last longer
+            min_samples: Samples needed before rate/latency based ejection
+            probe_interval: Seconds after which an unused healthy URL is retried
+            clock: Time source (injectable for tests)
+
+        Raises:
+            ValueError: If no URLs are given
+        """
+        if not urls:
+            raise ValueError("Endpoint pool needs at least one base URL")
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.max_consecutive_failures = max_consecutive_failures
+        self.outlier_factor = outlier_factor
+        self.ejection_seconds = ejection_seconds
+        self.min_samples = min_samples
+        self.probe_interval = probe_interval
+        self.clock = clock
+        now = clock()
+        self.stats: Dict[str, EndpointStats] = {
+            url: EndpointStats(url, last_selected=now) for url in urls
+        }
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> "EndpointPool":
+        """Build a pool from ``PARTS_API_BASE_URLS`` and the pool settings."""
+        return cls(
+            config.base_url_pool,
+            error_threshold=config.pool_error_threshold,
+            outlier_factor=config.pool_outlier_factor,
+            ejection_seconds=config.pool_ejection_seconds,
+        )
+
+    @property
+    def urls(self) -> List[str]:
+        """All base URLs in the pool."""
+        return list(self.stats)
+
+    def healthy(self) -> List[str]:
+        """Base URLs that are not currently ejected."""
+        now = self.clock()
+        with self._lock:
+            return [s.url for s in self.stats.values() if s.ejected_until <= now]
+
+    def select(self, avoid: Optional[str] = None) -> str:
+        """
+        Pick the base URL for the next attempt.
+
+        Args:
+            avoid: URL to skip if any other is healthy (e.g. the one a retried
+                attempt just failed on)
+
+        Returns:
+            str: The healthy URL with the lowest score (or one due for a probe);
+                 if every URL is ejected, the one whose ejection ends first
+        """
+        now = self.clock()
+        with self._lock:
+            candidates = []
+            for stats in self.stats.values():
+                if stats.ejected_until and stats.ejected_until <= now:
+                    stats.reset()
+                if stats.ejected_until <= now and stats.url != avoid:
+                    candidates.append(stats)
+            if not candidates and avoid in self.stats:
+                if self.stats[avoid].ejected_until <= now:
+                    candidates.append(self.stats[avoid])
+            if not candidates:
+                return min(self.stats.values(), key=lambda s: s.ejected_until).url
+            stale = [
+                s
+                for s in candidates
+                if s.latency is not None
+                and now - s.last_selected >= self.probe_interval
+            ]
+            unmeasured = [s for s in candidates if s.samples == 0]
+            if unmeasured:
+                chosen = unmeasured[0]
+            elif stale:
+                chosen = min(stale, key=lambda s: s.last_selected)
+            else:
+                chosen = min(candidates, key=lambda s: s.score)
+            chosen.last_selected = now
+            return chosen.url
+
+    def record(self, url: str, latency: float, ok: bool) -> None:
+        """
+        Record the outcome of an attempt.
+
+        Args:
+            url: Base URL the attempt went to
+            latency: Seconds the attempt took
+            ok: False for timeouts, connection errors and 5xx responses
+        """
+        with self._lock:
+            stats = self.stats.get(url)
+            if stats is None:
+                return
+            stats.samples += 1
+            stats.error_rate += self.alpha * ((0.0 if ok else 1.0) - stats.error_rate)
+            if ok:
+                stats.consecutive_failures = 0
+                stats.latency = (
+                    latency
+                    if stats.latency is None
+                    else stats.latency + self.alpha * (latency - stats.latency)
+                )
+            else:
+                stats.consecutive_failures += 1
+            self._maybe_eject(stats)
+
+    def _maybe_eject(self, stats: EndpointStats) -> None:
+        now = self.clock()
+        healthy = [s for s in self.stats.values() if s.ejected_until <= now]
+        # Never eject the last healthy URL
+        if stats.ejected_until > now or len(healthy) <= 1:
+            return
+
+        measured = stats.samples >= self.min_samples
+        if stats.consecutive_failures >= self.max_consecutive_failures:
+            eject = True
+        elif measured and stats.error_rate >= self.error_threshold:
+            eject = True
+        else:
+            fastest = min(
+                (
+                    s.latency
+                    for s in healthy
+                    if s is not stats and s.latency is not None
+                ),
+                default=None,
+            )
+            eject = (
+                measured
+                and fastest is not None
+                and stats.latency is not None
+                and stats.latency > self.outlier_factor * fastest
+            )
+        if eject:
+            stats.ejections += 1
+            stats.ejected_until = now + self.ejection_seconds * min(stats.ejections, 10)
@@ -0,0 +1,215 @@
+"""
+Request Hedging Module
+
+Cuts the latency tail of idempotent Parts API endpoints: when the first attempt
+hasn't answered by the observed p95 latency, a duplicate is sent and whichever
+answers first wins. A hedge budget caps the extra load.
+"""
+
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+Response = Dict[str, Any]
+
+
+class LatencyTracker:
+    """Rolling window of observed latencies per endpoint."""
+
+    def __init__(self, window: int = 200):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Number of most recent samples kept per endpoint
+        """
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.window)
+        )
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record one attempt's latency."""
+        with self._lock:
+            self._samples[endpoint].append(seconds)
+
+    def count(self, endpoint: str) -> int:
+        """Number of samples currently held for an endpoint."""
+        with self._lock:
+            return len(self._samples[endpoint])
+
+    def percentile(self, endpoint: str, percentile: float) -> Optional[float]:
+        """
+        Get a latency percentile (nearest-rank) for an endpoint.
+
+        Args:
+            endpoint: API endpoint path
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            float: Latency in seconds, or None without samples
+        """
+        with self._lock:
+            samples = sorted(self._samples[endpoint])
+        if not samples:
+            return None
+        rank = max(math.ceil(percentile / 100 * len(samples)), 1)
+        return samples[rank - 1]
+
+
+@dataclass
+class HedgeMetrics:
+    """Counters for hedged requests."""
+
+    requests: int = 0
+    fired: int = 0
+    wins: int = 0
+    over_budget: int = 0
+
+    @property
+    def fire_rate(self) -> float:
+        """Fraction of requests that sent a hedge."""
+        return self.fired / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of fired hedges that answered before the original attempt."""
+        return self.wins / self.fired if self.fired else 0.0
+
+
+def _is_error(future: Future) -> bool:
+    return future.exception() is not None or "error" in future.result()
+
+
+class RequestHedger:
+    """Sends a duplicate of slow idempotent requests and keeps the first answer."""
+
+    def __init__(
+        self,
+        endpoints: Iterable[str] = ("/parts/status", "/parts/lookup"),
+        percentile: float = 95.0,
+        budget_percent: float = 10.0,
+        min_samples: int = 20,
+        window: int = 200,
+        max_workers: int = 256,
+    ):
+        """
+        Initialize the hedger.
+
+        Args:
+            endpoints: Idempotent endpoints that may be hedged
+            percentile: Observed latency percentile after which a hedge is sent
+            budget_percent: Maximum hedges as a percentage of hedgeable requests
+            min_samples: Samples needed before an endpoint is hedged at all
+            window: Latency samples kept per endpoint
+            max_workers: Upper bound on attempt threads. Threads are only started
+                when no idle one is free, so this just needs to exceed the number of
+                concurrent API calls plus their hedges
+        """
+        self.endpoints = frozenset(endpoints)
+        self.percentile = percentile
+        self.budget_percent = budget_percent
+        self.min_samples = min_samples
+        self.latencies = LatencyTracker(window)
+        self.metrics = HedgeMetrics()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedge"
+        )
+
+    @classmethod
+    def from_config(cls, config) -> "RequestHedger":
+        """Build a hedger from an APIConfig."""
+        return cls(
+            endpoints=config.hedge_endpoints,
+            percentile=config.hedge_percentile,
+            budget_percent=config.hedge_budget_percent,
+            min_samples=config.hedge_min_samples,
+        )
+
+    def applies(self, endpoint: str) -> bool:
+        """Check whether an endpoint is hedged."""
+        return endpoint in self.endpoints
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait for the first attempt, or None until enough samples exist."""
+        if self.latencies.count(endpoint) < self.min_samples:
+            return None
+        return self.latencies.percentile(endpoint, self.percentile)
+
+    def call(self, endpoint: str, send: Callable[[], Response]) -> Response:
+        """
+        Run a request, hedging it if the first attempt is slow.
+
+        Args:
+            endpoint: API endpoint path (used for latency tracking)
+            send: Performs one attempt and returns the response dictionary
+
+        Returns:
+            dict: First successful response, or the first error if both failed
+        """
+        with self._lock:
+            self.metrics.requests += 1
+
+        delay = self.hedge_delay(endpoint)
+        primary = self._attempt(endpoint, send)
+        if delay is None or self._wait(primary, delay):
+            return primary.result()
+
+        if not self._take_budget():
+            return primary.result()
+        hedge = self._attempt(endpoint, send)
+
+        pending = {primary, hedge}
+        first = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                first = first or future
+                if not _is_error(future):
+                    return self._finish(future, primary, hedge)
+        return self._finish(first, primary, hedge)
+
+    def shutdown(self) -> None:
+        """Stop the attempt threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _attempt(self, endpoint: str, send: Callable[[], Response]) -> Future:
+        def timed() -> Response:
+            start = time.perf_counter()
+            response = send()
+            if "error" not in response:
+                self.latencies.record(endpoint, time.perf_counter() - start)
+            return response
+
+        return self._executor.submit(timed)
+
+    @staticmethod
+    def _wait(future: Future, timeout: float) -> bool:
+        """Wait for an attempt; True if it finished in time."""
+        done, _ = wait([future], timeout=timeout)
+        return bool(done)
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            allowed = self.metrics.requests * self.budget_percent / 100
+            if self.metrics.fired + 1 > allowed:
+                self.metrics.over_budget += 1
+                return False
+            self.metrics.fired += 1
+            return True
+
+    def _finish(self, winner: Future, primary: Future, hedge: Future) -> Response:
+        if winner is hedge:
+            with self._lock:
+                self.metrics.wins += 1
+        # A running loser can't be interrupted: it finishes in its thread and its
+        # response is discarded (its latency still feeds the tracker). cancel()
+        # only stops a hedge that hasn't started yet.
+        (hedge if winner is primary else primary).cancel()
+        return winner.result()
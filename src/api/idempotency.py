@@ -0,0 +1,235 @@
+"""
+Idempotency Module
+
+Suppresses duplicate subscription mutations. Model retries and repeated user
+confirmations can fire the same cancel/edit call several times in quick
+succession; each call gets a key derived from the session, membership,
+operation and value, and duplicates within a short window reuse the first
+call's result. The key is also sent to the API so the backend can dedupe.
+
+Only a repeat of the latest successful mutation of a membership is a duplicate:
+once a different mutation succeeds (frequency 3 -> 6), going back (6 -> 3) is a
+new change, so the key also carries a sequence number that advances with every
+such change.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+from .config import api_config
+
+# (session, membership) a mutation applies to, and (operation, value) it sets
+Scope = Tuple[str, str]
+Mutation = Tuple[str, str]
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Conversation the current request belongs to (set by the session handler/CLI)
+current_session_id: ContextVar[Optional[str]] = ContextVar(
+    "current_session_id", default=None
+)
+
+
+@contextmanager
+def session_scope(session_id: str) -> Iterator[None]:
+    """Mark API calls made in this block as belonging to a session."""
+    token = current_session_id.set(session_id)
+    try:
+        yield
+    finally:
+        current_session_id.reset(token)
+
+
+def idempotency_key(
+    session_id: Optional[str],
+    membership_id: str,
+    operation: str,
+    value: Optional[str] = None,
+    sequence: int = 0,
+) -> str:
+    """
+    Derive a stable idempotency key for a subscription mutation.
+
+    Args:
+        session_id: Conversation ID (None outside a session)
+        membership_id: Membership the mutation applies to
+        operation: Mutation name (e.g. 'cancel', 'frequency', 'quantity')
+        value: New value for updates
+        sequence: Number of earlier distinct mutations of the membership in the
+            session (see ``IdempotencyCache.key``)
+
+    Returns:
+        str: 32-character hex key
+    """
+    parts = [session_id or "", membership_id.strip(), operation, (value or "").strip()]
+    if sequence:
+        parts.append(str(sequence))
+    raw = "\x1f".join(parts)
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+@dataclass
+class DedupeMetrics:
+    """Counters for mutation calls."""
+
+    calls: int = 0
+    duplicates: int = 0
+
+
+class IdempotencyCache:
+    """Short-lived record of mutation results keyed by idempotency key."""
+
+    def __init__(
+        self,
+        window_seconds: float = 60,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            window_seconds: How long a result is replayed for duplicates
+            max_entries: Maximum remembered results (oldest evicted first)
+            clock: Time source (injectable for tests)
+        """
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self.metrics = DedupeMetrics()
+        self._results: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        # Latest successful mutation per scope: (mutation, sequence, key)
+        self._latest: "OrderedDict[Scope, Tuple[Mutation, int, str]]" = OrderedDict()
+        # Scope, mutation and sequence of keys handed out by ``key``
+        self._issued: "OrderedDict[str, Tuple[Scope, Mutation, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        session_id: Optional[str],
+        membership_id: str,
+        operation: str,
+        value: Optional[str] = None,
+    ) -> str:
+        """
+        Idempotency key for a mutation, given what already succeeded.
+
+        A repeat of the membership's latest successful mutation gets that
+        mutation's key, so it is deduped; any other mutation gets a key with the
+        next sequence number, so it always reaches the API (and the backend
+        doesn't mistake 3 -> 6 -> 3 for a repeat of the first call).
+
+        Args:
+            session_id: Conversation ID (None outside a session)
+            membership_id: Membership the mutation applies to
+            operation: Mutation name (e.g. 'cancel', 'frequency', 'quantity')
+            value: New value for updates
+
+        Returns:
+            str: Key to pass to ``run`` and send to the API
+        """
+        scope = (session_id or "", membership_id.strip())
+        mutation = (operation, (value or "").strip())
+        with self._lock:
+            latest = self._latest.get(scope)
+            if latest is None:
+                sequence = 0
+            elif latest[0] == mutation:
+                return latest[2]
+            else:
+                sequence = latest[1] + 1
+            key = idempotency_key(session_id, membership_id, operation, value, sequence)
+            self._issued[key] = (scope, mutation, sequence)
+            self._issued.move_to_end(key)
+            while len(self._issued) > self.max_entries:
+                self._issued.popitem(last=False)
+        return key
+
+    async def run(
+        self, key: str, call: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Run a mutation once per key within the window.
+
+        A duplicate arriving while the first call is in flight waits for it.
+        Error responses are not remembered, so a failed call can be retried.
+
+        Args:
+            key: Idempotency key for the mutation
+            call: Performs the API call and returns the response dictionary
+
+        Returns:
+            dict: Response of the first call for this key
+        """
+        with self._lock:
+            self.metrics.calls += 1
+            stored = self._results.get(key)
+            if stored and self.clock() - stored[0] < self.window_seconds:
+                self.metrics.duplicates += 1
+                return stored[1]
+            first = self._in_flight.get(key)
+            if first is None:
+                pending = asyncio.get_running_loop().create_future()
+                self._in_flight[key] = pending
+            else:
+                self.metrics.duplicates += 1
+        if first is not None:
+            return await asyncio.shield(first)
+
+        try:
+            response = await call()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            if isinstance(e, asyncio.CancelledError):
+                pending.cancel()
+            else:
+                pending.set_exception(e)
+                # Mark retrieved so a future nobody else awaited doesn't log a warning
+                pending.exception()
+            raise
+
+        with self._lock:
+            del self._in_flight[key]
+            if "error" not in response:
+                self._remember(key, response)
+        pending.set_result(response)
+        return response
+
+    def _remember(self, key: str, response: Dict[str, Any]) -> None:
+        # Caller holds the lock
+        self._results[key] = (self.clock(), response)
+        self._results.move_to_end(key)
+        issued = self._issued.get(key)
+        if issued is not None:
+            scope, mutation, sequence = issued
+            previous = self._latest.get(scope)
+            # A different mutation succeeded: the earlier result no longer
+            # describes the subscription, so it must not be replayed
+            if previous is not None and previous[2] != key:
+                self._results.pop(previous[2], None)
+            self._latest[scope] = (mutation, sequence, key)
+            self._latest.move_to_end(scope)
+            while len(self._latest) > self.max_entries:
+                self._latest.popitem(last=False)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all remembered results."""
+        with self._lock:
+            self._results.clear()
+            self._latest.clear()
+            self._issued.clear()
+
+
+# Global dedupe cache for subscription mutations
+mutation_dedupe = IdempotencyCache(api_config.idempotency_window)
@@ -0,0 +1,270 @@
+"""
+API Response Models
+
+Typed, slot-based models for every Parts API endpoint. Responses are validated
+once when they come off the wire and serialized to compact JSON for the LLM.
+"""
+
+import json
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+try:  # Optional fast JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is missing
+    orjson = None
+
+
+T = TypeVar("T", bound="APIResponse")
+
+
+def decode_json(data: bytes) -> Any:
+    """
+    Decode a JSON payload, using orjson when it is installed.
+
+    Args:
+        data: Raw response body
+
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_json(value: Any) -> str:
+    """
+    Encode a value as compact JSON, using orjson when it is installed.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        str: JSON without insignificant whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or (not value and isinstance(value, (str, list, dict)))
+
+
+def _compact(value: Any) -> Any:
+    """Recursively drop None and empty values."""
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if item is None:
+                continue
+            if isinstance(item, (dict, list)):
+                item = _compact(item)
+            if item or not isinstance(item, (str, list, dict)):
+                result[key] = item
+        return result
+    if isinstance(value, list):
+        result = []
+        for item in value:
+            if item is None:
+                continue
+            if isinstance(item, (dict, list)):
+                item = _compact(item)
+            if item or not isinstance(item, (str, list, dict)):
+                result.append(item)
+        return result
+    return value
+
+
+def _as_dict(value: Any, compact: bool = True) -> Dict[str, Any]:
+    """Validate an object field, compacting it once at parse time."""
+    if not isinstance(value, dict):
+        return {}
+    return _compact(value) if compact else value
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Validate a list field (a lone object becomes a one-item list)."""
+    if isinstance(value, list):
+        return _compact(value)
+    return [_compact(value)] if value else []
+
+
+@dataclass
+class APIResponse:
+    """Common fields of every Parts API response, including errors."""
+
+    __slots__ = ("status_code", "message", "error", "details")
+
+    status_code: int
+    message: Optional[str]
+    error: Optional[str]
+    details: Optional[str]
+
+    @classmethod
+    def from_error(
+        cls: Type[T], error: str, details: Optional[str] = None, status_code: int = 500
+    ) -> T:
+        """
+        Build an error response of this type.
+
+        Args:
+            error: Short error type (e.g. 'Request timeout')
+            details: Detailed error message
+            status_code: Status code to report
+
+        Returns:
+            APIResponse: Response with every endpoint-specific field empty
+        """
+        response = cls.__new__(cls)
+        for name in cls._fields():
+            setattr(response, name, None)
+        response.status_code = status_code
+        response.error = error
+        response.details = details
+        return response
+
+    @classmethod
+    def from_dict(cls: Type[T], data: Any) -> T:
+        """
+        Validate a decoded API response (or client error dictionary).
+
+        Args:
+            data: Decoded response
+
+        Returns:
+            APIResponse: Typed response; malformed input becomes an error response
+        """
+        if not isinstance(data, dict):
+            return cls.from_error("Invalid response", f"Expected object, got {data!r}")
+        if "error" in data:
+            details = data.get("details")
+            return cls.from_error(
+                str(data["error"]),
+                None if details is None else str(details),
+                int(data.get("statusCode", 500)),
+            )
+
+        status_code = data.get("statusCode")
+        if not isinstance(status_code, int):
+            return cls.from_error("Invalid response", "Missing statusCode")
+
+        body = _as_dict(data.get("body"), compact=False)
+        message = body.get("message")
+        return cls(
+            status_code,
+            message if isinstance(message, str) else None,
+            None,
+            None,
+            *cls._parse_body(body),
+        )
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _fields(cls) -> Tuple[str, ...]:
+        """Field names of the model class, computed once per class."""
+        return tuple(field.name for field in fields(cls))
+
+    @classmethod
+    def _parse_body(cls, body: Dict[str, Any]) -> tuple:
+        """Extract endpoint-specific fields from the response body."""
+        return ()
+
+    @property
+    def ok(self) -> bool:
+        """Whether the API call succeeded."""
+        return self.error is None and self.status_code in (200, 201)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a dictionary (None and empty values removed)."""
+        result = {}
+        for name in self._fields():
+            value = getattr(self, name)
+            if not _is_empty(value):
+                result[name] = value
+        return result
+
+    def to_llm(self) -> str:
+        """Serialize to the compact JSON passed back to the model."""
+        return encode_json(self.to_dict())
+
+
+@dataclass
+class OrderStatusResponse(APIResponse):
+    """Response of ``/parts/status``."""
+
+    __slots__ = ("order_number", "status", "parts", "customer")
+
+    order_number: Optional[str]
+    status: Optional[str]
+    parts: Optional[List[Any]]
+    customer: Optional[Dict[str, Any]]
+
+    @classmethod
+    def _parse_body(cls, body):
+        order = _as_dict(body.get("partOrderDetails"), compact=False)
+        return (
+            order.get("orderNumber"),
+            order.get("status"),
+            _as_list(order.get("partsDetail")),
+            _as_dict(order.get("customer")),
+        )
+
+
+@dataclass
+class RefundStatusResponse(APIResponse):
+    """Response of ``/parts/refundstatus``."""
+
+    __slots__ = ("refund_status", "refunds")
+
+    refund_status: Optional[str]
+    refunds: Optional[List[Any]]
+
+    @classmethod
+    def _parse_body(cls, body):
+        return body.get("refundStatus"), _as_list(body.get("refundDetails"))
+
+
+@dataclass
+class PartDetailsResponse(APIResponse):
+    """Response of ``/parts/lookup`` (or the local part catalog)."""
+
+    __slots__ = ("part", "source")
+
+    part: Optional[Dict[str, Any]]
+    source: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data):
+        response = super().from_dict(data)
+        if isinstance(data, dict) and response.error is None:
+            # Set to "catalog" when answered from the local part catalog
+            response.source = data.get("source")
+        return response
+
+    @classmethod
+    def _parse_body(cls, body):
+        # The part record is returned under "message"
+        return _as_dict(body.get("message")), None
+
+
+@dataclass
+class SubscriptionLookupResponse(APIResponse):
+    """Response of ``/subscription/lookup``."""
+
+    __slots__ = ("subscriptions",)
+
+    subscriptions: Optional[List[Any]]
+
+    @classmethod
+    def _parse_body(cls, body):
+        return (_as_list(body.get("subscriptionDetails")),)
+
+
+@dataclass
+class SubscriptionUpdateResponse(APIResponse):
+    """Response of ``/subscription/cancel`` and ``/subscription/edit``."""
+
+    __slots__ = ()
@@ -0,0 +1,211 @@
+"""
+Speculative Prefetch Module
+
+Starts likely read-only API calls at request entry, while the orchestrator and
+specialist models are still deciding, so HTTP latency overlaps model latency.
+"""
+
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..utils.entities import extract_entities
+
+Call = Tuple[str, Dict[str, Any]]
+
+
+def _cache_key(endpoint: str, payload: Dict[str, Any]) -> Tuple[str, str]:
+    """Build a stable cache key for an endpoint/payload pair."""
+    return endpoint, json.dumps(payload, sort_keys=True)
+
+
+def extract_prefetch_calls(query: str) -> List[Call]:
+    """
+    Extract the read-only API calls a query is likely to need.
+
+    Only complete identifiers produce a call: an order number needs a zip code,
+    while membership IDs and part numbers stand on their own. Identifiers that
+    appear later in the query (i.e. the most recent conversation turn) come first.
+
+    Args:
+        query: Raw or context-aware user query
+
+    Returns:
+        list: ``(endpoint, payload)`` tuples in priority order
+    """
+    entities = extract_entities(query)
+    calls: List[Call] = []
+
+    zips = entities["zips"]
+    if zips:
+        for order_no in reversed(entities["order_numbers"]):
+            calls.append(("/parts/status", {"orderNo": order_no, "zip": zips[-1]}))
+
+    for membership_id in reversed(entities["membership_ids"]):
+        calls.append(
+            ("/subscription/lookup", {"phoneNumber": "", "membershipId": membership_id})
+        )
+
+    for part_number in reversed(entities["part_numbers"]):
+        calls.append(("/parts/lookup", {"part_number": part_number}))
+
+    # De-duplicate while keeping priority order
+    seen = set()
+    unique = []
+    for endpoint, payload in calls:
+        key = _cache_key(endpoint, payload)
+        if key not in seen:
+            seen.add(key)
+            unique.append((endpoint, payload))
+    return unique
+
+
+class PrefetchCache:
+    """Per-request cache of in-flight or completed speculative responses."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[Tuple[str, str], Future] = {}
+        self._used: set = set()
+        self._lock = threading.Lock()
+
+    def add(self, endpoint: str, payload: Dict[str, Any], future: Future) -> None:
+        """Register a speculative call."""
+        with self._lock:
+            self._entries[_cache_key(endpoint, payload)] = future
+
+    def get(self, endpoint: str, payload: Dict[str, Any]) -> Optional[Future]:
+        """
+        Return the speculative call matching a request, if any.
+
+        Args:
+            endpoint: API endpoint path
+            payload: Request payload dictionary
+
+        Returns:
+            Future or None: Future resolving to the API response dictionary
+        """
+        key = _cache_key(endpoint, payload)
+        with self._lock:
+            future = self._entries.get(key)
+            if future is None or future.cancelled():
+                return None
+            self._used.add(key)
+            return future
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def wasted(self) -> int:
+        """Number of speculative calls no tool consumed."""
+        with self._lock:
+            return len(self._entries) - len(self._used)
+
+    def cancel_pending(self) -> None:
+        """Cancel speculative calls that have not started yet."""
+        with self._lock:
+            for future in self._entries.values():
+                future.cancel()
+
+
+# Cache for the request currently being served (propagates into agent tasks)
+current_prefetch_cache: ContextVar[Optional[PrefetchCache]] = ContextVar(
+    "current_prefetch_cache", default=None
+)
+
+
+def get_prefetched(endpoint: str, payload: Dict[str, Any]) -> Optional[Future]:
+    """
+    Look up a speculative response for the current request.
+
+    Args:
+        endpoint: API endpoint path
+        payload: Request payload dictionary
+
+    Returns:
+        Future or None: Matching speculative call, if one was started
+    """
+    cache = current_prefetch_cache.get()
+    if cache is None:
+        return None
+    return cache.get(endpoint, payload)
+
+
+@dataclass
+class PrefetchMetrics:
+    """Counters for speculative calls across requests."""
+
+    issued: int = 0
+    used: int = 0
+    wasted: int = 0
+    capped: int = 0
+
+    @property
+    def wasted_ratio(self) -> float:
+        """Fraction of issued speculative calls that were never consumed."""
+        return self.wasted / self.issued if self.issued else 0.0
+
+
+class RequestPrefetcher:
+    """Starts speculative read-only calls for a request and tracks their usefulness."""
+
+    def __init__(self, client, max_speculative_calls: int = 3, max_workers: int = 4):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            client: APIClient used to issue the speculative calls
+            max_speculative_calls: Cap on speculative calls per request
+            max_workers: Threads shared by all in-flight speculative calls
+        """
+        self.client = client
+        self.max_speculative_calls = max_speculative_calls
+        self.metrics = PrefetchMetrics()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prefetch"
+        )
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def prefetch(self, query: str) -> Iterator[PrefetchCache]:
+        """
+        Start speculative calls for a query and expose them to tools.
+
+        Tools running inside the ``with`` block (including nested agent runs)
+        reuse matching responses instead of calling the API again.
+
+        Args:
+            query: User query at request entry
+
+        Yields:
+            PrefetchCache: Cache populated with the speculative calls
+        """
+        cache = PrefetchCache()
+        calls = extract_prefetch_calls(query)
+        for endpoint, payload in calls[: self.max_speculative_calls]:
+            cache.add(
+                endpoint,
+                payload,
+                self._executor.submit(self.client.post, endpoint, payload),
+            )
+
+        token = current_prefetch_cache.set(cache)
+        try:
+            yield cache
+        finally:
+            current_prefetch_cache.reset(token)
+            cache.cancel_pending()
+            with self._lock:
+                self.metrics.issued += len(cache)
+                self.metrics.used += len(cache) - cache.wasted
+                self.metrics.wasted += cache.wasted
+                self.metrics.capped += max(0, len(calls) - self.max_speculative_calls)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,35 @@
+"""Serving components for running the agent graph across worker processes."""
+
+from .worker_pool import (
+    WorkerPool,
+    WorkerCrashedError,
+    WorkerRequestError,
+    WorkerUnavailableError,
+)
+from .session import OrchestratorSessionHandler, build_context_aware_query
+from .admission import (
+    AdmissionController,
+    AdaptiveLimit,
+    LoadShedError,
+    Priority,
+    classify_priority,
+)
+from .replay import RecordedAPI, ReplayModel, ReplayReport, replay_conversation
+
+__all__ = [
+    "WorkerPool",
+    "WorkerCrashedError",
+    "WorkerRequestError",
+    "WorkerUnavailableError",
+    "OrchestratorSessionHandler",
+    "build_context_aware_query",
+    "AdmissionController",
+    "AdaptiveLimit",
+    "LoadShedError",
+    "Priority",
+    "classify_priority",
+    "RecordedAPI",
+    "ReplayModel",
+    "ReplayReport",
+    "replay_conversation",
+]
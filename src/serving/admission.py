@@ -0,0 +1,273 @@
+"""
+Admission Control
+
+Sits in front of the orchestrator so that, under load, conversations already
+in progress and subscription changes aren't stuck behind anonymous browsing.
+Requests are classified by intent, queued per priority class with weighted
+dispatch, admitted up to a concurrency limit that adapts to observed latency,
+and the lowest priority is shed first when the queue is full.
+"""
+
+import asyncio
+import re
+import statistics
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import AsyncIterator, Deque, Dict, Hashable, Optional
+
+from ..api.hedging import LatencyTracker
+
+# Subscription changes handled by the cancel/update subscription tools
+MUTATION_PATTERN = re.compile(
+    r"\b(cancel|unsubscribe|stop|pause|change|update|switch|modify)\b"
+    r".*\b(subscription|membership|frequency|delivery|deliveries)\b"
+    r"|\b(subscription|membership)\b.*\b(cancel|change|update|frequency)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+# Order, refund and subscription lookups handled by the support agent
+SUPPORT_PATTERN = re.compile(
+    r"\b(order|refund|subscription|membership)\b", re.IGNORECASE
+)
+
+
+class Priority(IntEnum):
+    """Priority classes; lower values are served first and shed last."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+def classify_priority(query: str, in_conversation: bool = False) -> Priority:
+    """
+    Derive a request's priority from its intent.
+
+    Args:
+        query: User query (without conversation context)
+        in_conversation: Whether the session already has previous turns
+
+    Returns:
+        Priority: HIGH for subscription changes and mid-conversation turns,
+                  NORMAL for new support lookups, LOW for new sales browsing
+    """
+    if in_conversation or MUTATION_PATTERN.search(query):
+        return Priority.HIGH
+    if SUPPORT_PATTERN.search(query):
+        return Priority.NORMAL
+    return Priority.LOW
+
+
+class LoadShedError(RuntimeError):
+    """Raised for requests rejected or dropped from the queue under load."""
+
+
+class AdaptiveLimit:
+    """
+    AIMD concurrency limit driven by request latency.
+
+    End-to-end latency differs several-fold by intent, so each request class
+    (e.g. priority) is judged against its own baseline: the median of its recent
+    latencies. The limit grows by one per window of completions at baseline and
+    shrinks multiplicatively when a class's smoothed latency exceeds
+    ``tolerance`` times its baseline, i.e. when requests start queueing.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        window: int = 200,
+        smoothing: float = 0.2,
+    ):
+        """
+        Initialize the limit.
+
+        Args:
+            initial: Starting concurrency limit
+            min_limit: Lowest allowed limit
+            max_limit: Highest allowed limit
+            tolerance: Smoothed latency/baseline ratio above which the limit shrinks
+            backoff: Multiplier applied to the limit on a slow completion
+            window: Recent latencies per class considered for the baseline
+            smoothing: EWMA weight of the newest latency
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self._limit = float(initial)
+        self._recent: Dict[Hashable, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+        self._smoothed: Dict[Hashable, float] = {}
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def update(self, latency: float, key: Hashable = None) -> None:
+        """
+        Adjust the limit after a request completes.
+
+        Args:
+            latency: Seconds the request took once admitted
+            key: Request class whose baseline the latency is compared with
+        """
+        recent = self._recent[key]
+        recent.append(latency)
+        smoothed = self._smoothed.get(key, latency)
+        smoothed += self.smoothing * (latency - smoothed)
+        self._smoothed[key] = smoothed
+        if smoothed > statistics.median(recent) * self.tolerance:
+            self._limit = max(self.min_limit, self._limit * self.backoff)
+        else:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+
+@dataclass
+class ClassMetrics:
+    """Counters for one priority class."""
+
+    admitted: int = 0
+    shed: int = 0
+
+
+class AdmissionController:
+    """Priority queues with weighted dispatch in front of the orchestrator."""
+
+    DEFAULT_WEIGHTS = {Priority.HIGH: 6, Priority.NORMAL: 3, Priority.LOW: 1}
+
+    def __init__(
+        self,
+        limit: Optional[AdaptiveLimit] = None,
+        weights: Optional[Dict[Priority, int]] = None,
+        max_queue: int = 100,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            limit: Concurrency limit (an AdaptiveLimit with defaults if None)
+            weights: Relative dispatch share of each class while queues are busy
+            max_queue: Queued requests across all classes before shedding
+        """
+        self.limit = limit or AdaptiveLimit()
+        self.weights = dict(weights or self.DEFAULT_WEIGHTS)
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.metrics: Dict[Priority, ClassMetrics] = {
+            p: ClassMetrics() for p in Priority
+        }
+        # Queue wait and total latency per class, keyed "<class>/queue" and "<class>"
+        self.latencies = LatencyTracker()
+        self._queues: Dict[Priority, Deque[asyncio.Future]] = {
+            p: deque() for p in Priority
+        }
+        self._credits: Dict[Priority, int] = {p: 0 for p in Priority}
+
+    @classmethod
+    def from_config(cls, config) -> "AdmissionController":
+        """Build a controller from an APIConfig."""
+        return cls(
+            AdaptiveLimit(
+                initial=config.admission_initial_limit,
+                max_limit=config.admission_max_limit,
+            ),
+            max_queue=config.admission_max_queue,
+        )
+
+    @property
+    def queued(self) -> int:
+        """Requests waiting across all classes."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def latency(self, priority: Priority, percentile: float = 95.0) -> Optional[float]:
+        """Observed end-to-end latency percentile (queue wait included) for a class."""
+        return self.latencies.percentile(priority.name, percentile)
+
+    @asynccontextmanager
+    async def admit(self, priority: Priority) -> AsyncIterator[None]:
+        """
+        Wait for a slot, run the block, then release the slot.
+
+        Args:
+            priority: Priority class of the request
+
+        Raises:
+            LoadShedError: If the request is shed instead of admitted
+        """
+        start = time.perf_counter()
+        await self._acquire(priority)
+        admitted = time.perf_counter()
+        self.latencies.record(f"{priority.name}/queue", admitted - start)
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.latencies.record(priority.name, end - start)
+            self.limit.update(end - admitted, priority)
+            self.in_flight -= 1
+            self._dispatch()
+
+    async def _acquire(self, priority: Priority) -> None:
+        if self.in_flight < self.limit.limit and not self.queued:
+            self._admit(priority)
+            return
+
+        if self.queued >= self.max_queue and not self._shed_below(priority):
+            self.metrics[priority].shed += 1
+            raise LoadShedError(f"Shed {priority.name} request: queue full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # Admitted just as the caller gave up: hand the slot on
+                self.in_flight -= 1
+                self._dispatch()
+            elif waiter in self._queues[priority]:
+                self._queues[priority].remove(waiter)
+            raise
+
+    def _admit(self, priority: Priority) -> None:
+        self.in_flight += 1
+        self.metrics[priority].admitted += 1
+
+    def _shed_below(self, priority: Priority) -> bool:
+        """Drop the newest queued request of a lower class to make room."""
+        for lower in sorted(Priority, reverse=True):
+            if lower <= priority:
+                return False
+            if self._queues[lower]:
+                self._queues[lower].pop().set_exception(
+                    LoadShedError(f"Shed {lower.name} request for {priority.name}")
+                )
+                self.metrics[lower].shed += 1
+                return True
+        return False
+
+    def _dispatch(self) -> None:
+        """Admit queued requests up to the limit using smooth weighted round robin."""
+        while self.in_flight < self.limit.limit:
+            ready = [p for p in Priority if self._queues[p]]
+            if not ready:
+                return
+            for p in ready:
+                self._credits[p] += self.weights[p]
+            chosen = max(ready, key=lambda p: (self._credits[p], -p))
+            self._credits[chosen] -= sum(self.weights[p] for p in ready)
+            waiter = self._queues[chosen].popleft()
+            if waiter.done():
+                continue
+            self._admit(chosen)
+            waiter.set_result(None)
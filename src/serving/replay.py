@@ -0,0 +1,308 @@
+"""
+Conversation Replay
+
+Re-drives the current orchestrator code against a recorded conversation. The
+model is replaced by ``ReplayModel``, which answers each agent with its
+recorded decisions in order, and the Parts API by ``RecordedAPI``, which
+serves the recorded responses for matching requests. Everything in between
+(history assembly, routing tools, function tools, the API client) is the code
+under test; the replay is itself recorded and compared turn by turn.
+"""
+
+import asyncio
+import json
+import uuid
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from agents import Model, ModelResponse, RunConfig, Usage
+from openai.types.responses import (
+    ResponseOutputItem,
+    ResponseOutputMessage,
+    ResponseOutputText,
+)
+from pydantic import TypeAdapter
+
+from ..utils.recording import (
+    ConversationRecorder,
+    RecordedTurn,
+    RecordingModel,
+    agent_key,
+    input_chars,
+)
+from .session import OrchestratorSessionHandler
+
+UNMATCHED_RESPONSE = "[replay] No recorded model response for this call."
+
+_OUTPUT_ITEM = TypeAdapter(ResponseOutputItem)
+
+
+def _payload_key(endpoint: str, payload: Dict[str, Any]) -> Tuple[str, str]:
+    return endpoint, json.dumps(payload, sort_keys=True)
+
+
+class RecordedAPI:
+    """
+    Serves a recording's Parts API responses, e.g. as a ``LocalAPIStub`` responder.
+
+    Requests are matched on endpoint and payload; repeated requests get the
+    recorded responses in order, the last one repeating once they run out.
+    """
+
+    def __init__(self, turns: List[RecordedTurn], latency_scale: float = 1.0):
+        """
+        Index the API calls of a recording.
+
+        Args:
+            turns: Recorded turns
+            latency_scale: Multiplier for the recorded API latency (0 to disable)
+        """
+        self.latency_scale = latency_scale
+        self.hits = 0
+        self.misses = 0
+        self._responses: Dict[Tuple[str, str], List[Tuple[Dict, float]]] = defaultdict(
+            list
+        )
+        self._served: Dict[Tuple[str, str], int] = defaultdict(int)
+        for turn in turns:
+            for call in turn.api_calls:
+                self._responses[_payload_key(call["endpoint"], call["payload"])].append(
+                    (call["response"], call["latency"])
+                )
+
+    def respond(
+        self, endpoint: str, payload: Dict[str, Any]
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Look up the recorded response to a request.
+
+        Args:
+            endpoint: Request path
+            payload: Request body
+
+        Returns:
+            tuple: ``(body, delay)``, or None if the request was never recorded
+        """
+        key = _payload_key(endpoint, payload)
+        responses = self._responses.get(key)
+        if not responses:
+            self.misses += 1
+            return None
+        self.hits += 1
+        index = min(self._served[key], len(responses) - 1)
+        self._served[key] += 1
+        body, latency = responses[index]
+        return body, latency * self.latency_scale
+
+
+class ReplayModel(Model):
+    """
+    Answers each agent with its recorded responses for the current turn.
+
+    Calls are matched by agent (its tool set) and order. Usage is the recorded
+    usage with input tokens scaled by how much the prompt grew or shrank, so
+    changes to instructions or history assembly show up as token deltas.
+    """
+
+    def __init__(self, latency_scale: float = 1.0):
+        """
+        Initialize the model.
+
+        Args:
+            latency_scale: Multiplier for the recorded model latency (0 to disable)
+        """
+        self.latency_scale = latency_scale
+        self.unmatched = 0
+        self._calls: Dict[str, Deque[Dict[str, Any]]] = {}
+
+    def load_turn(self, turn: RecordedTurn) -> None:
+        """Queue the recorded model calls of a turn."""
+        self.unmatched = 0
+        self._calls = defaultdict(deque)
+        for call in turn.model_calls:
+            self._calls[call["agent"]].append(call)
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        **kwargs,
+    ) -> ModelResponse:
+        calls = self._calls.get(agent_key(tools))
+        if not calls:
+            self.unmatched += 1
+            return ModelResponse(
+                output=[_message(UNMATCHED_RESPONSE)], usage=Usage(), response_id=None
+            )
+
+        call = calls.popleft()
+        if self.latency_scale:
+            await asyncio.sleep(call["latency"] * self.latency_scale)
+
+        usage = call["usage"]
+        input_tokens = usage["input_tokens"]
+        if call["input_chars"]:
+            input_tokens = round(
+                input_tokens
+                * input_chars(system_instructions, input)
+                / call["input_chars"]
+            )
+        return ModelResponse(
+            output=[_OUTPUT_ITEM.validate_python(item) for item in call["output"]],
+            usage=Usage(
+                requests=1,
+                input_tokens=input_tokens,
+                output_tokens=usage["output_tokens"],
+                total_tokens=input_tokens + usage["output_tokens"],
+            ),
+            response_id=None,
+        )
+
+    async def stream_response(self, *args, **kwargs):
+        raise NotImplementedError("ReplayModel does not support streaming")
+        yield  # pragma: no cover
+
+
+def _message(text: str) -> ResponseOutputMessage:
+    return ResponseOutputMessage(
+        id="replay",
+        type="message",
+        role="assistant",
+        status="completed",
+        content=[ResponseOutputText(text=text, type="output_text", annotations=[])],
+    )
+
+
+@dataclass
+class TurnComparison:
+    """A recorded turn next to its replay."""
+
+    index: int
+    recorded: RecordedTurn
+    replayed: RecordedTurn
+    unmatched_model_calls: int = 0
+
+    @property
+    def latency_delta(self) -> float:
+        return self.replayed.latency - self.recorded.latency
+
+    @property
+    def model_call_delta(self) -> int:
+        return len(self.replayed.model_calls) - len(self.recorded.model_calls)
+
+    @property
+    def token_delta(self) -> int:
+        return self.replayed.tokens - self.recorded.tokens
+
+    @property
+    def api_call_delta(self) -> int:
+        return len(self.replayed.api_calls) - len(self.recorded.api_calls)
+
+    @property
+    def changed_tool_outputs(self) -> List[str]:
+        """Names of tools whose output differs from the recording."""
+        recorded = {t["call_id"]: t["output"] for t in self.recorded.tool_outputs}
+        return [
+            t["name"]
+            for t in self.replayed.tool_outputs
+            if recorded.get(t["call_id"], t["output"]) != t["output"]
+        ]
+
+    @property
+    def output_changed(self) -> bool:
+        return self.replayed.output != self.recorded.output
+
+
+@dataclass
+class ReplayReport:
+    """Per-turn comparison of a replay against its recording."""
+
+    session_id: str
+    turns: List[TurnComparison] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """Format the per-turn latency, model-call and token deltas."""
+        lines = [
+            "=" * 78,
+            f"Replay of session {self.session_id}",
+            "-" * 78,
+            f"{'Turn':<6}{'Latency ms':>19}{'Model calls':>16}{'Tokens':>19}  Notes",
+            f"{'':<6}{'recorded':>9} {'delta':>9}{'recorded':>9} {'delta':>6}"
+            f"{'recorded':>10} {'delta':>8}",
+        ]
+        for turn in self.turns:
+            recorded, replayed = turn.recorded, turn.replayed
+            notes = []
+            if turn.unmatched_model_calls:
+                notes.append(f"{turn.unmatched_model_calls} unmatched")
+            if turn.changed_tool_outputs:
+                notes.append("tools changed: " + ",".join(turn.changed_tool_outputs))
+            if turn.api_call_delta:
+                notes.append(f"api calls {turn.api_call_delta:+d}")
+            if turn.output_changed:
+                notes.append("output changed")
+            if replayed.error:
+                notes.append(replayed.error)
+            lines.append(
+                f"{turn.index:<6}"
+                f"{recorded.latency * 1000:>9.0f} {turn.latency_delta * 1000:>+9.0f}"
+                f"{len(recorded.model_calls):>9} {turn.model_call_delta:>+6d}"
+                f"{recorded.tokens:>10} {turn.token_delta:>+8d}"
+                f"  {'; '.join(notes)}".rstrip()
+            )
+        lines.append("=" * 78)
+        return "\n".join(lines)
+
+
+async def replay_conversation(
+    recording: ConversationRecorder,
+    latency_scale: float = 1.0,
+    history_turns: int = 3,
+) -> ReplayReport:
+    """
+    Replay a recorded conversation through the current orchestrator.
+
+    The Parts API client must already point at a server answering from the
+    same recording (see ``RecordedAPI``). Turns recorded without any model
+    call (e.g. answer cache hits) are not re-run; their recorded response is
+    added to the history as it was at recording time.
+
+    Args:
+        recording: Recorded conversation
+        latency_scale: Multiplier for the recorded model latency (0 to disable)
+        history_turns: Previous exchanges included as context, as when recorded
+
+    Returns:
+        ReplayReport: Per-turn comparison against the recording
+    """
+    model = ReplayModel(latency_scale)
+    handler = OrchestratorSessionHandler(
+        RunConfig(model=RecordingModel(model), tracing_disabled=True),
+        history_turns=history_turns,
+    )
+    # A fresh session keeps idempotency keys from colliding across replays
+    session_id = uuid.uuid4().hex
+    replay = ConversationRecorder(session_id)
+    report = ReplayReport(recording.session_id)
+
+    for index, turn in enumerate(recording.turns, 1):
+        if not turn.model_calls:
+            history = handler.histories.setdefault(session_id, [])
+            history.append({"query": turn.query, "response": turn.output})
+            del history[:-history_turns]
+            continue
+
+        model.load_turn(turn)
+        with replay.turn(turn.query) as replayed:
+            try:
+                replayed.output = await handler.handle(session_id, turn.query)
+            except Exception as e:
+                replayed.error = f"{type(e).__name__}: {e}"
+        report.turns.append(TurnComparison(index, turn, replayed, model.unmatched))
+    return report
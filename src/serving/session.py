@@ -0,0 +1,134 @@
+"""
+Session Handling
+
+Runs conversations through the orchestrator while keeping each session's
+history local to the process that owns it.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from agents import AsyncOpenAI, RunConfig, Runner
+from ..agents.orchestrator_agent import create_orchestrator
+from ..agents.usage import TokenBudgetExceeded, UsageMetrics, usage_hooks, usage_scope
+from ..api.config import api_config, openai_config
+from ..api.idempotency import session_scope
+from .admission import AdmissionController, classify_priority
+from .warmup import Warmup
+
+
+def build_context_aware_query(history: List[Dict[str, str]], query: str) -> str:
+    """
+    Prefix a query with the previous exchanges of the conversation.
+
+    Args:
+        history: Previous ``{"query", "response"}`` exchanges, oldest first
+        query: Current user query
+
+    Returns:
+        str: Query in the "Previous query / Previous response" format the
+             orchestrator instructions expect
+    """
+    if not history:
+        return query
+    context = "\n\n".join(
+        f"Previous query: {item['query']}\nPrevious response: {item['response']}"
+        for item in history
+    )
+    return f"{context}\n\nCurrent query: {query}"
+
+
+class OrchestratorSessionHandler:
+    """Answers queries per session with its own agent graph and conversation history."""
+
+    def __init__(
+        self,
+        run_config: Optional[RunConfig] = None,
+        history_turns: int = 3,
+        admission: Optional[AdmissionController] = None,
+        max_sessions: int = 10_000,
+    ):
+        """
+        Build the agent graph for this process.
+
+        Args:
+            run_config: Optional run configuration (e.g. a model override)
+            history_turns: Number of previous exchanges included as context
+            admission: Optional admission controller. Built from the config when
+                admission control is enabled there.
+            max_sessions: Number of session histories kept; the least recently
+                active session is forgotten beyond it
+        """
+        self.orchestrator = create_orchestrator()
+        self.run_config = run_config
+        self.history_turns = history_turns
+        if admission is None and api_config.admission_enabled:
+            admission = AdmissionController.from_config(api_config)
+        self.admission = admission
+        self.max_sessions = max_sessions
+        self.histories: "OrderedDict[str, List[Dict[str, str]]]" = OrderedDict()
+        self.usage_metrics = UsageMetrics()
+        self.warmup: Optional[Warmup] = None
+
+    async def start(self) -> None:
+        """Warm up connections and DNS before the first query (called by WorkerPool)."""
+        uses_default_model = self.run_config is None or self.run_config.model is None
+        model_client = (
+            AsyncOpenAI()
+            if uses_default_model and openai_config.is_configured
+            else None
+        )
+        self.warmup = Warmup(model_client=model_client)
+        await self.warmup.run(self.orchestrator)
+
+    async def stop(self) -> None:
+        """Undo warm-up's process-wide changes (called by WorkerPool on shutdown)."""
+        if self.warmup is not None:
+            self.warmup.shutdown()
+
+    async def handle(self, session_id: str, query: str) -> str:
+        """
+        Answer a query in the context of its session.
+
+        Args:
+            session_id: Conversation/session identifier
+            query: User query
+
+        Returns:
+            str: Final response text
+
+        Raises:
+            LoadShedError: If admission control sheds the request
+            TokenBudgetExceeded: If the request used up TOKEN_BUDGET_PER_REQUEST
+        """
+        history = self.histories.get(session_id, [])
+        with session_scope(session_id):
+            if self.admission is None:
+                response = await self._run(history, query)
+            else:
+                priority = classify_priority(query, in_conversation=bool(history))
+                async with self.admission.admit(priority):
+                    response = await self._run(history, query)
+
+        history.append({"query": query, "response": response})
+        del history[: -self.history_turns]
+        self.histories[session_id] = history
+        self.histories.move_to_end(session_id)
+        while len(self.histories) > self.max_sessions:
+            self.histories.popitem(last=False)
+        return response
+
+    async def _run(self, history: List[Dict[str, str]], query: str) -> str:
+        with usage_scope() as usage:
+            try:
+                result = await Runner.run(
+                    self.orchestrator,
+                    build_context_aware_query(history, query),
+                    run_config=self.run_config,
+                    hooks=usage_hooks,
+                )
+            except TokenBudgetExceeded:
+                self.usage_metrics.record(usage, budget_exceeded=True)
+                raise
+        self.usage_metrics.record(usage)
+        return str(result.final_output)
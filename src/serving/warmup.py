@@ -0,0 +1,250 @@
+"""
+Startup Warm-up
+
+Pays the one-time costs of a fresh process before the first query does:
+building the agent graph, resolving DNS and opening pooled connections to the
+Parts API and the model endpoint. A readiness flag is set when warm-up finishes
+so serving entry points can gate on it.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from agents import Agent, set_default_openai_client
+
+from ..agents.orchestrator_agent import create_orchestrator
+from ..api.client import api_client
+from ..api.config import api_config
+
+
+class DNSCache:
+    """
+    Caches ``socket.getaddrinfo`` results of known hosts for a fixed TTL once
+    installed. Lookups of any other host go straight to the original resolver.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+        hosts: Iterable[str] = (),
+        max_entries: int = 64,
+    ):
+        """
+        Initialize the cache (not installed).
+
+        Args:
+            ttl_seconds: How long a resolution is reused
+            clock: Time source (injectable for tests)
+            hosts: Hosts whose lookups are cached (``resolve`` adds more)
+            max_entries: Cached lookups kept; the oldest is dropped beyond it
+        """
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.hosts = set(hosts)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._original: Optional[Callable[..., Any]] = None
+
+    @property
+    def installed(self) -> bool:
+        """Whether lookups currently go through the cache."""
+        return self._original is not None
+
+    def install(self) -> None:
+        """Route ``socket.getaddrinfo`` (used by requests and httpx) through the cache."""
+        if self._original is None:
+            self._original = socket.getaddrinfo
+            socket.getaddrinfo = self.getaddrinfo
+
+    def uninstall(self) -> None:
+        """Restore the original resolver."""
+        if self._original is not None:
+            socket.getaddrinfo = self._original
+            self._original = None
+
+    def resolve(self, host: str, port: int) -> None:
+        """Cache a host and resolve it ahead of time so the first connection skips DNS."""
+        self.hosts.add(host)
+        self.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+
+    def getaddrinfo(self, host, port, *args, **kwargs):
+        """Drop-in ``socket.getaddrinfo`` that reuses fresh results of known hosts."""
+        resolver = self._original or socket.getaddrinfo
+        if host not in self.hosts:
+            return resolver(host, port, *args, **kwargs)
+        key = (host, port, args, tuple(sorted(kwargs.items())))
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] < self.ttl_seconds:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        result = resolver(host, port, *args, **kwargs)
+        with self._lock:
+            self._entries[key] = (now, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+
+@dataclass
+class WarmupReport:
+    """What warm-up did and how long each step took."""
+
+    timings: Dict[str, float] = field(default_factory=dict)
+    api_connections: int = 0
+    model_connections: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class Warmup:
+    """Runs the warm-up steps once and exposes a readiness flag."""
+
+    def __init__(
+        self,
+        client=None,
+        connections: Optional[int] = None,
+        model_client=None,
+        dns_cache: Optional[DNSCache] = None,
+    ):
+        """
+        Initialize warm-up.
+
+        Args:
+            client: APIClient whose pool is filled (global client if None)
+            connections: Connections to open per endpoint (WARMUP_CONNECTIONS if None)
+            model_client: Optional AsyncOpenAI client to warm; it is also installed
+                as the SDK default client so agent runs reuse its connections
+            dns_cache: DNS cache to install for the API and model hosts (one with
+                WARMUP_DNS_TTL_SECONDS if None; a TTL of 0 disables caching).
+                ``shutdown`` uninstalls it.
+        """
+        self.client = client or api_client
+        self.connections = (
+            api_config.warmup_connections if connections is None else connections
+        )
+        self.model_client = model_client
+        if dns_cache is None and api_config.warmup_dns_ttl > 0:
+            dns_cache = DNSCache(api_config.warmup_dns_ttl)
+        self.dns_cache = dns_cache
+        self.orchestrator: Optional[Agent] = None
+        self.report = WarmupReport()
+        self._ready = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm-up has finished."""
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until warm-up has finished; returns False on timeout."""
+        return self._ready.wait(timeout)
+
+    async def run(self, orchestrator: Optional[Agent] = None) -> WarmupReport:
+        """
+        Run every warm-up step and mark the process ready.
+
+        Connection failures are recorded in the report rather than raised, so an
+        unreachable endpoint delays readiness by at most its timeout.
+
+        Args:
+            orchestrator: Already built orchestrator (one is built if None)
+
+        Returns:
+            WarmupReport: Timings and results of each step
+        """
+        with self._step("agent_graph"):
+            self.orchestrator = orchestrator or create_orchestrator()
+
+        if self.dns_cache is not None:
+            with self._step("dns"):
+                self.dns_cache.install()
+                for url in self._urls():
+                    self._resolve(url)
+
+        if self.connections > 0:
+            with self._step("api_connections"):
+                self.report.api_connections = (
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self._open_api_connections
+                    )
+                )
+            if self.model_client is not None:
+                with self._step("model_connections"):
+                    self.report.model_connections = await self._open_model_connections()
+
+        self._ready.set()
+        return self.report
+
+    def shutdown(self) -> None:
+        """Undo process-wide changes made by warm-up (the DNS cache)."""
+        if self.dns_cache is not None:
+            self.dns_cache.uninstall()
+
+    def _urls(self) -> List[str]:
+        urls = list(self.client.base_urls)
+        if self.model_client is not None:
+            urls.append(str(self.model_client.base_url))
+        return urls
+
+    def _resolve(self, url: str) -> None:
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        try:
+            self.dns_cache.resolve(parts.hostname, port)
+        except OSError as e:
+            self.report.errors.append(f"dns {parts.hostname}: {e}")
+
+    def _open_api_connections(self) -> int:
+        """Open connections concurrently so each lands in the pool separately."""
+        settings = self.client.endpoint_config.defaults
+
+        def connect(base_url: str) -> bool:
+            try:
+                # Any answer (even 403/404 from the gateway root) leaves a pooled connection
+                self.client.session.head(base_url, timeout=settings.timeout)
+                return True
+            except Exception as e:
+                self.report.errors.append(f"api: {type(e).__name__}: {e}")
+                return False
+
+        count = min(self.connections, settings.pool_size)
+        # Every base URL of a multi-region pool gets its own connections
+        urls = [url for url in self.client.base_urls for _ in range(count)]
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return sum(executor.map(connect, urls))
+
+    async def _open_model_connections(self) -> int:
+        async def connect() -> bool:
+            try:
+                await self.model_client.models.list()
+                return True
+            except Exception as e:
+                self.report.errors.append(f"model: {type(e).__name__}: {e}")
+                return False
+
+        results = await asyncio.gather(*(connect() for _ in range(self.connections)))
+        set_default_openai_client(self.model_client)
+        return sum(results)
+
+    @contextmanager
+    def _step(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.report.timings[name] = time.perf_counter() - start
@@ -0,0 +1,343 @@
+"""
+Worker Pool
+
+Runs the agent graph in N worker processes so JSON handling, prompt building
+and logging aren't serialized on one GIL. A dispatcher routes every session ID
+to the same worker, keeping conversation state local, and restarts workers
+that crash, backing off from (and eventually giving up on) workers that crash
+before they are ready.
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Request ID of the message a worker sends once it is ready to serve
+READY = -1
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised for requests that were in flight on a worker that died."""
+
+
+class WorkerRequestError(RuntimeError):
+    """Raised when the session handler fails inside a worker."""
+
+
+class WorkerUnavailableError(RuntimeError):
+    """Raised for requests to a worker that kept crashing on startup."""
+
+
+def _worker_main(
+    index: int, handler_factory: Callable[[], Any], requests, responses
+) -> None:
+    """Process entry point: build the handler and serve requests until told to stop."""
+    asyncio.run(_serve(index, handler_factory, requests, responses))
+
+
+async def _serve(
+    index: int, handler_factory: Callable[[], Any], requests, responses
+) -> None:
+    """
+    Warm up, report ready, then serve requests concurrently, one at a time per
+    session. A session's lock only lives while it has requests in the worker.
+    """
+    # Each worker builds its own agent graph and connection pool
+    handler = handler_factory()
+    if hasattr(handler, "start"):
+        await handler.start()
+    responses.put((READY, index, os.getpid()))
+    loop = asyncio.get_running_loop()
+    session_locks: Dict[str, asyncio.Lock] = {}
+    waiting: Dict[str, int] = defaultdict(int)
+    tasks = set()
+
+    async def handle(request_id: int, session_id: str, query: str) -> None:
+        lock = session_locks.setdefault(session_id, asyncio.Lock())
+        waiting[session_id] += 1
+        try:
+            async with lock:
+                try:
+                    result = await handler.handle(session_id, query)
+                    responses.put((request_id, True, result))
+                except Exception as e:
+                    responses.put((request_id, False, f"{type(e).__name__}: {e}"))
+        finally:
+            waiting[session_id] -= 1
+            if not waiting[session_id]:
+                del waiting[session_id], session_locks[session_id]
+
+    while True:
+        item = await loop.run_in_executor(None, requests.get)
+        if item is None:
+            break
+        task = asyncio.ensure_future(handle(*item))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    if hasattr(handler, "stop"):
+        await handler.stop()
+
+
+class WorkerPool:
+    """Pool of agent worker processes with sticky session routing."""
+
+    def __init__(
+        self,
+        handler_factory: Callable[[], Any],
+        num_workers: Optional[int] = None,
+        monitor_interval: float = 0.5,
+        start_method: Optional[str] = None,
+        restart_backoff: float = 0.5,
+        max_restart_backoff: float = 30.0,
+        max_startup_failures: int = 5,
+    ):
+        """
+        Initialize the pool (workers are started by ``start``).
+
+        Args:
+            handler_factory: Picklable callable run inside each worker that returns
+                an object with ``async handle(session_id, query) -> str``
+                (and optionally ``async start()`` / ``async stop()``)
+            num_workers: Number of worker processes (defaults to the CPU count)
+            monitor_interval: Seconds between worker liveness checks
+            start_method: multiprocessing start method (platform default if None)
+            restart_backoff: Delay before restarting a worker that crashed before it
+                was ready, doubled for each further crash in a row
+            max_restart_backoff: Upper bound for the restart delay
+            max_startup_failures: Crashes before ready in a row after which a worker
+                is no longer restarted and its sessions are refused
+        """
+        self.handler_factory = handler_factory
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.monitor_interval = monitor_interval
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.max_startup_failures = max_startup_failures
+        self.restarts = 0
+        self._ctx = multiprocessing.get_context(start_method)
+        self._responses = self._ctx.Queue()
+        self._requests: List[Any] = [None] * self.num_workers
+        self._processes: List[Any] = [None] * self.num_workers
+        self._pending: Dict[int, Tuple[int, Future]] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._ready: Dict[int, int] = {}
+        self._all_ready = threading.Condition(self._lock)
+        self._startup_failures: Dict[int, int] = defaultdict(int)
+        self._respawn_at: Dict[int, float] = {}
+        self._failed: Dict[int, str] = {}
+
+    def worker_for(self, session_id: str) -> int:
+        """
+        Pick the worker that owns a session.
+
+        Args:
+            session_id: Conversation/session identifier
+
+        Returns:
+            int: Worker index (stable across processes and restarts)
+        """
+        return zlib.crc32(session_id.encode()) % self.num_workers
+
+    def worker_pid(self, index: int) -> Optional[int]:
+        """Return the PID of a worker process."""
+        process = self._processes[index]
+        return process.pid if process else None
+
+    @property
+    def ready(self) -> bool:
+        """Whether every worker has finished warm-up and is serving."""
+        with self._lock:
+            return self._all_workers_ready()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every worker is ready (e.g. before accepting traffic).
+
+        Args:
+            timeout: Maximum seconds to wait (forever if None)
+
+        Returns:
+            bool: False if the timeout expired first or a worker was given up on
+        """
+        with self._all_ready:
+            self._all_ready.wait_for(
+                lambda: self._all_workers_ready() or self._failed, timeout
+            )
+            return self._all_workers_ready()
+
+    def _all_workers_ready(self) -> bool:
+        return all(
+            self._ready.get(index) == self.worker_pid(index)
+            for index in range(self.num_workers)
+        )
+
+    def start(self) -> "WorkerPool":
+        """Start all workers plus the response collector and crash monitor threads."""
+        for index in range(self.num_workers):
+            self._spawn(index)
+        for target in (self._collect, self._monitor):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def submit(self, session_id: str, query: str) -> Future:
+        """
+        Dispatch a query to the worker that owns the session.
+
+        Args:
+            session_id: Conversation/session identifier
+            query: User query
+
+        Returns:
+            Future: Resolves to the response text
+
+        Raises:
+            RuntimeError: If the pool hasn't been started
+            WorkerUnavailableError: If the session's worker kept crashing on startup
+        """
+        index = self.worker_for(session_id)
+        future: Future = Future()
+        with self._lock:
+            if self._requests[index] is None:
+                raise RuntimeError(
+                    "WorkerPool is not started; call start() or use it as a "
+                    "context manager"
+                )
+            if index in self._failed:
+                raise WorkerUnavailableError(self._failed[index])
+            request_id = next(self._ids)
+            self._pending[request_id] = (index, future)
+            self._requests[index].put((request_id, session_id, query))
+        return future
+
+    async def run(self, session_id: str, query: str) -> str:
+        """Dispatch a query and await the response."""
+        return await asyncio.wrap_future(self.submit(session_id, query))
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Drain in-flight requests and stop every worker."""
+        self._stopping.set()
+        with self._lock:
+            for requests in self._requests:
+                requests.put(None)
+        for process in self._processes:
+            if process is None:
+                continue
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._responses.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _spawn(self, index: int, requests=None) -> None:
+        # A fresh queue so a restarted worker never sees requests already failed
+        requests = requests or self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(index, self.handler_factory, requests, self._responses),
+            name=f"agent-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        self._requests[index] = requests
+        self._processes[index] = process
+
+    def _collect(self) -> None:
+        while True:
+            item = self._responses.get()
+            if item is None:
+                return
+            if item[0] == READY:
+                _, index, pid = item
+                with self._all_ready:
+                    self._ready[index] = pid
+                    self._all_ready.notify_all()
+                continue
+            request_id, ok, payload = item
+            with self._lock:
+                entry = self._pending.pop(request_id, None)
+            # The caller may have cancelled (e.g. a timed-out ``run``)
+            if entry is None or not entry[1].set_running_or_notify_cancel():
+                continue
+            if ok:
+                entry[1].set_result(payload)
+            else:
+                entry[1].set_exception(WorkerRequestError(payload))
+
+    def _monitor(self) -> None:
+        while not self._stopping.wait(self.monitor_interval):
+            for index, process in enumerate(self._processes):
+                if self._stopping.is_set():
+                    break
+                if index in self._failed:
+                    continue
+                if index in self._respawn_at:
+                    if time.monotonic() >= self._respawn_at[index]:
+                        with self._lock:
+                            del self._respawn_at[index]
+                            self._spawn(index, self._requests[index])
+                            self.restarts += 1
+                    continue
+                if not process.is_alive():
+                    self._restart(index, process)
+
+    def _restart(self, index: int, process) -> None:
+        """Fail a dead worker's in-flight requests and replace it, or give up on it."""
+        error: Exception = WorkerCrashedError(
+            f"Worker {index} exited with code {process.exitcode}"
+        )
+        with self._lock:
+            if self._ready.get(index) == process.pid:
+                self._startup_failures[index] = 0
+            else:
+                self._startup_failures[index] += 1
+            failures = self._startup_failures[index]
+
+            if failures >= self.max_startup_failures:
+                self._failed[index] = (
+                    f"Worker {index} crashed on startup {failures} times in a row; "
+                    "not restarting it"
+                )
+                error = WorkerUnavailableError(self._failed[index])
+                self._all_ready.notify_all()
+            elif failures:
+                # Requests submitted while the worker is down wait in the new queue
+                self._requests[index] = self._ctx.Queue()
+                delay = self.restart_backoff * 2 ** (failures - 1)
+                self._respawn_at[index] = time.monotonic() + min(
+                    delay, self.max_restart_backoff
+                )
+            else:
+                self._spawn(index)
+                self.restarts += 1
+
+            failed = [
+                request_id
+                for request_id, (owner, _) in self._pending.items()
+                if owner == index
+            ]
+            futures = [self._pending.pop(request_id)[1] for request_id in failed]
+        for future in futures:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
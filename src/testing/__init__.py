@@ -0,0 +1,19 @@
+"""Local Parts API and model stubs for tests, benchmarks and offline examples."""
+
+from .stubs import (
+    DEFAULT_RESPONSES,
+    FakeModel,
+    LocalAPIStub,
+    ToolThenAnswerModel,
+    function_call,
+    message,
+)
+
+__all__ = [
+    "DEFAULT_RESPONSES",
+    "FakeModel",
+    "LocalAPIStub",
+    "ToolThenAnswerModel",
+    "function_call",
+    "message",
+]
@@ -0,0 +1,305 @@
+"""
+Local Stubs
+
+Local stand-ins for the Parts API and the LLM so agent flows can be exercised
+end-to-end without network access or API keys. Shared by the tests, benchmarks
+and examples.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from agents import Model, ModelResponse, Usage
+from openai.types.responses import (
+    ResponseFunctionToolCall,
+    ResponseOutputMessage,
+    ResponseOutputText,
+)
+
+# Canned bodies for every endpoint the tools call
+DEFAULT_RESPONSES: Dict[str, Dict[str, Any]] = {
+    "/parts/status": {
+        "statusCode": 200,
+        "body": {
+            "partOrderDetails": {
+                "orderNumber": "W174191",
+                "status": "Shipped",
+                "partsDetail": [],
+                "customer": {"zip": "60179"},
+            },
+            "message": "Order found",
+        },
+    },
+    "/parts/refundstatus": {
+        "statusCode": 200,
+        "body": {"refundStatus": "Processed", "refundDetails": [], "message": "ok"},
+    },
+    "/parts/lookup": {
+        "statusCode": 200,
+        "body": {
+            "message": {
+                "title": "Pl Spring",
+                "number": "1366",
+                "pricing": {"price": 9.99},
+                "models": {"number": "3352573"},
+            }
+        },
+    },
+    "/subscription/lookup": {
+        "statusCode": 200,
+        "body": {"subscriptionDetails": [], "message": "Subscriptions found"},
+    },
+    "/subscription/cancel": {
+        "statusCode": 200,
+        "body": {"message": "Subscription canceled successfully."},
+    },
+    "/subscription/edit": {
+        "statusCode": 200,
+        "body": {"message": "Frequency updated successfully."},
+    },
+}
+
+
+class LocalAPIStub:
+    """
+    Threaded HTTP server that mimics the Parts API Gateway.
+
+    Each endpoint answers with a canned body after an optional injected delay,
+    unless a ``responder`` supplies the body and delay for the request. Every
+    request is recorded as ``(path, payload, headers)`` in ``calls``.
+    """
+
+    def __init__(
+        self,
+        delays: Optional[Dict[str, float]] = None,
+        responses: Optional[Dict[str, Dict[str, Any]]] = None,
+        responder: Optional[
+            Callable[[str, Dict[str, Any]], Optional[Tuple[Dict[str, Any], float]]]
+        ] = None,
+    ):
+        """
+        Initialize the stub server (not started).
+
+        Args:
+            delays: Optional per-path latency in seconds
+            responses: Optional per-path response bodies overriding the defaults
+            responder: Optional ``(path, payload) -> (body, delay)`` consulted
+                first; returning None falls back to the canned responses
+        """
+        self.delays = dict(delays or {})
+        self.responses = dict(DEFAULT_RESPONSES)
+        self.responses.update(responses or {})
+        self.responder = responder
+        self.calls: List[Tuple[str, Dict[str, Any], Dict[str, str]]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as ``APIConfig.base_url``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def calls_to(self, path: str) -> int:
+        """Count the requests received for a path."""
+        with self._lock:
+            return sum(1 for call in self.calls if call[0] == path)
+
+    def start(self) -> "LocalAPIStub":
+        """Start serving on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "LocalAPIStub":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with stub._lock:
+                    stub.calls.append((self.path, payload, dict(self.headers)))
+
+                answer = stub.responder and stub.responder(self.path, payload)
+                if answer is not None:
+                    body, delay = answer
+                else:
+                    body = stub.responses.get(self.path)
+                    delay = stub.delays.get(self.path, 0.0)
+                time.sleep(delay)
+
+                status = 200 if body is not None else 404
+                data = json.dumps(body or {"message": "Not found"}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def function_call(
+    name: str, arguments: Dict[str, Any], call_id: str
+) -> ResponseFunctionToolCall:
+    """Build a model output item requesting a function tool call."""
+    return ResponseFunctionToolCall(
+        id=call_id,
+        call_id=call_id,
+        type="function_call",
+        name=name,
+        arguments=json.dumps(arguments),
+    )
+
+
+def message(text: str) -> ResponseOutputMessage:
+    """Build a final assistant message output item."""
+    return ResponseOutputMessage(
+        id="msg",
+        type="message",
+        role="assistant",
+        status="completed",
+        content=[ResponseOutputText(text=text, type="output_text", annotations=[])],
+    )
+
+
+Turn = Union[List[Any], Callable[[Any], List[Any]]]
+
+
+class FakeModel(Model):
+    """
+    Scripted model that replays a fixed sequence of turns.
+
+    Each turn is either a list of output items or a callable that receives the
+    model input and returns the items. The last turn repeats once the script
+    is exhausted.
+    """
+
+    def __init__(
+        self,
+        turns: List[Turn],
+        latency: float = 0.0,
+        usage: Optional[Usage] = None,
+    ):
+        self.turns = turns
+        self.latency = latency
+        self.usage = usage
+        self.inputs: List[Any] = []
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+        **kwargs,
+    ) -> ModelResponse:
+        index = min(len(self.inputs), len(self.turns) - 1)
+        self.inputs.append(input)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        turn = self.turns[index]
+        output = turn(input) if callable(turn) else list(turn)
+        return ModelResponse(
+            output=output, usage=self.usage or Usage(), response_id=None
+        )
+
+    async def stream_response(self, *args, **kwargs):
+        raise NotImplementedError("FakeModel does not support streaming")
+        yield  # pragma: no cover
+
+
+class ToolThenAnswerModel(Model):
+    """
+    Stateless fake model usable by every agent in the graph at once.
+
+    On a fresh input it calls the first of the agent's tools that has scripted
+    arguments; once the input contains a tool result it answers with text.
+    Optional ``cpu_seconds`` burns CPU per call to emulate prompt building.
+    """
+
+    def __init__(
+        self,
+        arguments: Dict[str, Dict[str, Any]],
+        latency: float = 0.0,
+        cpu_seconds: float = 0.0,
+        usage: Optional[Usage] = None,
+    ):
+        self.arguments = arguments
+        self.latency = latency
+        self.cpu_seconds = cpu_seconds
+        self.usage = usage
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        *,
+        previous_response_id=None,
+        conversation_id=None,
+        prompt=None,
+        **kwargs,
+    ) -> ModelResponse:
+        if self.cpu_seconds:
+            deadline = time.perf_counter() + self.cpu_seconds
+            while time.perf_counter() < deadline:
+                pass
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        items = input if isinstance(input, list) else []
+        answered = any(
+            isinstance(item, dict) and item.get("type") == "function_call_output"
+            for item in items
+        )
+        output: List[Any] = [message("done")]
+        if not answered:
+            for tool in tools:
+                if tool.name in self.arguments:
+                    output = [
+                        function_call(
+                            tool.name, self.arguments[tool.name], f"call_{tool.name}"
+                        )
+                    ]
+                    break
+        return ModelResponse(
+            output=output, usage=self.usage or Usage(), response_id=None
+        )
+
+    async def stream_response(self, *args, **kwargs):
+        raise NotImplementedError("ToolThenAnswerModel does not support streaming")
+        yield  # pragma: no cover
@@ -7,10 +7,11 @@ Function tools for handling order status and refund inquiries.
 from typing import Dict
 from agents import function_tool
 from ..api.client import api_client
+from ..api.models import OrderStatusResponse, RefundStatusResponse
 
 
 @function_tool
-def parts_get_order_status_tool(order_no: str, zip: str = "") -> dict:
+async def parts_get_order_status_tool(order_no: str, zip: str = "") -> str:
     """
     Fetch the status of a parts order by order number and optionally a zip code.
 
@@ -27,18 +28,15 @@ def parts_get_order_status_tool(order_no: str, zip: str = "") -> dict:
         zip (str, optional): Zip code to validate and filter the order only when multiple orders are found "".
 
     Returns:
-        dict: The API response, which includes:
+        str: Compact JSON (empty fields omitted):
             {
-                "statusCode": int,  # 200 (OK), 201 (Multiple matches), or 404 (Not found)
-                "body": {
-                    "partOrderDetails": {
-                        "orderNumber": str,
-                        "status": str,
-                        "partsDetail": [...],
-                        "customer": {...}
-                    },
-                    "message": str
-                }
+                "status_code": int,  # 200 (OK), 201 (Multiple matches), or 404 (Not found)
+                "message": str,
+                "order_number": str,
+                "status": str,
+                "parts": [...],
+                "customer": {...},
+                "error": str,  # only on failure, with "details"
             }
     """
     payload = {"orderNo": order_no}
@@ -46,13 +44,14 @@ def parts_get_order_status_tool(order_no: str, zip: str = "") -> dict:
         payload["zip"] = zip
 
     try:
-        return api_client.post("/parts/status", payload)
+        response = await api_client.apost("/parts/status", payload)
     except Exception as e:
-        return {"error": str(e)}
+        return OrderStatusResponse.from_error("Unexpected error", str(e)).to_llm()
+    return OrderStatusResponse.from_dict(response).to_llm()
 
 
 @function_tool
-def parts_get_refund_status_tool(order_no: str, zip: str = "") -> dict:
+async def parts_get_refund_status_tool(order_no: str, zip: str = "") -> str:
     """
     Fetch the refund status of a parts order using the order number and optional zip code.
 
@@ -65,22 +64,21 @@ def parts_get_refund_status_tool(order_no: str, zip: str = "") -> dict:
         zip (str, optional): Zip code to help disambiguate if multiple orders exist.
 
     Returns:
-        dict: API response structure as follows:
+        str: Compact JSON (empty fields omitted):
             {
-                "statusCode": 200 | 201 | 404,
-                "body": {
-                    "refundStatus": str,
-                    "refundDetails": [
-                        {
-                            "partNumber": str,
-                            "refundAmount": float,
-                            "refundStatus": str,
-                            "processedDate": str
-                        },
-                        ...
-                    ],
-                    "message": str
-                }
+                "status_code": 200 | 201 | 404,
+                "message": str,
+                "refund_status": str,
+                "refunds": [
+                    {
+                        "partNumber": str,
+                        "refundAmount": float,
+                        "refundStatus": str,
+                        "processedDate": str
+                    },
+                    ...
+                ],
+                "error": str,  # only on failure, with "details"
             }
     """
     payload = {"orderNo": order_no}
@@ -88,6 +86,7 @@ def parts_get_refund_status_tool(order_no: str, zip: str = "") -> dict:
         payload["zip"] = zip
 
     try:
-        return api_client.post("/parts/refundstatus", payload)
+        response = await api_client.apost("/parts/refundstatus", payload)
     except Exception as e:
-        return {"error": str(e)}
+        return RefundStatusResponse.from_error("Unexpected error", str(e)).to_llm()
+    return RefundStatusResponse.from_dict(response).to_llm()
@@ -7,38 +7,52 @@ Function tools for handling parts information and compatibility checks.
 from typing import Optional, Dict
 from agents import function_tool
 from ..api.client import api_client
+from ..api.catalog import part_catalog
+from ..api.models import PartDetailsResponse
 
 
 @function_tool
 def get_part_details_tool(
-    part_number: str, model_number: Optional[str] = None, zip: Optional[str] = None
-) -> dict:
+    part_number: str,
+    model_number: Optional[str] = None,
+    zip: Optional[str] = None,
+    include_pricing: bool = False,
+) -> str:
     """
     Retrieve part details including compatible models and shipping availability.
 
+    Static details and model compatibility are served from the local part catalog
+    when it holds a fresh row; live pricing and zip-based shipping always go to the API.
+
     Args:
         part_number (str): Required. The part number to look up.
         model_number (str, optional): If provided, returns compatibility info for only this model.
         zip (str, optional): If provided, includes available shipping methods for the given ZIP code.
+        include_pricing (bool, optional): Set to true when the customer asks about price
+            or availability, so live pricing is fetched.
 
     Returns:
-        dict: A JSON response with part details, compatible models, and shipping info (if zip provided).
+        str: Compact JSON with part details, compatible models, and shipping info (if zip provided).
               Example:
               {
-                  "statusCode": 200,
-                  "body": {
-                      "message": {
-                          "title": "Pl Spring",
-                          "number": "1366",
-                          "pricing": {...},
-                          "models": {
-                              "number": "3352573"
-                          },
-                          "shipping": [...]
-                      }
-                  }
+                  "status_code": 200,
+                  "part": {
+                      "title": "Pl Spring",
+                      "number": "1366",
+                      "pricing": {...},
+                      "models": {
+                          "number": "3352573"
+                      },
+                      "shipping": [...]
+                  },
+                  "source": "catalog"  # only when answered from the local catalog
               }
     """
+    if part_catalog and not zip and not include_pricing:
+        cached = part_catalog.lookup(part_number, model_number)
+        if cached is not None:
+            return PartDetailsResponse.from_dict(cached).to_llm()
+
     # Build payload dynamically
     payload = {"part_number": part_number}
 
@@ -48,6 +62,9 @@ def get_part_details_tool(
         payload["zip"] = zip
 
     try:
-        return api_client.post("/parts/lookup", payload)
+        response = api_client.post("/parts/lookup", payload)
+        if part_catalog:
+            part_catalog.record_lookup(part_number, response, model_number)
     except Exception as e:
-        return {"statusCode": 500, "error": str(e)}
+        return PartDetailsResponse.from_error("Unexpected error", str(e)).to_llm()
+    return PartDetailsResponse.from_dict(response).to_llm()
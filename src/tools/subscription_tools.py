@@ -7,10 +7,16 @@ Function tools for handling subscription lookups, updates, and cancellations.
 from typing import Dict
 from agents import function_tool
 from ..api.client import api_client
+from ..api.idempotency import (
+    IDEMPOTENCY_HEADER,
+    current_session_id,
+    mutation_dedupe,
+)
+from ..api.models import SubscriptionLookupResponse, SubscriptionUpdateResponse
 
 
 @function_tool
-def parts_subscription_lookup_tool(phone_number: str, membership_id: str) -> dict:
+async def parts_subscription_lookup_tool(phone_number: str, membership_id: str) -> str:
     """
     Fetch the Subscription details for a given membership ID. When membership ID is not provided,
     then retrieves all memberships associated with the phone number passed.
@@ -26,11 +32,11 @@ def parts_subscription_lookup_tool(phone_number: str, membership_id: str) -> dic
         Though both are optional parameters, at least one parameter is expected
 
     Returns:
-        dict: API response structure as follows:
+        str: Compact JSON (empty fields omitted):
            {
-              "statusCode": 200,
-              "body": {
-                "subscriptionDetails": [
+              "status_code": 200,
+              "message": "string", // e.g., "Orders found for phone number ..."
+              "subscriptions": [
                   {
                     "membershipId": "string",
                     "status": "string",                // e.g., "N" (inactive), "A" (active)
@@ -42,22 +48,24 @@ def parts_subscription_lookup_tool(phone_number: str, membership_id: str) -> dic
                     "renewalPeriod": "string",        // e.g., "6" for every 6 months
                     "partsDetail": [...],
                     "customer": {...}
-                    }
                   }
-                ],
-                "message": "string" // e.g., "Orders found for phone number ..."
-            }
+              ],
+              "error": "string" // only on failure, with "details"
+           }
     """
     payload = {"phoneNumber": phone_number, "membershipId": membership_id}
 
     try:
-        return api_client.post("/subscription/lookup", payload)
+        response = await api_client.apost("/subscription/lookup", payload)
     except Exception as e:
-        return {"statusCode": 500, "error": str(e)}
+        return SubscriptionLookupResponse.from_error(
+            "Unexpected error", str(e)
+        ).to_llm()
+    return SubscriptionLookupResponse.from_dict(response).to_llm()
 
 
 @function_tool
-def parts_subscription_cancel_tool(membership_id: str) -> dict:
+async def parts_subscription_cancel_tool(membership_id: str) -> str:
     """
     Cancel a subscription based on the provided membership ID.
 
@@ -65,25 +73,32 @@ def parts_subscription_cancel_tool(membership_id: str) -> dict:
         membership_id (str): The membership ID of the subscription to be canceled.
 
     Returns:
-        dict: The API response indicating success or failure of the cancellation request.
+        str: Compact JSON indicating success or failure of the cancellation request.
               Example:
-              {
-                  "statusCode": 200,
-                  "body": {
-                      "message": "Subscription canceled successfully."
-                  }
-              }
+              {"status_code": 200, "message": "Subscription canceled successfully."}
     """
     payload = {"membershipId": membership_id}
+    key = mutation_dedupe.key(current_session_id.get(), membership_id, "cancel")
 
     try:
-        return api_client.post("/subscription/cancel", payload)
+        # Repeated confirmations/retries in the same session reuse the first result
+        response = await mutation_dedupe.run(
+            key,
+            lambda: api_client.apost(
+                "/subscription/cancel", payload, headers={IDEMPOTENCY_HEADER: key}
+            ),
+        )
     except Exception as e:
-        return {"statusCode": 500, "error": str(e)}
+        return SubscriptionUpdateResponse.from_error(
+            "Unexpected error", str(e)
+        ).to_llm()
+    return SubscriptionUpdateResponse.from_dict(response).to_llm()
 
 
 @function_tool
-def parts_subscription_update_tool(membership_id: str, update: str, value: str) -> dict:
+async def parts_subscription_update_tool(
+    membership_id: str, update: str, value: str
+) -> str:
     """
     Update a subscription's frequency or quantity based on the provided membership ID.
 
@@ -93,28 +108,31 @@ def parts_subscription_update_tool(membership_id: str, update: str, value: str)
         value (str): The new value for the selected update type.
 
     Returns:
-        dict: The API response indicating success or failure.
+        str: Compact JSON indicating success or failure.
               Example:
-              {
-                  "statusCode": 200,
-                  "body": {
-                      "message": "Frequency updated successfully."
-                  }
-              }
+              {"status_code": 200, "message": "Frequency updated successfully."}
     """
     if update not in ["frequency", "quantity"]:
-        return {
-            "statusCode": 400,
-            "error": "Invalid update type. Must be 'frequency' or 'quantity'.",
-        }
+        return SubscriptionUpdateResponse.from_error(
+            "Invalid update type. Must be 'frequency' or 'quantity'.", status_code=400
+        ).to_llm()
 
     payload = {
         "membershipId": membership_id,
         "update": update,
         update: value,  # Dynamically sets either 'frequency': value or 'quantity': value
     }
+    key = mutation_dedupe.key(current_session_id.get(), membership_id, update, value)
 
     try:
-        return api_client.post("/subscription/edit", payload)
+        response = await mutation_dedupe.run(
+            key,
+            lambda: api_client.apost(
+                "/subscription/edit", payload, headers={IDEMPOTENCY_HEADER: key}
+            ),
+        )
     except Exception as e:
-        return {"statusCode": 500, "error": str(e)}
+        return SubscriptionUpdateResponse.from_error(
+            "Unexpected error", str(e)
+        ).to_llm()
+    return SubscriptionUpdateResponse.from_dict(response).to_llm()
@@ -0,0 +1,46 @@
+"""
+Entity Extraction
+
+Regex-based extraction of the identifiers customers put in their queries.
+"""
+
+import re
+from typing import Dict, List
+
+# Order numbers look like W174191 / E001861
+ORDER_PATTERN = re.compile(r"\b([A-Z]\d{6})\b")
+ZIP_PATTERN = re.compile(r"\bzip(?:\s*code)?\s*[:#]?\s*(\d{5})\b", re.IGNORECASE)
+MEMBERSHIP_PATTERN = re.compile(
+    r"\bmembership(?:\s*(?:id|number|no\.?|#))?\s*[:#]?\s*(\d{6,})\b", re.IGNORECASE
+)
+PHONE_PATTERN = re.compile(r"\b(\d{3}[-.\s]\d{3}[-.\s]\d{4})\b")
+PART_PATTERN = re.compile(
+    r"\bpart(?:\s+number|\s+no\.?|\s*#)?\s*:?\s+([A-Za-z0-9-]*\d[A-Za-z0-9-]*)",
+    re.IGNORECASE,
+)
+MODEL_PATTERN = re.compile(
+    r"\bmodel(?:\s+number|\s+no\.?|\s*#)?\s*:?\s+([A-Za-z0-9-]*\d[A-Za-z0-9-]*)",
+    re.IGNORECASE,
+)
+
+
+def extract_entities(query: str) -> Dict[str, List[str]]:
+    """
+    Extract identifiers from a query.
+
+    Args:
+        query: User query text
+
+    Returns:
+        dict: Lists of ``order_numbers``, ``zips``, ``membership_ids``,
+              ``phone_numbers``, ``part_numbers`` and ``model_numbers`` in the
+              order they appear
+    """
+    return {
+        "order_numbers": ORDER_PATTERN.findall(query),
+        "zips": ZIP_PATTERN.findall(query),
+        "membership_ids": MEMBERSHIP_PATTERN.findall(query),
+        "phone_numbers": PHONE_PATTERN.findall(query),
+        "part_numbers": PART_PATTERN.findall(query),
+        "model_numbers": MODEL_PATTERN.findall(query),
+    }
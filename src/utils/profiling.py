@@ -0,0 +1,370 @@
+"""
+Profiling Utilities
+
+Opt-in profiling for the CLI and batch runner. A sampling profiler (default)
+records the stacks of every thread at a fixed interval and attributes each
+sample to a stage (routing, specialist, tool, HTTP, logging); cProfile mode
+records exact call counts for the calling thread. Nothing is imported or
+started unless profiling is requested. Time spent inside ``idle_wait`` (e.g. an
+interactive prompt) is not counted as work.
+"""
+
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+# (filename fragment, function name or None for any) -> stage. Checked in order
+# of precedence: a sample belongs to the highest-precedence stage on its stack.
+STAGE_RULES: List[Tuple[str, Tuple[str, Optional[str]]]] = [
+    ("http", (f"{os.sep}requests{os.sep}", None)),
+    ("http", (f"{os.sep}urllib3{os.sep}", None)),
+    ("http", (f"{os.sep}httpx{os.sep}", None)),
+    ("http", (f"{os.sep}httpcore{os.sep}", None)),
+    ("http", (f"{os.sep}ssl.py", None)),
+    ("http", (f"{os.sep}socket.py", None)),
+    ("logging", (f"{os.sep}logging{os.sep}", None)),
+    ("tool", (f"src{os.sep}tools{os.sep}", None)),
+    ("tool", (f"src{os.sep}api{os.sep}", None)),
+    ("specialist", ("orchestrator_agent.py", "parts_support_tool")),
+    ("specialist", ("orchestrator_agent.py", "parts_sales_tool")),
+    ("routing", (f"{os.sep}agents{os.sep}", None)),
+    ("routing", (f"{os.sep}openai{os.sep}", None)),
+]
+STAGES = ("http", "logging", "tool", "specialist", "routing", "other")
+
+# Leaf frames of threads that are waiting for work rather than doing any
+IDLE_LEAVES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("<idle>", "idle_wait"),  # appended to samples of threads inside idle_wait
+}
+# The same waits as cProfile names the builtins
+IDLE_BUILTINS = (
+    "<method 'poll' of 'select.",
+    "<method 'select' of 'select.",
+    "<method 'acquire' of '_thread.",
+)
+IDLE_WAIT_FRAME = ("<idle>", "idle_wait", 0)
+
+# Threads currently inside ``idle_wait``, and the running cProfile profiler
+_idle_threads: Set[int] = set()
+_active_cprofile: Optional[Any] = None
+
+Frame = Tuple[str, str, int]  # (filename, function, first line)
+
+_NO_RULE = len(STAGE_RULES)
+
+
+def _is_idle(frame: Frame) -> bool:
+    filename, name, _ = frame
+    return (os.path.basename(filename), name) in IDLE_LEAVES or name.startswith(
+        IDLE_BUILTINS
+    )
+
+
+def _rule_index(frame: Frame) -> int:
+    """Precedence of the first stage rule matching a frame (``_NO_RULE`` if none)."""
+    filename, name, _ = frame
+    for index, (_, (fragment, function)) in enumerate(STAGE_RULES):
+        if fragment in filename and (function is None or function == name):
+            return index
+    return _NO_RULE
+
+
+def _stage(rule_index: int) -> str:
+    return STAGE_RULES[rule_index][0] if rule_index < _NO_RULE else "other"
+
+
+def classify_stage(stack: Sequence[Frame]) -> str:
+    """
+    Attribute a stack (root first) to a pipeline stage.
+
+    Args:
+        stack: Frames as ``(filename, function, first line)``
+
+    Returns:
+        str: One of ``STAGES``, or 'idle' for threads waiting for work
+    """
+    if stack and _is_idle(stack[-1]):
+        return "idle"
+    return _stage(min((_rule_index(frame) for frame in stack), default=_NO_RULE))
+
+
+@contextmanager
+def idle_wait() -> Iterator[None]:
+    """
+    Mark the calling thread as waiting rather than working, e.g. at an
+    interactive prompt, so the wait shows up as idle instead of 'other'.
+    cProfile is paused for the duration.
+    """
+    ident = threading.get_ident()
+    profiler = _active_cprofile
+    _idle_threads.add(ident)
+    if profiler is not None:
+        profiler.disable()
+    try:
+        yield
+    finally:
+        _idle_threads.discard(ident)
+        if profiler is not None:
+            profiler.enable()
+
+
+def frame_label(frame: Frame) -> str:
+    """Readable ``module:function`` label used in summaries and collapsed stacks."""
+    filename, function, _ = frame
+    module = os.path.splitext(os.path.basename(filename))[0]
+    return f"{module}:{function}"
+
+
+@dataclass
+class ProfileReport:
+    """Aggregated profile: per-stage time, hot functions and raw stacks."""
+
+    mode: str
+    stages: Dict[str, float] = field(default_factory=dict)
+    # (label, self time, total time) sorted by self time
+    functions: List[Tuple[str, float, float]] = field(default_factory=list)
+    stacks: Counter = field(default_factory=Counter)
+    unit: str = "samples"
+
+    def summary(self, top_n: int = 20) -> str:
+        """Format the per-stage breakdown and the top-N hot functions."""
+        total = sum(v for k, v in self.stages.items() if k != "idle") or 1
+        lines = ["=" * 70, f"Profile ({self.mode}) by stage", "-" * 70]
+        for stage in STAGES + ("idle",):
+            if stage in self.stages:
+                share = "" if stage == "idle" else f"{self.stages[stage] / total:>8.1%}"
+                lines.append(f"{stage:<12}{self.stages[stage]:>12.3f}{share}")
+        lines += ["-" * 70, f"Top {top_n} functions by self {self.unit}", "-" * 70]
+        lines.append(f"{'Function':<48}{'Self':>11}{'Total':>11}")
+        for label, own, cumulative in self.functions[:top_n]:
+            lines.append(f"{label[:47]:<48}{own:>11.3f}{cumulative:>11.3f}")
+        lines.append("=" * 70)
+        return "\n".join(lines)
+
+    def write_collapsed(self, path: str) -> None:
+        """Write ``frame;frame;frame count`` lines (flamegraph.pl / speedscope)."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{';'.join(frame_label(fr) for fr in stack)} {count}\n")
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads from a background thread."""
+
+    def __init__(self, interval: float = 0.005, include_idle: bool = False):
+        """
+        Initialize the profiler (not started).
+
+        Args:
+            interval: Seconds between samples
+            include_idle: Keep samples of threads that are waiting for work
+        """
+        self.interval = interval
+        self.include_idle = include_idle
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def sample(self) -> None:
+        """Record the current stack of every thread except the profiler's own."""
+        own = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_name, code.co_firstlineno))
+                frame = frame.f_back
+            stack.reverse()
+            if thread_id in _idle_threads:
+                stack.append(IDLE_WAIT_FRAME)
+            self.stacks[tuple(stack)] += 1
+
+    def report(self) -> ProfileReport:
+        """Aggregate the samples, converted to seconds."""
+        report = ProfileReport("sample", unit="seconds")
+        own: Counter = Counter()
+        cumulative: Counter = Counter()
+        for stack, count in self.stacks.items():
+            stage = classify_stage(stack)
+            seconds = count * self.interval
+            report.stages[stage] = report.stages.get(stage, 0.0) + seconds
+            if stage == "idle" and not self.include_idle:
+                continue
+            report.stacks[stack] += count
+            own[frame_label(stack[-1])] += seconds
+            for label in {frame_label(frame) for frame in stack}:
+                cumulative[label] += seconds
+        report.functions = [
+            (label, seconds, cumulative[label]) for label, seconds in own.most_common()
+        ]
+        return report
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+def _caller_weights(callers: Dict[Any, tuple]) -> Dict[Any, float]:
+    """Share of a function's time owed to each caller, from the caller edges."""
+    # Edge tuples are (cc, nc, own time, cumulative time) of calls from that caller
+    for column in (2, 3, 1):
+        total = sum(edge[column] for edge in callers.values())
+        if total > 0:
+            return {c: edge[column] / total for c, edge in callers.items()}
+    return {}
+
+
+def _cprofile_report(stats, iterations: int = 100) -> ProfileReport:
+    """
+    Aggregate cProfile stats: each function's own time is split across stages.
+
+    cProfile keeps caller edges rather than whole stacks, so a function's time is
+    divided among its callers in proportion to the time each edge accounts for,
+    and each share takes the stage of that caller's share (or the function's own
+    stage where it has higher precedence). A helper called only from
+    ``parts_support_tool`` counts as specialist time; ``isinstance`` called a
+    little from ``requests`` and mostly from the agents counts mostly as routing.
+    Recursion makes this an approximation, refined for ``iterations`` rounds.
+    """
+    report = ProfileReport("cprofile", unit="seconds")
+    frames = {func: (func[0], func[2], 0) for func in stats.stats}
+    own_rank = {func: _rule_index(frame) for func, frame in frames.items()}
+    weights = {
+        func: _caller_weights(
+            {c: edge for c, edge in entry[4].items() if c in stats.stats}
+        )
+        for func, entry in stats.stats.items()
+    }
+    # Share of each function's time per stage rule, propagated down the call graph
+    shares: Dict[Any, Dict[int, float]] = {
+        func: {rank: 1.0} for func, rank in own_rank.items()
+    }
+    for _ in range(iterations):
+        updated = {}
+        for func, rank in own_rank.items():
+            if not weights[func]:
+                updated[func] = shares[func]
+                continue
+            mix: Dict[int, float] = {}
+            for caller, weight in weights[func].items():
+                for inherited, share in shares[caller].items():
+                    key = min(inherited, rank)
+                    mix[key] = mix.get(key, 0.0) + weight * share
+            updated[func] = mix
+        if updated == shares:
+            break
+        shares = updated
+
+    rows = []
+    for func, (_, _, own, cumulative, _) in stats.stats.items():
+        frame = frames[func]
+        if _is_idle(frame):
+            report.stages["idle"] = report.stages.get("idle", 0.0) + own
+        else:
+            for rank, share in shares[func].items():
+                stage = _stage(rank)
+                report.stages[stage] = report.stages.get(stage, 0.0) + own * share
+        rows.append((frame_label(frame), own, cumulative))
+    report.functions = sorted(rows, key=lambda row: row[1], reverse=True)
+    return report
+
+
+@contextmanager
+def profiled(
+    mode: Optional[str],
+    output: str = "profile",
+    top_n: int = 20,
+    interval: float = 0.005,
+) -> Iterator[Optional[ProfileReport]]:
+    """
+    Profile a block when ``mode`` is set; do nothing at all otherwise.
+
+    Writes ``<output>.collapsed`` (sample mode) or ``<output>.prof`` (cprofile
+    mode) and prints the stage breakdown and top-N functions on exit.
+
+    Args:
+        mode: 'sample', 'cprofile', or None to disable
+        output: Output path prefix
+        top_n: Number of hot functions in the summary
+        interval: Sampling interval in seconds (sample mode)
+
+    Yields:
+        ProfileReport: Filled in when the block exits (None when disabled)
+    """
+    if not mode:
+        yield None
+        return
+
+    report = ProfileReport(mode)
+    if mode == "cprofile":
+        import cProfile
+        import pstats
+
+        global _active_cprofile
+        profiler = cProfile.Profile()
+        _active_cprofile = profiler
+        profiler.enable()
+        try:
+            yield report
+        finally:
+            profiler.disable()
+            _active_cprofile = None
+            profiler.dump_stats(f"{output}.prof")
+            result = _cprofile_report(pstats.Stats(profiler))
+            print(f"\nProfile written to {output}.prof")
+    elif mode == "sample":
+        sampler = SamplingProfiler(interval)
+        sampler.start()
+        try:
+            yield report
+        finally:
+            sampler.stop()
+            result = sampler.report()
+            result.write_collapsed(f"{output}.collapsed")
+            print(f"\nCollapsed stacks written to {output}.collapsed")
+    else:
+        raise ValueError(f"Unknown profile mode: {mode}")
+
+    for name in ("stages", "functions", "stacks", "unit"):
+        setattr(report, name, getattr(result, name))
+    print(report.summary(top_n))
+
+
+def add_profile_arguments(parser) -> None:
+    """Add ``--profile``, ``--profile-output`` and ``--profile-top`` to an argparse parser."""
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="sample",
+        choices=["sample", "cprofile"],
+        help="Profile the run (sampling profiler by default)",
+    )
+    parser.add_argument(
+        "--profile-output", default="profile", help="Output path prefix for profiles"
+    )
+    parser.add_argument(
+        "--profile-top", type=int, default=20, help="Hot functions in the summary"
+    )
@@ -0,0 +1,279 @@
+"""
+Conversation Recording
+
+Captures full multi-turn sessions so a slow or surprising conversation can be
+replayed locally: each user turn with the model's tool-call decisions, the
+tool outputs fed back to the model, every Parts API call and the timings and
+token usage of all of them. A recording is a gzipped JSON file.
+
+Recording is opt-in: model calls are captured by running agents with a
+``RecordingModelProvider`` and API calls by the API client, both only while a
+recorder's turn is active in the current context.
+"""
+
+import gzip
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from agents import Model, ModelProvider, ModelResponse, OpenAIProvider
+
+FORMAT_VERSION = 1
+
+current_recorder: ContextVar[Optional["ConversationRecorder"]] = ContextVar(
+    "current_recorder", default=None
+)
+
+
+def agent_key(tools: List[Any]) -> str:
+    """
+    Identify the agent behind a model call by its tool names.
+
+    The model interface doesn't see the agent, but each agent in the graph has
+    a distinct tool set, so replay can match calls without relying on prompts
+    (which are exactly what a change under test may edit).
+    """
+    return ",".join(
+        sorted(getattr(tool, "name", type(tool).__name__) for tool in tools)
+    )
+
+
+def input_chars(system_instructions: Optional[str], input: Any) -> int:
+    """Size of a model call's prompt, used to scale recorded token counts."""
+    text = input if isinstance(input, str) else json.dumps(input, default=str)
+    return len(system_instructions or "") + len(text)
+
+
+def _dump_item(item: Any) -> Any:
+    if hasattr(item, "model_dump"):
+        return item.model_dump(mode="json", exclude_none=True)
+    return item
+
+
+@dataclass
+class RecordedTurn:
+    """One user turn and everything the framework did to answer it."""
+
+    query: str
+    input: str = ""
+    output: str = ""
+    latency: float = 0.0
+    error: Optional[str] = None
+    # {"agent", "output", "usage", "latency", "input_chars"} per model call
+    model_calls: List[Dict[str, Any]] = field(default_factory=list)
+    # {"call_id", "name", "output"} per tool result fed back to a model
+    tool_outputs: List[Dict[str, Any]] = field(default_factory=list)
+    # {"endpoint", "payload", "response", "latency"} per Parts API call
+    api_calls: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def tokens(self) -> int:
+        """Total tokens over all model calls of the turn."""
+        return sum(call["usage"]["total_tokens"] for call in self.model_calls)
+
+
+class ConversationRecorder:
+    """Records the turns of one conversation."""
+
+    def __init__(self, session_id: Optional[str] = None):
+        """
+        Initialize an empty recording.
+
+        Args:
+            session_id: Conversation identifier (a random one if None)
+        """
+        self.session_id = session_id or uuid.uuid4().hex
+        self.turns: List[RecordedTurn] = []
+        self._turn: Optional[RecordedTurn] = None
+        self._pending_tools: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def turn(self, query: str, input: str = "") -> Iterator[RecordedTurn]:
+        """
+        Record one turn; model and API calls made inside the block belong to it.
+
+        Set ``output`` on the yielded turn once the response is known.
+
+        Args:
+            query: User query as typed
+            input: Query as sent to the orchestrator (e.g. with history)
+
+        Yields:
+            RecordedTurn: The turn being recorded
+        """
+        turn = RecordedTurn(query, input or query)
+        self._turn = turn
+        token = current_recorder.set(self)
+        start = time.perf_counter()
+        try:
+            yield turn
+        finally:
+            turn.latency = time.perf_counter() - start
+            current_recorder.reset(token)
+            self._turn = None
+            self._pending_tools.clear()
+            self.turns.append(turn)
+
+    def record_model_call(
+        self,
+        system_instructions: Optional[str],
+        input: Any,
+        tools: List[Any],
+        response: ModelResponse,
+        latency: float,
+    ) -> None:
+        """Record a model response and the tool results its input carried."""
+        with self._lock:
+            turn = self._turn
+            if turn is None:
+                return
+            for item in input if isinstance(input, list) else []:
+                if (
+                    isinstance(item, dict)
+                    and item.get("type") == "function_call_output"
+                ):
+                    name = self._pending_tools.pop(item.get("call_id"), None)
+                    if name is not None:
+                        turn.tool_outputs.append(
+                            {
+                                "call_id": item["call_id"],
+                                "name": name,
+                                "output": str(item.get("output")),
+                            }
+                        )
+            output = [_dump_item(item) for item in response.output]
+            for item in output:
+                if isinstance(item, dict) and item.get("type") == "function_call":
+                    self._pending_tools[item["call_id"]] = item["name"]
+            usage = response.usage
+            turn.model_calls.append(
+                {
+                    "agent": agent_key(tools),
+                    "output": output,
+                    "usage": {
+                        "input_tokens": usage.input_tokens,
+                        "output_tokens": usage.output_tokens,
+                        "total_tokens": usage.total_tokens,
+                    },
+                    "latency": latency,
+                    "input_chars": input_chars(system_instructions, input),
+                }
+            )
+
+    def record_api_call(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        response: Dict[str, Any],
+        latency: float,
+    ) -> None:
+        """Record a Parts API call as the tools saw it."""
+        with self._lock:
+            if self._turn is not None:
+                self._turn.api_calls.append(
+                    {
+                        "endpoint": endpoint,
+                        "payload": payload,
+                        "response": response,
+                        "latency": latency,
+                    }
+                )
+
+    def save(self, path: str) -> None:
+        """Write the recording as gzipped JSON."""
+        data = {
+            "version": FORMAT_VERSION,
+            "session_id": self.session_id,
+            "turns": [asdict(turn) for turn in self.turns],
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "ConversationRecorder":
+        """
+        Read a recording written by ``save``.
+
+        Args:
+            path: Recording file
+
+        Returns:
+            ConversationRecorder: Recorder holding the recorded turns
+
+        Raises:
+            ValueError: If the file is from an unsupported format version
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version: {data.get('version')}")
+        recorder = cls(data["session_id"])
+        recorder.turns = [RecordedTurn(**turn) for turn in data["turns"]]
+        return recorder
+
+
+class RecordingModel(Model):
+    """Wraps a model and records its responses to the active recorder."""
+
+    def __init__(self, model: Model):
+        self.model = model
+
+    async def get_response(
+        self,
+        system_instructions,
+        input,
+        model_settings,
+        tools,
+        output_schema,
+        handoffs,
+        tracing,
+        **kwargs,
+    ) -> ModelResponse:
+        start = time.perf_counter()
+        response = await self.model.get_response(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            tracing,
+            **kwargs,
+        )
+        recorder = current_recorder.get()
+        if recorder is not None:
+            recorder.record_model_call(
+                system_instructions,
+                input,
+                tools,
+                response,
+                time.perf_counter() - start,
+            )
+        return response
+
+    def stream_response(self, *args, **kwargs):
+        # Streaming runs aren't recorded
+        return self.model.stream_response(*args, **kwargs)
+
+
+class RecordingModelProvider(ModelProvider):
+    """Model provider that wraps every model it hands out in a ``RecordingModel``."""
+
+    def __init__(self, provider: Optional[ModelProvider] = None):
+        """
+        Initialize the provider.
+
+        Args:
+            provider: Provider resolving model names (OpenAIProvider if None), so
+                each agent keeps its own model tier while recording
+        """
+        self.provider = provider or OpenAIProvider()
+
+    def get_model(self, model_name: Optional[str]) -> Model:
+        return RecordingModel(self.provider.get_model(model_name))
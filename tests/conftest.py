@@ -0,0 +1,29 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.api.client import api_client
+from src.api.config import APIConfig
+from src.api.endpoint_config import EndpointConfig
+from src.testing.stubs import LocalAPIStub
+
+
+@pytest.fixture
+def api_stub(monkeypatch):
+    """
+    Run a local Parts API stub and point the global API client at it.
+
+    The client's endpoint pool (PARTS_API_BASE_URLS) and endpoint config file are
+    replaced too, so every request goes to the stub.
+
+    Tests adjust ``api_stub.delays`` / ``api_stub.responses`` as needed.
+    """
+    with LocalAPIStub() as stub:
+        config = APIConfig()
+        config.base_url = stub.base_url
+        monkeypatch.setattr(api_client, "config", config)
+        monkeypatch.setattr(api_client, "endpoint_pool", None)
+        monkeypatch.setattr(
+            api_client, "endpoint_config", EndpointConfig.from_api_config(config)
+        )
+        yield stub
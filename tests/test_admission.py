@@ -0,0 +1,177 @@
+"""
+Tests for priority admission control.
+"""
+
+import asyncio
+import random
+
+import pytest
+from agents import RunConfig
+
+from src.serving.admission import (
+    AdaptiveLimit,
+    AdmissionController,
+    LoadShedError,
+    Priority,
+    classify_priority,
+)
+from src.serving.session import OrchestratorSessionHandler
+from src.testing.stubs import ToolThenAnswerModel
+
+
+class TestClassifyPriority:
+    """Test intent-based priority classes."""
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("Cancel subscription for membership ID 2237407160", Priority.HIGH),
+            ("Change my delivery frequency to every 3 months", Priority.HIGH),
+            ("Check order status for order W174191 with zip 20020", Priority.NORMAL),
+            ("Get subscription details for membership ID 8282916880", Priority.NORMAL),
+            ("Is part 1366 compatible with model 3352573?", Priority.LOW),
+        ],
+    )
+    def test_new_conversations(self, query, expected):
+        """Test classification of first turns."""
+        assert classify_priority(query) == expected
+
+    def test_mid_conversation_turn_is_high(self):
+        """Test that follow-ups outrank new browsing."""
+        assert classify_priority("60179", in_conversation=True) == Priority.HIGH
+
+
+class TestAdaptiveLimit:
+    """Test the latency-driven concurrency limit."""
+
+    def test_grows_while_latency_is_flat(self):
+        """Test additive increase at baseline latency."""
+        limit = AdaptiveLimit(initial=4)
+        for _ in range(20):
+            limit.update(0.1)
+        assert limit.limit > 4
+
+    def test_shrinks_when_latency_rises(self):
+        """Test multiplicative decrease once latency exceeds the tolerance."""
+        limit = AdaptiveLimit(initial=10, min_limit=2)
+        for _ in range(100):
+            limit.update(0.1)
+        for _ in range(30):
+            limit.update(0.5)
+        assert limit.limit == 2
+
+    def test_mixed_intents_without_overload_keep_limit(self):
+        """Test that slow intents alone are not mistaken for congestion."""
+        rng = random.Random(0)
+        limit = AdaptiveLimit(initial=8)
+        for _ in range(2000):
+            priority = rng.choice(list(Priority))
+            limit.update(rng.uniform(1.0, 4.0), priority)
+        assert limit.limit >= 8
+
+    def test_baseline_is_per_class(self):
+        """Test that a fast class doesn't make a slow class look congested."""
+        limit = AdaptiveLimit(initial=8)
+        for _ in range(200):
+            limit.update(0.5, Priority.LOW)
+            limit.update(4.0, Priority.HIGH)
+        assert limit.limit >= 8
+
+
+class TestAdmissionController:
+    """Test weighted dispatch, shedding and metrics."""
+
+    @staticmethod
+    async def run_all(controller, priorities, work=0.01):
+        """Submit requests in order while one slot is held; return admission order."""
+        order = []
+
+        async def request(index, priority):
+            async with controller.admit(priority):
+                order.append(index)
+                await asyncio.sleep(work)
+
+        blocker = asyncio.ensure_future(request(-1, Priority.LOW))
+        await asyncio.sleep(0)
+        tasks = [asyncio.ensure_future(request(i, p)) for i, p in enumerate(priorities)]
+        results = await asyncio.gather(blocker, *tasks, return_exceptions=True)
+        return order[1:], results[1:]
+
+    @pytest.mark.asyncio
+    async def test_high_priority_overtakes_queued_browsing(self):
+        """Test that queued high-priority requests are admitted first."""
+        controller = AdmissionController(AdaptiveLimit(initial=1, max_limit=1))
+        priorities = [Priority.LOW] * 3 + [Priority.HIGH] * 3
+        order, _ = await self.run_all(controller, priorities)
+        assert order[:3] == [3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_weights_share_capacity(self):
+        """Test that low priority still gets its share while high is busy."""
+        controller = AdmissionController(
+            AdaptiveLimit(initial=1, max_limit=1),
+            weights={Priority.HIGH: 2, Priority.NORMAL: 1, Priority.LOW: 1},
+        )
+        priorities = [Priority.HIGH] * 6 + [Priority.LOW] * 3
+        order, _ = await self.run_all(controller, priorities)
+        low_positions = [order.index(i) for i in (6, 7, 8)]
+        assert low_positions[0] < 3
+
+    @pytest.mark.asyncio
+    async def test_sheds_lowest_priority_first(self):
+        """Test that a full queue drops browsing to make room for a cancellation."""
+        controller = AdmissionController(
+            AdaptiveLimit(initial=1, max_limit=1), max_queue=2
+        )
+        priorities = [Priority.LOW, Priority.LOW, Priority.HIGH, Priority.LOW]
+        order, results = await self.run_all(controller, priorities)
+
+        assert isinstance(results[1], LoadShedError)
+        assert isinstance(results[3], LoadShedError)
+        assert order == [2, 0]
+        assert controller.metrics[Priority.LOW].shed == 2
+        assert controller.metrics[Priority.HIGH].admitted == 1
+
+    @pytest.mark.asyncio
+    async def test_per_class_latency(self):
+        """Test that queue wait shows up in the class latency."""
+        controller = AdmissionController(AdaptiveLimit(initial=1, max_limit=1))
+        await self.run_all(controller, [Priority.HIGH, Priority.LOW], work=0.02)
+        assert controller.latency(Priority.LOW) > controller.latency(Priority.HIGH)
+        assert controller.latency(Priority.NORMAL) is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test that a caller giving up doesn't leak a slot."""
+        controller = AdmissionController(AdaptiveLimit(initial=1, max_limit=1))
+        async with controller.admit(Priority.LOW):
+            waiter = asyncio.ensure_future(controller.admit(Priority.LOW).__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            assert controller.queued == 0
+        assert controller.in_flight == 0
+
+
+class TestSessionAdmission:
+    """Test admission control wiring in the session handler."""
+
+    @pytest.mark.asyncio
+    async def test_handler_admits_by_intent(self, api_stub):
+        """Test that the first turn is classified by intent and follow-ups rank high."""
+        model = ToolThenAnswerModel(
+            {
+                "parts_sales_tool": {"query": "Details on part 1366"},
+                "get_part_details_tool": {"part_number": "1366"},
+            }
+        )
+        controller = AdmissionController()
+        handler = OrchestratorSessionHandler(
+            RunConfig(model=model, tracing_disabled=True), admission=controller
+        )
+        await handler.handle("a", "Details on part 1366")
+        await handler.handle("a", "And the price?")
+
+        assert controller.metrics[Priority.LOW].admitted == 1
+        assert controller.metrics[Priority.HIGH].admitted == 1
+        assert controller.in_flight == 0
@@ -10,6 +10,7 @@ from unittest.mock import Mock, AsyncMock, patch
 from src.agents.parts_support_agent import create_support_agent
 from src.agents.parts_sales_agent import create_sales_agent
 from src.agents.orchestrator_agent import create_orchestrator
+from src.api.config import AgentModelConfig
 
 
 class TestAgentCreation:
@@ -59,6 +60,34 @@ class TestAgentInstructions:
         )
 
 
+class TestModelTiering:
+    """Test per-agent model tier configuration."""
+
+    def test_config_from_env(self, monkeypatch):
+        """Test that tier settings are read from prefixed environment variables."""
+        monkeypatch.setenv("ORCHESTRATOR_MODEL", "gpt-4.1-mini")
+        monkeypatch.setenv("ORCHESTRATOR_TEMPERATURE", "0")
+        monkeypatch.setenv("ORCHESTRATOR_MAX_OUTPUT_TOKENS", "256")
+        config = AgentModelConfig.from_env("ORCHESTRATOR")
+        assert config == AgentModelConfig("gpt-4.1-mini", 0.0, 256)
+        assert AgentModelConfig.from_env("UNSET_AGENT") == AgentModelConfig()
+
+    def test_tiers_applied_to_agents(self):
+        """Test that each factory applies its model tier."""
+        fast = AgentModelConfig("gpt-4.1-mini", 0.0, 256)
+        orchestrator = create_orchestrator(fast)
+        assert orchestrator.model == "gpt-4.1-mini"
+        assert orchestrator.model_settings.temperature == 0.0
+        assert orchestrator.model_settings.max_tokens == 256
+
+        support = create_support_agent(AgentModelConfig("gpt-4.1", 0.2))
+        assert support.model == "gpt-4.1"
+        assert support.model_settings.temperature == 0.2
+        assert support.model_settings.parallel_tool_calls is True
+
+        assert create_sales_agent(AgentModelConfig("gpt-4.1")).model == "gpt-4.1"
+
+
 # Example of how to test async agent execution (requires mocking)
 class TestAgentExecution:
     """Test agent execution with mocked responses."""
@@ -0,0 +1,133 @@
+"""
+Tests for the final-answer cache.
+"""
+
+import pytest
+
+from src.agents.answer_cache import AnswerCache, cacheable_turn, normalize_query
+from src.agents.specialist_output import SpecialistAnswer
+from src.agents.usage import RequestUsage, usage_hooks, usage_scope
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAnswerCache:
+    """Test caching, bypass and eviction rules."""
+
+    def test_repeat_question_hits(self):
+        """Test that a normalized repeat of a sales question is served from cache."""
+        cache = AnswerCache()
+        assert cache.put("Details on part 5304495391", "It's a door gasket.")
+        assert cache.get("details on part 5304495391?") == "It's a door gasket."
+        assert cache.metrics.hits == 1
+        assert normalize_query("  Details ON part 1-17548-006!! ") == (
+            "details on part 1-17548-006"
+        )
+
+    def test_entities_are_part_of_the_key(self):
+        """Test that a different model number is a different question."""
+        cache = AnswerCache()
+        cache.put("Is part 1366 compatible with model 3352573?", "Yes")
+        assert cache.get("Is part 1366 compatible with model 9999999?") is None
+
+    def test_support_and_mutation_queries_bypass(self):
+        """Test that only read-only sales intents are cacheable."""
+        cache = AnswerCache()
+        assert not cache.put("Cancel the subscription for part 1366", "Done")
+        assert not cache.put("Refund status for order E001861 part 1366", "ok")
+        assert not cache.put("Shipping options to 90210", "Ground")  # no part number
+
+    def test_context_dependent_follow_up_bypasses(self):
+        """Test that follow-ups leaning on earlier turns bypass the cache."""
+        cache = AnswerCache()
+        cache.put("Is part 1366 in stock", "Yes")
+        assert cache.get("Is part 1366 in stock", has_context=True) == "Yes"
+        assert cache.key_for("Is that part 1366 too", has_context=True) is None
+        assert cache.key_for("Is that part 1366 too", has_context=False) is not None
+
+    def test_ttl(self):
+        """Test that entries expire with the part data."""
+        clock = FakeClock()
+        cache = AnswerCache(ttl_seconds=60, clock=clock)
+        cache.put("Details on part 1366", "Spring")
+        clock.now = 59
+        assert cache.get("Details on part 1366") == "Spring"
+        clock.now = 60
+        assert cache.get("Details on part 1366") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = AnswerCache(max_entries=2)
+        cache.put("Details on part 1", "a")
+        cache.put("Details on part 2", "b")
+        cache.get("Details on part 1")
+        cache.put("Details on part 3", "c")
+        assert len(cache) == 2
+        assert cache.get("Details on part 2") is None
+        assert cache.get("Details on part 1") == "a"
+        assert cache.metrics.evictions == 1
+
+
+class FakeTool:
+    def __init__(self, name):
+        self.name = name
+
+
+def sales_turn(lookup_result: str) -> RequestUsage:
+    """Ledger of a turn routed to sales with one part lookup."""
+    usage = RequestUsage()
+    usage.record_tool("get_part_details_tool", '"error":' in lookup_result)
+    usage.record_tool("parts_sales_tool")
+    return usage
+
+
+class TestCacheableTurn:
+    """Test which finished turns may be cached."""
+
+    def test_successful_lookup_is_cacheable(self):
+        """Test that an answer built from a part lookup is cached."""
+        usage = sales_turn('{"status_code":200,"part":{"number":"1366"}}')
+        assert cacheable_turn("It's a spring.", usage)
+
+    def test_failed_lookup_is_not_cacheable(self):
+        """Test that an answer apologizing for an API error is not cached."""
+        usage = sales_turn('{"status_code":500,"error":"Connection error"}')
+        assert not cacheable_turn("I couldn't reach the parts service.", usage)
+
+    def test_turn_without_lookup_is_not_cacheable(self):
+        """Test that a clarifying question without a lookup is not cached."""
+        usage = RequestUsage()
+        usage.record_tool("parts_sales_tool")
+        assert not cacheable_turn("Which model is it for?", usage)
+
+    def test_follow_up_needed_is_not_cacheable(self):
+        """Test that structured answers asking for more details are not cached."""
+        answer = SpecialistAnswer(
+            intent="part_details",
+            entities=[],
+            answer="Which model is it for?",
+            follow_up_needed=True,
+        )
+        usage = sales_turn('{"status_code":200}')
+        assert not cacheable_turn(answer, usage)
+        assert cacheable_turn(
+            answer.model_copy(update={"follow_up_needed": False}), usage
+        )
+
+    @pytest.mark.asyncio
+    async def test_hooks_record_tool_errors(self):
+        """Test that the run hooks count tool calls and error results."""
+        with usage_scope(budget=0) as usage:
+            tool = FakeTool("get_part_details_tool")
+            await usage_hooks.on_tool_end(None, None, tool, '{"status_code":200}')
+            await usage_hooks.on_tool_end(None, None, tool, '{"error":"Timeout"}')
+        assert usage.tool_calls["get_part_details_tool"] == 2
+        assert usage.tool_errors["get_part_details_tool"] == 1
@@ -0,0 +1,116 @@
+"""
+Tests for the local part catalog.
+"""
+
+import json
+
+import pytest
+from agents import RunConfig, Runner
+
+from src.agents.parts_sales_agent import create_sales_agent
+from src.api.catalog import PartCatalog
+from src.testing.stubs import FakeModel, function_call, message
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def catalog(tmp_path, clock):
+    catalog = PartCatalog(tmp_path / "catalog.db", max_age_seconds=60, clock=clock)
+    yield catalog
+    catalog.close()
+
+
+class TestPartCatalog:
+    """Test catalog storage, compatibility and freshness."""
+
+    def test_bulk_load_export(self, catalog, tmp_path):
+        """Test loading a JSON lines export and answering from it."""
+        export = tmp_path / "export.jsonl"
+        export.write_text(
+            json.dumps(
+                {
+                    "part_number": "1366",
+                    "details": {"title": "Pl Spring", "pricing": {"price": 1}},
+                    "models": ["3352573", "3352574"],
+                }
+            )
+        )
+        assert catalog.load_export(export) == 1
+
+        response = catalog.lookup("1366")
+        assert response["source"] == "catalog"
+        assert response["body"]["message"]["title"] == "Pl Spring"
+        assert "pricing" not in response["body"]["message"]
+        assert catalog.is_compatible("1366", "3352573") is True
+        assert catalog.is_compatible("1366", "0000000") is False
+        assert catalog.parts_for_model("3352574") == ["1366"]
+
+    def test_partial_model_knowledge(self, catalog):
+        """Test that a model-filtered lookup can't prove incompatibility."""
+        response = {
+            "statusCode": 200,
+            "body": {
+                "message": {"title": "Pl Spring", "models": {"number": "3352573"}}
+            },
+        }
+        assert catalog.record_lookup("1366", response, model_number="3352573")
+        assert catalog.is_compatible("1366", "3352573") is True
+        assert catalog.is_compatible("1366", "0000000") is None
+        assert catalog.lookup("1366") is None  # full model list unknown
+
+    def test_rows_expire(self, catalog, clock):
+        """Test per-row freshness tracking."""
+        catalog.upsert(
+            "1366", {"title": "Pl Spring"}, ["3352573"], models_complete=True
+        )
+        assert catalog.get("1366")["fresh"]
+        clock.now += 60
+        assert not catalog.get("1366")["fresh"]
+        assert catalog.lookup("1366", "3352573") is None
+        assert catalog.parts_for_model("3352573") == []
+
+
+class TestPartDetailsToolWithCatalog:
+    """Test that the part details tool uses the catalog before the network."""
+
+    @staticmethod
+    async def _lookup(arguments):
+        model = FakeModel(
+            [
+                [function_call("get_part_details_tool", arguments, "call_lookup")],
+                [message("done")],
+            ]
+        )
+        await Runner.run(
+            create_sales_agent(),
+            "Details on part 1366",
+            run_config=RunConfig(model=model, tracing_disabled=True),
+        )
+
+    @pytest.mark.asyncio
+    async def test_lookups_fill_and_use_catalog(self, api_stub, catalog, monkeypatch):
+        """Test that static lookups hit the network once, live data every time."""
+        monkeypatch.setattr("src.tools.parts_tools.part_catalog", catalog)
+
+        await self._lookup({"part_number": "1366"})
+        await self._lookup({"part_number": "1366"})
+        await self._lookup({"part_number": "1366", "model_number": "3352573"})
+        assert api_stub.calls_to("/parts/lookup") == 1
+
+        await self._lookup({"part_number": "1366", "zip": "90210"})
+        await self._lookup({"part_number": "1366", "include_pricing": True})
+        assert api_stub.calls_to("/parts/lookup") == 3
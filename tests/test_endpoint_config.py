@@ -0,0 +1,210 @@
+"""
+Tests for per-endpoint settings and hot reload of the endpoint config file.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from src.api.client import APIClient
+from src.api.config import APIConfig
+from src.api.endpoint_config import (
+    EndpointConfig,
+    EndpointConfigWatcher,
+    EndpointSettings,
+)
+
+_mtimes = itertools.count(int(time.time()))
+
+
+def write_config(path, data):
+    """Write a config file with a fresh mtime, even on coarse-grained filesystems."""
+    path.write_text(json.dumps(data))
+    mtime = next(_mtimes)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def client(api_stub):
+    config = APIConfig()
+    config.base_url = api_stub.base_url
+    return APIClient(config)
+
+
+class TestEndpointConfig:
+    """Test parsing and validation."""
+
+    def test_endpoint_overrides_inherit_defaults(self):
+        """Test that endpoints only override what they list."""
+        config = EndpointConfig.from_dict(
+            {
+                "defaults": {"connect_timeout": 1, "read_timeout": 20},
+                "endpoints": {"/parts/lookup": {"read_timeout": 5, "retries": 2}},
+            }
+        )
+        assert config.for_endpoint("/parts/lookup") == EndpointSettings(1, 5, 2, 10)
+        assert config.for_endpoint("/parts/status").timeout == (1, 20)
+
+    def test_defaults_fall_back_to_api_config(self):
+        """Test that TIMEOUT_SECONDS still sets the default read timeout."""
+        api_config = APIConfig()
+        api_config.timeout = 12
+        config = EndpointConfig.from_dict({}, api_config)
+        assert config.defaults.read_timeout == 12
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"endpoints": {"/parts/lookup": {"read_timout": 5}}},
+            {"defaults": {"read_timeout": 0}},
+            {"defaults": {"pool_size": 0}},
+            {"defaults": {"retries": 1.5}},
+            {"endpoints": {"/parts/lookup": {"retries": "2"}}},
+            {"defaults": {"read_timeout": True}},
+            {"defaults": [1]},
+            {"endpoints": [{"read_timeout": 5}]},
+            {"endpoints": {"/parts/lookup": 5}},
+            {"base_url": 1},
+        ],
+    )
+    def test_invalid_settings_rejected(self, data):
+        """Test that typos and nonsensical values are rejected."""
+        with pytest.raises(ValueError):
+            EndpointConfig.from_dict(data)
+
+
+class TestEndpointConfigWatcher:
+    """Test file watching."""
+
+    def test_reloads_on_change_and_keeps_last_good(self, tmp_path):
+        """Test that a broken edit leaves the previous snapshot in place."""
+        path = tmp_path / "endpoints.json"
+        write_config(path, {"defaults": {"read_timeout": 10}})
+        applied = []
+        watcher = EndpointConfigWatcher(str(path), applied.append)
+
+        assert watcher.check() is False
+        write_config(path, {"defaults": {"read_timeout": 5}})
+        assert watcher.check() is True
+        assert applied[-1].defaults.read_timeout == 5
+
+        write_config(path, {"defaults": {"read_timeout": -1}})
+        assert watcher.check() is False
+        assert "Timeouts must be positive" in watcher.last_error
+        assert len(applied) == 1
+
+        write_config(path, {"endpoints": []})
+        assert watcher.check() is False
+        assert "endpoints must be an object" in watcher.last_error
+
+    def test_watcher_survives_unexpected_errors(self, tmp_path):
+        """Test that an error in a reload doesn't end polling."""
+        path = tmp_path / "endpoints.json"
+        write_config(path, {})
+        applied = []
+
+        def on_change(snapshot):
+            applied.append(snapshot)
+            if len(applied) == 1:
+                raise RuntimeError("apply failed")
+
+        watcher = EndpointConfigWatcher(str(path), on_change, interval=0.01).start()
+        try:
+            write_config(path, {"defaults": {"read_timeout": 5}})
+            deadline = time.monotonic() + 5
+            while not applied and time.monotonic() < deadline:
+                time.sleep(0.01)
+            write_config(path, {"defaults": {"read_timeout": 6}})
+            while len(applied) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            watcher.stop()
+
+        assert applied[-1].defaults.read_timeout == 6
+
+    def test_client_watches_configured_file(self, tmp_path, api_stub):
+        """Test that API_ENDPOINT_CONFIG is loaded and polled by the client."""
+        path = tmp_path / "endpoints.json"
+        write_config(path, {"base_url": api_stub.base_url})
+        config = APIConfig()
+        config.endpoint_config_path = str(path)
+        config.endpoint_config_interval = 0.02
+        client = APIClient(config)
+        try:
+            assert client.base_url == api_stub.base_url
+            write_config(
+                path,
+                {
+                    "base_url": api_stub.base_url,
+                    "endpoints": {"/parts/lookup": {"read_timeout": 3}},
+                },
+            )
+            deadline = time.time() + 2
+            while client.config_watcher.reloads == 0 and time.time() < deadline:
+                time.sleep(0.02)
+            assert (
+                client.endpoint_config.for_endpoint("/parts/lookup").read_timeout == 3
+            )
+        finally:
+            client.config_watcher.stop()
+
+
+class TestClientEndpointSettings:
+    """Test that the client applies per-endpoint settings."""
+
+    def test_per_endpoint_read_timeout_and_retries(self, client, api_stub):
+        """Test that a slow endpoint times out and is retried on its own settings."""
+        api_stub.delays = {"/parts/lookup": 0.3, "/parts/status": 0.3}
+        client.apply_endpoint_config(
+            EndpointConfig.from_dict(
+                {"endpoints": {"/parts/lookup": {"read_timeout": 0.1, "retries": 2}}}
+            )
+        )
+
+        assert client.post("/parts/lookup", {})["error"] == "Request timeout"
+        assert api_stub.calls_to("/parts/lookup") == 3
+        assert "error" not in client.post("/parts/status", {})
+
+    def test_reload_keeps_unchanged_pools(self, client):
+        """Test that only resized pools are replaced."""
+        lookup = f"{client.base_url}/parts/lookup"
+        client.apply_endpoint_config(
+            EndpointConfig.from_dict({"endpoints": {"/parts/lookup": {"pool_size": 4}}})
+        )
+        default_pool = client.session.adapters["http://"]
+        lookup_pool = client.session.adapters[lookup]
+
+        client.apply_endpoint_config(
+            EndpointConfig.from_dict(
+                {"endpoints": {"/parts/lookup": {"pool_size": 4, "read_timeout": 2}}}
+            )
+        )
+        assert client.session.adapters["http://"] is default_pool
+        assert client.session.adapters[lookup] is lookup_pool
+
+        client.apply_endpoint_config(
+            EndpointConfig.from_dict({"endpoints": {"/parts/lookup": {"pool_size": 8}}})
+        )
+        assert client.session.adapters["http://"] is default_pool
+        assert client.session.adapters[lookup] is not lookup_pool
+
+    def test_in_flight_request_keeps_its_settings(self, client, api_stub):
+        """Test that a reload mid-request doesn't affect the request already sent."""
+        api_stub.delays = {"/parts/lookup": 0.3}
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(client.post("/parts/lookup", {}))
+        )
+        thread.start()
+        time.sleep(0.1)
+        client.apply_endpoint_config(
+            EndpointConfig.from_dict({"defaults": {"read_timeout": 0.05}})
+        )
+        thread.join()
+
+        assert "error" not in results[0]
+        assert client.post("/parts/lookup", {})["error"] == "Request timeout"
@@ -0,0 +1,173 @@
+"""
+Tests for the multi-region endpoint pool.
+"""
+
+from collections import Counter
+
+import pytest
+
+from src.api.client import APIClient, api_client
+from src.api.config import APIConfig
+from src.api.endpoint_config import EndpointConfig
+from src.api.endpoint_pool import EndpointPool
+from src.testing.stubs import LocalAPIStub
+
+URLS = ["http://east", "http://west", "http://eu"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def pool():
+    return EndpointPool(URLS, ejection_seconds=30, probe_interval=60, clock=FakeClock())
+
+
+def warm(pool, latencies):
+    """Give every URL a few successful samples."""
+    for _ in range(pool.min_samples):
+        for url, latency in zip(URLS, latencies):
+            pool.record(url, latency, ok=True)
+
+
+@pytest.fixture
+def regions():
+    """Three local stubs standing in for regions with different RTTs."""
+    stubs = [
+        LocalAPIStub(delays={"/parts/lookup": delay}).start()
+        for delay in (0.0, 0.03, 0.08)
+    ]
+    yield stubs
+    for stub in stubs:
+        if stub._thread is not None:
+            stub.stop()
+
+
+def pooled_client(stubs, retries=0):
+    config = APIConfig()
+    config.base_url_pool = [stub.base_url for stub in stubs]
+    client = APIClient(config)
+    client.apply_endpoint_config(
+        EndpointConfig.from_dict({"defaults": {"retries": retries}})
+    )
+    return client
+
+
+class TestEndpointPool:
+    """Test selection and ejection."""
+
+    def test_selects_lowest_latency(self, pool):
+        """Test that unmeasured URLs are tried first, then the fastest wins."""
+        assert {pool.select() for _ in URLS} <= set(URLS)
+        warm(pool, [0.2, 0.05, 0.1])
+        assert pool.select() == "http://west"
+
+    def test_errors_raise_score(self, pool):
+        """Test that a fast but failing URL loses to a reliable one."""
+        warm(pool, [0.05, 0.06, 0.2])
+        pool.record("http://east", 1.0, ok=False)
+        pool.record("http://east", 1.0, ok=False)
+        assert pool.select() == "http://west"
+
+    def test_consecutive_failures_eject_until_timeout(self, pool):
+        """Test that an ejected URL is skipped, then probed again after its timeout."""
+        warm(pool, [0.05, 0.06, 0.07])
+        for _ in range(3):
+            pool.record("http://east", 0.01, ok=False)
+        assert pool.healthy() == ["http://west", "http://eu"]
+        assert pool.select() == "http://west"
+
+        pool.clock.now += 31
+        assert pool.select() == "http://east"  # reset, so probed first
+        assert pool.stats["http://east"].samples == 0
+
+    def test_latency_outlier_ejected(self, pool):
+        """Test that a URL far slower than the fastest is ejected."""
+        warm(pool, [0.05, 0.06, 0.5])
+        assert "http://eu" not in pool.healthy()
+
+    def test_last_healthy_url_never_ejected(self):
+        """Test that the pool keeps serving when everything fails."""
+        pool = EndpointPool(URLS[:2], clock=FakeClock())
+        for _ in range(5):
+            for url in URLS[:2]:
+                pool.record(url, 0.01, ok=False)
+        assert len(pool.healthy()) == 1
+
+    def test_retry_avoids_failed_url(self, pool):
+        """Test that a retry goes elsewhere when another URL is healthy."""
+        warm(pool, [0.05, 0.06, 0.07])
+        assert pool.select(avoid="http://east") == "http://west"
+
+
+class TestPooledClient:
+    """Test routing across local stubs with different injected latency."""
+
+    def test_routes_to_fastest_region(self, regions):
+        """Test that most requests land on the lowest-latency stub."""
+        client = pooled_client(regions)
+        for _ in range(20):
+            assert "error" not in client.post("/parts/lookup", {})
+
+        calls = Counter(
+            {i: stub.calls_to("/parts/lookup") for i, stub in enumerate(regions)}
+        )
+        assert calls.most_common(1)[0][0] == 0
+        assert calls[0] >= 16
+
+    def test_failover_when_region_goes_down(self, regions):
+        """Test that retries move to another region and the dead one is ejected."""
+        client = pooled_client(regions, retries=2)
+        for _ in range(5):
+            client.post("/parts/lookup", {})
+        regions[0].stop()
+        regions[0]._thread = None
+
+        for _ in range(10):
+            assert "error" not in client.post("/parts/lookup", {})
+        assert regions[0].base_url not in client.endpoint_pool.healthy()
+        assert regions[1].calls_to("/parts/lookup") >= 10
+
+    def test_endpoint_config_base_url_overrides_pool(self, regions):
+        """Test that a base URL in the endpoint config file bypasses the pool."""
+        client = pooled_client(regions)
+        client.apply_endpoint_config(
+            EndpointConfig.from_dict({"base_url": regions[2].base_url})
+        )
+        client.post("/parts/lookup", {})
+        assert regions[2].calls_to("/parts/lookup") == 1
+        assert client.base_urls == [regions[2].base_url]
+
+
+class TestBaseUrlOverride:
+    """Test that an explicit base URL takes precedence over PARTS_API_BASE_URLS."""
+
+    DEAD_POOL = "http://127.0.0.1:9/a,http://127.0.0.1:9/b"
+
+    def test_assigned_base_url_disables_pool(self, api_stub, monkeypatch):
+        """Test that a client built with the pool env var honours config.base_url."""
+        monkeypatch.setenv("PARTS_API_BASE_URLS", self.DEAD_POOL)
+        config = APIConfig()
+        client = APIClient(config)
+        assert client.endpoint_pool is not None
+
+        config.base_url = api_stub.base_url
+        assert "error" not in client.post("/parts/lookup", {})
+        assert api_stub.calls_to("/parts/lookup") == 1
+        assert client.base_urls == [api_stub.base_url]
+
+    def test_api_stub_fixture_bypasses_global_pool(self, monkeypatch, request):
+        """Test that the api_stub fixture routes a pooled global client to the stub."""
+        monkeypatch.setenv("PARTS_API_BASE_URLS", self.DEAD_POOL)
+        monkeypatch.setattr(
+            api_client, "endpoint_pool", EndpointPool.from_config(APIConfig())
+        )
+        stub = request.getfixturevalue("api_stub")
+
+        assert "error" not in api_client.post("/parts/lookup", {})
+        assert stub.calls_to("/parts/lookup") == 1
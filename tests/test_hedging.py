@@ -0,0 +1,172 @@
+"""
+Tests for hedged requests on idempotent endpoints.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.api.client import APIClient
+from src.api.config import APIConfig
+from src.api.hedging import LatencyTracker, RequestHedger
+
+
+def scripted_send(delays, responses=None):
+    """Build a send callable whose Nth attempt sleeps ``delays[N]`` seconds."""
+    calls = []
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            attempt = len(calls)
+            calls.append(attempt)
+        time.sleep(delays[attempt] if attempt < len(delays) else 0)
+        if responses and attempt < len(responses):
+            return responses[attempt]
+        return {"statusCode": 200, "attempt": attempt}
+
+    send.calls = calls
+    return send
+
+
+@pytest.fixture
+def hedger():
+    hedger = RequestHedger(budget_percent=50, min_samples=5)
+    # Enough fast samples that a few slow test attempts don't move the p95
+    for _ in range(100):
+        hedger.latencies.record("/parts/lookup", 0.01)
+    # Prior requests that earned hedge budget
+    hedger.metrics.requests = 10
+    yield hedger
+    hedger.shutdown()
+
+
+class TestLatencyTracker:
+    """Test percentile tracking."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles over the rolling window."""
+        tracker = LatencyTracker(window=100)
+        assert tracker.percentile("/parts/lookup", 95) is None
+        for ms in range(1, 101):
+            tracker.record("/parts/lookup", ms / 1000)
+        assert tracker.percentile("/parts/lookup", 95) == 0.095
+        assert tracker.percentile("/parts/lookup", 50) == 0.05
+
+    def test_window_drops_old_samples(self):
+        """Test that only the most recent samples count."""
+        tracker = LatencyTracker(window=3)
+        for seconds in (5.0, 0.1, 0.1, 0.1):
+            tracker.record("/parts/status", seconds)
+        assert tracker.percentile("/parts/status", 100) == 0.1
+
+
+class TestRequestHedger:
+    """Test when hedges fire, win and are capped."""
+
+    def test_fast_attempt_is_not_hedged(self, hedger):
+        """Test that an attempt answering before p95 sends nothing extra."""
+        send = scripted_send([0.0])
+        assert hedger.call("/parts/lookup", send)["attempt"] == 0
+        assert send.calls == [0]
+        assert hedger.metrics.fired == 0
+
+    def test_slow_attempt_is_hedged_and_hedge_wins(self, hedger):
+        """Test that the duplicate's answer is used when the first attempt stalls."""
+        send = scripted_send([1.0, 0.0])
+        start = time.perf_counter()
+        assert hedger.call("/parts/lookup", send)["attempt"] == 1
+        assert time.perf_counter() - start < 0.5
+        assert hedger.metrics.fired == 1
+        assert hedger.metrics.wins == 1
+
+    def test_hedge_cuts_wall_time_to_delay_plus_hedge(self, hedger):
+        """Test that a caller waits about p95 plus the hedge, not the slow attempt."""
+        send = scripted_send([2.0, 0.1])
+        start = time.perf_counter()
+        hedger.call("/parts/lookup", send)
+        elapsed = time.perf_counter() - start
+        # p95 is 10 ms; allow scheduling slack but far below the 2 s attempt
+        assert 0.1 <= elapsed < 0.4
+
+    def test_concurrent_calls_are_not_queued(self):
+        """Test that more concurrent calls than CPU cores run at once."""
+        hedger = RequestHedger()
+        send = scripted_send([0.2] * 64)
+        threads = [
+            threading.Thread(target=hedger.call, args=("/parts/lookup", send))
+            for _ in range(64)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 16 shared threads would take four rounds (0.8 s)
+        assert time.perf_counter() - start < 0.6
+        hedger.shutdown()
+
+    def test_original_can_still_win(self, hedger):
+        """Test that whichever attempt answers first is returned."""
+        send = scripted_send([0.05, 1.0])
+        assert hedger.call("/parts/lookup", send)["attempt"] == 0
+        assert hedger.metrics.fired == 1
+        assert hedger.metrics.wins == 0
+
+    def test_error_waits_for_other_attempt(self, hedger):
+        """Test that a fast error doesn't beat a successful answer."""
+        send = scripted_send([0.05, 0.1], [{"error": "Connection error"}])
+        assert hedger.call("/parts/lookup", send)["attempt"] == 1
+
+    def test_budget_caps_hedges(self, hedger):
+        """Test that hedges stop once they exceed the budget percentage."""
+        hedger.metrics.requests = 0
+        for _ in range(4):
+            hedger.call("/parts/lookup", scripted_send([0.05, 0.0]))
+        assert hedger.metrics.fired == 2
+        assert hedger.metrics.over_budget == 2
+        assert hedger.metrics.fire_rate == 0.5
+
+    def test_no_hedge_without_enough_samples(self):
+        """Test that endpoints without an observed p95 are not hedged."""
+        hedger = RequestHedger(budget_percent=100, min_samples=5)
+        send = scripted_send([0.05])
+        hedger.call("/parts/lookup", send)
+        assert send.calls == [0]
+        assert hedger.latencies.count("/parts/lookup") == 1
+        hedger.shutdown()
+
+
+class TestClientHedging:
+    """Test hedging wiring in the API client."""
+
+    def test_only_configured_endpoints_are_hedged(self, api_stub):
+        """Test that mutations go straight to the API."""
+        hedger = RequestHedger(endpoints=["/parts/lookup"], min_samples=1)
+        client = APIClient(_config(api_stub.base_url), hedger=hedger)
+
+        client.post("/parts/lookup", {"partNumber": "1366"})
+        client.post("/subscription/cancel", {"membershipId": "1"})
+
+        assert hedger.metrics.requests == 1
+        assert hedger.latencies.count("/parts/lookup") == 1
+        hedger.shutdown()
+
+    def test_hedger_built_from_config(self):
+        """Test that HEDGING_ENABLED builds a hedger with the configured settings."""
+        config = APIConfig()
+        assert APIClient(config).hedger is None
+
+        config.hedging_enabled = True
+        config.hedge_budget_percent = 5
+        hedger = APIClient(config).hedger
+        assert hedger.applies("/parts/status")
+        assert not hedger.applies("/subscription/cancel")
+        assert hedger.budget_percent == 5
+
+
+def _config(base_url):
+    config = APIConfig()
+    config.base_url = base_url
+    return config
@@ -0,0 +1,192 @@
+"""
+Tests for idempotency keys and duplicate suppression of subscription mutations.
+"""
+
+import asyncio
+
+import pytest
+from agents import RunConfig, Runner
+
+from src.agents.parts_support_agent import create_support_agent
+from src.api.idempotency import (
+    IDEMPOTENCY_HEADER,
+    IdempotencyCache,
+    idempotency_key,
+    session_scope,
+)
+from src.testing.stubs import FakeModel, function_call, message
+from src.tools import subscription_tools
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestIdempotencyKey:
+    """Test key derivation."""
+
+    def test_key_depends_on_every_part(self):
+        """Test that session, membership, operation and value all change the key."""
+        base = idempotency_key("s1", "2237407160", "frequency", "3")
+        assert base == idempotency_key("s1", " 2237407160 ", "frequency", "3")
+        assert len(base) == 32
+        assert base != idempotency_key("s2", "2237407160", "frequency", "3")
+        assert base != idempotency_key("s1", "8282916880", "frequency", "3")
+        assert base != idempotency_key("s1", "2237407160", "quantity", "3")
+        assert base != idempotency_key("s1", "2237407160", "frequency", "6")
+
+
+class TestIdempotencyCache:
+    """Test the dedupe window."""
+
+    @staticmethod
+    def counting_call(response):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return response
+
+        call.calls = calls
+        return call
+
+    @pytest.mark.asyncio
+    async def test_duplicates_within_window_reuse_result(self):
+        """Test that a repeat inside the window doesn't call the API again."""
+        clock = FakeClock()
+        cache = IdempotencyCache(window_seconds=60, clock=clock)
+        call = self.counting_call({"statusCode": 200})
+
+        await cache.run("k", call)
+        clock.now = 59
+        await cache.run("k", call)
+        assert len(call.calls) == 1
+        assert cache.metrics.duplicates == 1
+
+        clock.now = 61
+        await cache.run("k", call)
+        assert len(call.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_call(self):
+        """Test that a duplicate fired while the first is in flight waits for it."""
+        cache = IdempotencyCache()
+        call = self.counting_call({"statusCode": 200})
+        results = await asyncio.gather(*(cache.run("k", call) for _ in range(3)))
+        assert len(call.calls) == 1
+        assert results == [{"statusCode": 200}] * 3
+
+    @pytest.mark.asyncio
+    async def test_changing_back_is_not_a_duplicate(self):
+        """Test that A -> B -> A sends all three mutations, each with its own key."""
+        cache = IdempotencyCache(window_seconds=60, clock=FakeClock())
+        sent = []
+
+        async def update(value):
+            key = cache.key("s1", "2237407160", "frequency", value)
+
+            async def call():
+                sent.append((value, key))
+                return {"statusCode": 200, "frequency": value}
+
+            return await cache.run(key, call)
+
+        for value in ["3", "3", "6", "3", "3"]:
+            assert (await update(value))["frequency"] == value
+
+        assert [value for value, _ in sent] == ["3", "6", "3"]
+        assert len({key for _, key in sent}) == 3
+        assert cache.metrics.duplicates == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_remembered(self):
+        """Test that a failed mutation can be retried."""
+        cache = IdempotencyCache()
+        call = self.counting_call({"error": "Connection error"})
+        await cache.run("k", call)
+        await cache.run("k", call)
+        assert len(call.calls) == 2
+
+
+class TestSubscriptionToolDedupe:
+    """Test duplicate suppression in the subscription mutation tools."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        monkeypatch.setattr(subscription_tools, "mutation_dedupe", IdempotencyCache())
+
+    @staticmethod
+    async def run_cancels(session_id, membership_ids):
+        model = FakeModel(
+            [
+                [
+                    function_call(
+                        "parts_subscription_cancel_tool",
+                        {"membership_id": membership_id},
+                        f"call_{i}",
+                    )
+                ]
+                for i, membership_id in enumerate(membership_ids)
+            ]
+            + [[message("Your subscription is canceled.")]]
+        )
+        with session_scope(session_id):
+            await Runner.run(
+                create_support_agent(),
+                "Cancel subscription for membership ID 2237407160",
+                run_config=RunConfig(model=model, tracing_disabled=True),
+            )
+
+    @pytest.mark.asyncio
+    async def test_repeated_cancel_hits_api_once(self, api_stub):
+        """Test that a retried cancellation is answered from the first call."""
+        await self.run_cancels("s1", ["2237407160", "2237407160"])
+
+        assert api_stub.calls_to("/subscription/cancel") == 1
+        headers = api_stub.calls[0][2]
+        assert headers[IDEMPOTENCY_HEADER] == idempotency_key(
+            "s1", "2237407160", "cancel"
+        )
+
+    @pytest.mark.asyncio
+    async def test_different_sessions_and_memberships_are_separate(self, api_stub):
+        """Test that only identical mutations in the same session are deduped."""
+        await self.run_cancels("s1", ["2237407160", "8282916880"])
+        await self.run_cancels("s2", ["2237407160"])
+        assert api_stub.calls_to("/subscription/cancel") == 3
+
+    @pytest.mark.asyncio
+    async def test_frequency_change_back_reaches_api(self, api_stub):
+        """Test that 3 -> 6 -> 3 inside the window leaves the backend at 3."""
+        model = FakeModel(
+            [
+                [
+                    function_call(
+                        "parts_subscription_update_tool",
+                        {
+                            "membership_id": "8282916880",
+                            "update": "frequency",
+                            "value": value,
+                        },
+                        f"call_{i}",
+                    )
+                ]
+                for i, value in enumerate(["3", "6", "3"])
+            ]
+            + [[message("Frequency updated.")]]
+        )
+        with session_scope("s1"):
+            await Runner.run(
+                create_support_agent(),
+                "Change my subscription to every 3 months, then 6, then back to 3",
+                run_config=RunConfig(model=model, tracing_disabled=True),
+            )
+
+        edits = [call for call in api_stub.calls if call[0] == "/subscription/edit"]
+        assert [payload["frequency"] for _, payload, _ in edits] == ["3", "6", "3"]
+        assert edits[0][2][IDEMPOTENCY_HEADER] != edits[2][2][IDEMPOTENCY_HEADER]
@@ -0,0 +1,84 @@
+"""
+Tests for typed API response models.
+"""
+
+import json
+
+from src.api.models import (
+    OrderStatusResponse,
+    PartDetailsResponse,
+    SubscriptionLookupResponse,
+    SubscriptionUpdateResponse,
+    decode_json,
+)
+from src.testing.stubs import DEFAULT_RESPONSES
+
+
+class TestResponseModels:
+    """Test validation and compact serialization."""
+
+    def test_order_status_parsed_once(self):
+        """Test that the nested order body is flattened into typed fields."""
+        response = OrderStatusResponse.from_dict(DEFAULT_RESPONSES["/parts/status"])
+        assert response.ok
+        assert response.order_number == "W174191"
+        assert response.status == "Shipped"
+        assert response.customer == {"zip": "60179"}
+        assert not hasattr(response, "__dict__")  # slot-based
+
+    def test_compact_serialization_drops_empty_fields(self):
+        """Test that the LLM payload omits empty values and whitespace."""
+        response = OrderStatusResponse.from_dict(DEFAULT_RESPONSES["/parts/status"])
+        payload = response.to_llm()
+        assert " " not in payload.replace("Order found", "")
+        assert json.loads(payload) == {
+            "status_code": 200,
+            "message": "Order found",
+            "order_number": "W174191",
+            "status": "Shipped",
+            "customer": {"zip": "60179"},
+        }
+        assert len(payload) < len(str(DEFAULT_RESPONSES["/parts/status"]))
+
+    def test_field_names_per_model_class(self):
+        """Test that each model class lists its own fields, base fields first."""
+        names = OrderStatusResponse._fields()
+        assert names[:4] == ("status_code", "message", "error", "details")
+        assert "order_number" in names
+        assert "part" not in names
+        assert "part" in PartDetailsResponse._fields()
+
+    def test_error_shapes_are_uniform(self):
+        """Test that client errors, tool errors and bad payloads share one shape."""
+        timeout = SubscriptionLookupResponse.from_dict(
+            {"error": "Request timeout", "details": "The API request timed out"}
+        )
+        invalid = SubscriptionUpdateResponse.from_error(
+            "Invalid update type", status_code=400
+        )
+        malformed = PartDetailsResponse.from_dict({"body": {}})
+
+        for response in (timeout, invalid, malformed):
+            assert not response.ok
+            assert set(json.loads(response.to_llm())) <= {
+                "status_code",
+                "error",
+                "details",
+            }
+        assert timeout.status_code == 500
+        assert invalid.status_code == 400
+        assert malformed.error == "Invalid response"
+
+    def test_part_details_source(self):
+        """Test that catalog answers are marked and API answers are not."""
+        api = PartDetailsResponse.from_dict(DEFAULT_RESPONSES["/parts/lookup"])
+        catalog = PartDetailsResponse.from_dict(
+            dict(DEFAULT_RESPONSES["/parts/lookup"], source="catalog")
+        )
+        assert api.part["title"] == "Pl Spring"
+        assert "source" not in json.loads(api.to_llm())
+        assert catalog.source == "catalog"
+
+    def test_decode_json(self):
+        """Test the (optionally accelerated) decoder."""
+        assert decode_json(b'{"statusCode": 200}') == {"statusCode": 200}
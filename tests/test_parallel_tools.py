@@ -0,0 +1,55 @@
+"""
+Tests for concurrent tool execution inside the support agent.
+"""
+
+import time
+
+import pytest
+from agents import RunConfig, Runner
+
+from src.agents.parts_support_agent import create_support_agent
+from src.testing.stubs import FakeModel, function_call, message
+
+
+class TestParallelToolExecution:
+    """Independent tool calls from one model turn overlap their latency."""
+
+    def test_support_agent_requests_parallel_tool_calls(self):
+        """Test that the support agent enables parallel tool calls."""
+        agent = create_support_agent()
+        assert agent.model_settings.parallel_tool_calls is True
+
+    @pytest.mark.asyncio
+    async def test_wall_time_is_max_not_sum(self, api_stub):
+        """Test that order + refund lookups take max(latencies), not their sum."""
+        api_stub.delays = {"/parts/status": 0.4, "/parts/refundstatus": 0.6}
+        model = FakeModel(
+            [
+                [
+                    function_call(
+                        "parts_get_order_status_tool",
+                        {"order_no": "W174191", "zip": ""},
+                        "call_status",
+                    ),
+                    function_call(
+                        "parts_get_refund_status_tool",
+                        {"order_no": "W174191", "zip": ""},
+                        "call_refund",
+                    ),
+                ],
+                [message("Your order has shipped and the refund is processed.")],
+            ]
+        )
+
+        start = time.perf_counter()
+        result = await Runner.run(
+            create_support_agent(),
+            "Where's my order W174191 and has the refund gone through?",
+            run_config=RunConfig(model=model, tracing_disabled=True),
+        )
+        elapsed = time.perf_counter() - start
+
+        assert api_stub.calls_to("/parts/status") == 1
+        assert api_stub.calls_to("/parts/refundstatus") == 1
+        assert "refund is processed" in result.final_output
+        assert 0.6 <= elapsed < 0.9  # sequential execution would take >= 1.0s
@@ -0,0 +1,100 @@
+"""
+Tests for speculative prefetch of likely tool calls.
+"""
+
+import time
+
+import pytest
+from agents import RunConfig, Runner
+
+from src.agents.parts_support_agent import create_support_agent
+from src.api.client import api_client
+from src.api.prefetch import RequestPrefetcher, extract_prefetch_calls
+from src.testing.stubs import FakeModel, function_call, message
+
+
+class TestIdentifierExtraction:
+    """Test which calls are derived from a query."""
+
+    def test_order_requires_zip(self):
+        """Test that an order number alone does not trigger a prefetch."""
+        assert extract_prefetch_calls("Where is order W174191?") == []
+        assert extract_prefetch_calls("Check order W174191 with zip 20020") == [
+            ("/parts/status", {"orderNo": "W174191", "zip": "20020"})
+        ]
+
+    def test_membership_and_part(self):
+        """Test membership ID and part number extraction."""
+        assert extract_prefetch_calls(
+            "Get subscription details for membership ID 8282916880"
+        ) == [
+            ("/subscription/lookup", {"phoneNumber": "", "membershipId": "8282916880"})
+        ]
+        assert extract_prefetch_calls(
+            "Need part details for part number 1-17548-006"
+        ) == [("/parts/lookup", {"part_number": "1-17548-006"})]
+
+    def test_phone_number_is_not_a_membership_id(self):
+        """Test that phone numbers are left alone."""
+        assert extract_prefetch_calls("subscription for 512-709-1519") == []
+
+
+class TestRequestPrefetcher:
+    """Test the prefetch cache and metrics against the local API stub."""
+
+    def test_tool_call_reuses_prefetched_response(self, api_stub):
+        """Test that a matching API call is served from the prefetch cache."""
+        prefetcher = RequestPrefetcher(api_client)
+        payload = {"part_number": "5304495391"}
+
+        with prefetcher.prefetch("Details on part 5304495391"):
+            response = api_client.post("/parts/lookup", payload)
+
+        assert response["statusCode"] == 200
+        assert api_stub.calls_to("/parts/lookup") == 1
+        assert prefetcher.metrics.used == 1
+        assert prefetcher.metrics.wasted_ratio == 0.0
+
+    def test_wasted_ratio_and_cap(self, api_stub):
+        """Test that unused and over-cap speculative calls are counted."""
+        prefetcher = RequestPrefetcher(api_client, max_speculative_calls=1)
+
+        with prefetcher.prefetch("membership 8282916880 and part 1366"):
+            pass
+
+        assert prefetcher.metrics.issued == 1
+        assert prefetcher.metrics.capped == 1
+        assert prefetcher.metrics.wasted_ratio == 1.0
+
+    @pytest.mark.asyncio
+    async def test_http_latency_overlaps_model_latency(self, api_stub):
+        """Test that the prefetched lookup runs while the model is deciding."""
+        api_stub.delays = {"/parts/status": 0.5}
+        query = "Check order W174191 with zip 20020"
+        model = FakeModel(
+            [
+                [
+                    function_call(
+                        "parts_get_order_status_tool",
+                        {"order_no": "W174191", "zip": "20020"},
+                        "call_status",
+                    )
+                ],
+                [message("Your order has shipped.")],
+            ],
+            latency=0.25,
+        )
+        prefetcher = RequestPrefetcher(api_client)
+
+        start = time.perf_counter()
+        with prefetcher.prefetch(query):
+            await Runner.run(
+                create_support_agent(),
+                query,
+                run_config=RunConfig(model=model, tracing_disabled=True),
+            )
+        elapsed = time.perf_counter() - start
+
+        assert api_stub.calls_to("/parts/status") == 1
+        assert prefetcher.metrics.used == 1
+        assert elapsed < 0.9  # model (0.5s) + HTTP (0.5s) run back to back otherwise
@@ -0,0 +1,170 @@
+"""
+Tests for the opt-in profiler.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.utils.profiling import (
+    _cprofile_report,
+    classify_stage,
+    idle_wait,
+    profiled,
+)
+
+SITE = os.path.join("lib", "site-packages")
+
+
+def frames(*paths):
+    return [(path, name, 1) for path, name in paths]
+
+
+def busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestClassifyStage:
+    """Test stage attribution of stacks."""
+
+    def test_innermost_library_wins(self):
+        """Test that HTTP inside a tool inside a specialist counts as HTTP."""
+        stack = frames(
+            (os.path.join(SITE, "agents", "run.py"), "run"),
+            (
+                os.path.join("src", "agents", "orchestrator_agent.py"),
+                "parts_sales_tool",
+            ),
+            (os.path.join("src", "tools", "parts_tools.py"), "get_part_details_tool"),
+            (os.path.join(SITE, "requests", "sessions.py"), "send"),
+        )
+        assert classify_stage(stack) == "http"
+        assert classify_stage(stack[:3]) == "tool"
+        assert classify_stage(stack[:2]) == "specialist"
+        assert classify_stage(stack[:1]) == "routing"
+
+    def test_idle_threads(self):
+        """Test that threads waiting for work are not attributed to a stage."""
+        stack = frames(
+            (os.path.join("lib", "concurrent", "futures", "thread.py"), "_worker")
+        )
+        assert classify_stage(stack) == "idle"
+        assert classify_stage(frames(("~", "<method 'poll' of 'select.epoll'>"))) == (
+            "idle"
+        )
+
+
+class TestProfiled:
+    """Test the profiling context manager."""
+
+    def test_disabled_does_nothing(self, tmp_path):
+        """Test that no profiler runs and no files are written when disabled."""
+        with profiled(None, str(tmp_path / "out")) as report:
+            busy(0.01)
+        assert report is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_sampling_writes_collapsed_stacks(self, tmp_path, capsys):
+        """Test that sample mode writes flamegraph input and a summary."""
+        with profiled("sample", str(tmp_path / "out"), interval=0.001) as report:
+            busy(0.1)
+
+        lines = (tmp_path / "out.collapsed").read_text().splitlines()
+        assert any("test_profiling:busy" in line for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert report.stages["other"] > 0
+        assert "test_profiling:busy" in [row[0] for row in report.functions[:3]]
+        assert "Profile (sample) by stage" in capsys.readouterr().out
+
+    def test_cprofile_writes_stats(self, tmp_path):
+        """Test that cprofile mode writes a .prof file and ranks hot functions."""
+        with profiled("cprofile", str(tmp_path / "out")) as report:
+            busy(0.05)
+        assert (tmp_path / "out.prof").exists()
+        assert any(row[0] == "test_profiling:busy" for row in report.functions[:5])
+
+    def test_idle_wait_counts_as_idle(self, tmp_path):
+        """Test that a prompt wait inside idle_wait isn't attributed to a stage."""
+        with profiled("sample", str(tmp_path / "out"), interval=0.001) as report:
+            with idle_wait():
+                time.sleep(0.1)
+            busy(0.05)
+
+        assert report.stages["idle"] > report.stages["other"] > 0
+        assert not any("idle_wait" in row[0] for row in report.functions)
+
+    def test_idle_wait_pauses_cprofile(self, tmp_path):
+        """Test that cProfile doesn't record work done while paused."""
+        with profiled("cprofile", str(tmp_path / "out")) as report:
+            with idle_wait():
+                busy(0.02)
+        assert not any(row[0] == "test_profiling:busy" for row in report.functions)
+
+
+class FakeStats:
+    """Minimal ``pstats.Stats`` stand-in: func -> (cc, nc, own, cumulative, callers)."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+
+class TestCProfileStages:
+    """Test stage attribution from cProfile caller edges."""
+
+    def test_stage_inherited_from_callers(self):
+        """Test that helpers count toward the stage of the code calling them."""
+        tool = (
+            os.path.join("src", "agents", "orchestrator_agent.py"),
+            1,
+            "parts_sales_tool",
+        )
+        helper = ("helpers.py", 1, "format_answer")
+        shared = ("json.py", 1, "dumps")
+        http = (os.path.join(SITE, "requests", "sessions.py"), 1, "send")
+        stats = FakeStats(
+            {
+                tool: (1, 1, 0.1, 1.0, {}),
+                helper: (1, 1, 0.4, 0.5, {tool: (1, 1, 0.4, 0.5)}),
+                shared: (
+                    2,
+                    2,
+                    0.2,
+                    0.2,
+                    {helper: (1, 1, 0.1, 0.1), http: (1, 1, 0.1, 0.1)},
+                ),
+                http: (1, 1, 0.3, 0.4, {}),
+                ("main.py", 1, "main"): (1, 1, 0.05, 0.05, {}),
+            }
+        )
+
+        stages = _cprofile_report(stats).stages
+        # The shared helper's 0.2 s is split evenly between its two callers
+        assert stages["specialist"] == pytest.approx(0.6)
+        assert stages["http"] == pytest.approx(0.4)
+        assert stages["other"] == pytest.approx(0.05)
+
+    def test_shared_builtin_split_by_caller_time(self):
+        """Test that a builtin mostly called from routing code isn't all HTTP."""
+        routing = (os.path.join(SITE, "agents", "run.py"), 1, "run")
+        http = (os.path.join(SITE, "urllib3", "response.py"), 1, "read")
+        builtin = ("~", 0, "<built-in method builtins.isinstance>")
+        stats = FakeStats(
+            {
+                routing: (1, 1, 0.5, 1.4, {}),
+                http: (1, 1, 0.2, 0.3, {}),
+                builtin: (
+                    10,
+                    10,
+                    1.0,
+                    1.0,
+                    {routing: (9, 9, 0.9, 0.9), http: (1, 1, 0.1, 0.1)},
+                ),
+            }
+        )
+
+        stages = _cprofile_report(stats).stages
+        assert stages["routing"] == pytest.approx(1.4)
+        assert stages["http"] == pytest.approx(0.3)
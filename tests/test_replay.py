@@ -0,0 +1,137 @@
+"""
+Tests for conversation recording and replay.
+"""
+
+import pytest
+from agents import RunConfig, Usage
+
+from src.api.client import api_client
+from src.serving.replay import (
+    UNMATCHED_RESPONSE,
+    RecordedAPI,
+    ReplayModel,
+    replay_conversation,
+)
+from src.serving.session import OrchestratorSessionHandler
+from src.testing.stubs import LocalAPIStub, ToolThenAnswerModel
+from src.utils.recording import ConversationRecorder, RecordedTurn, RecordingModel
+
+QUERIES = [
+    "Details on part 5304495391",
+    "And is it in stock?",
+    "What does it cost?",
+]
+
+
+async def record(history_turns: int = 3) -> ConversationRecorder:
+    """Record a two-turn conversation against the stub API and a scripted model."""
+    model = ToolThenAnswerModel(
+        {
+            "parts_sales_tool": {"query": "Details on part 5304495391"},
+            "get_part_details_tool": {"part_number": "5304495391"},
+        },
+        usage=Usage(requests=1, input_tokens=100, output_tokens=10, total_tokens=110),
+    )
+    handler = OrchestratorSessionHandler(
+        RunConfig(model=RecordingModel(model), tracing_disabled=True),
+        history_turns=history_turns,
+    )
+    recorder = ConversationRecorder("recorded")
+    for query in QUERIES:
+        with recorder.turn(query) as turn:
+            turn.output = await handler.handle("recorded", query)
+    return recorder
+
+
+async def replay(recording, monkeypatch, **kwargs):
+    """Replay with the API answering from the recording."""
+    api = RecordedAPI(recording.turns, latency_scale=0)
+    with LocalAPIStub(responder=api.respond) as stub:
+        monkeypatch.setattr(api_client.config, "base_url", stub.base_url)
+        report = await replay_conversation(recording, latency_scale=0, **kwargs)
+    return report, api
+
+
+class TestRecording:
+    """Test what a recording captures."""
+
+    @pytest.mark.asyncio
+    async def test_captures_decisions_tools_and_api_calls(self, api_stub, tmp_path):
+        """Test that nested agent runs, tool outputs and API calls are recorded."""
+        recording = await record()
+        turn = recording.turns[0]
+
+        assert [call["agent"] for call in turn.model_calls] == [
+            "parts_sales_tool,parts_support_tool",
+            "get_part_details_tool",
+            "get_part_details_tool",
+            "parts_sales_tool,parts_support_tool",
+        ]
+        assert [tool["name"] for tool in turn.tool_outputs] == [
+            "get_part_details_tool",
+            "parts_sales_tool",
+        ]
+        assert [call["endpoint"] for call in turn.api_calls] == ["/parts/lookup"]
+        assert turn.tokens == 440 and turn.output == "done" and turn.latency > 0
+
+        path = tmp_path / "session.json.gz"
+        recording.save(str(path))
+        loaded = ConversationRecorder.load(str(path))
+        assert loaded.session_id == "recorded"
+        assert loaded.turns == recording.turns
+
+
+class TestReplay:
+    """Test replaying recordings through the current code."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_code_replays_identically(self, api_stub, monkeypatch):
+        """Test that replaying against the same code shows no deltas."""
+        recording = await record()
+
+        report, api = await replay(recording, monkeypatch)
+
+        assert len(report.turns) == 3
+        for turn in report.turns:
+            assert turn.model_call_delta == 0
+            assert turn.token_delta == 0
+            assert turn.api_call_delta == 0
+            assert turn.unmatched_model_calls == 0
+            assert not turn.changed_tool_outputs and not turn.output_changed
+        assert api.hits == 3 and api.misses == 0
+        assert "Replay of session recorded" in report.summary()
+
+    @pytest.mark.asyncio
+    async def test_longer_history_shows_as_token_delta(self, api_stub, monkeypatch):
+        """Test that a prompt change surfaces as a per-turn token delta."""
+        recording = await record(history_turns=1)
+
+        report, _ = await replay(recording, monkeypatch, history_turns=3)
+
+        first, second, third = report.turns
+        assert first.token_delta == second.token_delta == 0
+        assert third.token_delta > 0
+        assert third.model_call_delta == 0
+
+    @pytest.mark.asyncio
+    async def test_changed_api_response_flags_tool_output(self, api_stub, monkeypatch):
+        """Test that a tool producing different output is reported."""
+        recording = await record()
+        for turn in recording.turns:
+            for call in turn.api_calls:
+                call["response"] = {"message": {"title": "Other Part"}}
+
+        report, _ = await replay(recording, monkeypatch)
+
+        assert "get_part_details_tool" in report.turns[0].changed_tool_outputs
+
+    @pytest.mark.asyncio
+    async def test_extra_model_calls_are_unmatched(self):
+        """Test that calls beyond the recording get a placeholder, not an error."""
+        model = ReplayModel(latency_scale=0)
+        model.load_turn(RecordedTurn("hi"))
+
+        response = await model.get_response(None, "hi", None, [], None, [], None)
+
+        assert model.unmatched == 1
+        assert response.output[0].content[0].text == UNMATCHED_RESPONSE
@@ -0,0 +1,143 @@
+"""
+Tests for structured specialist output passed through the orchestrator.
+"""
+
+import json
+
+import pytest
+from agents import RunConfig, Runner, Usage
+
+from src.agents.orchestrator_agent import (
+    create_orchestrator,
+    routing_tools,
+    specialist_agents,
+)
+from src.agents.parts_sales_agent import create_sales_agent
+from src.agents.specialist_output import Entity, SpecialistAnswer
+from src.serving.session import OrchestratorSessionHandler
+from src.testing.stubs import FakeModel, function_call, message
+
+QUERY = "Details on part 5304495391"
+
+ANSWER = {
+    "intent": "part_details",
+    "entities": [{"kind": "part_number", "value": "5304495391"}],
+    "answer": "Part 5304495391 is a Pl Spring for $9.99.",
+    "follow_up_needed": False,
+}
+
+
+def make_model(structured: bool) -> FakeModel:
+    """Route to sales, look up the part, answer; the orchestrator rephrases text."""
+    return FakeModel(
+        [
+            [function_call("parts_sales_tool", {"query": QUERY}, "call_route")],
+            [
+                function_call(
+                    "get_part_details_tool", {"part_number": "5304495391"}, "c"
+                )
+            ],
+            [message(json.dumps(ANSWER) if structured else ANSWER["answer"])],
+            [message("Rephrased: " + ANSWER["answer"])],
+        ],
+        usage=Usage(requests=1, input_tokens=100, output_tokens=10, total_tokens=110),
+    )
+
+
+@pytest.fixture
+def structured_config(monkeypatch):
+    """Enable STRUCTURED_SPECIALIST_OUTPUT."""
+    monkeypatch.setattr(
+        "src.api.config.openai_config.structured_specialist_output", True
+    )
+
+
+class TestStructuredOutput:
+    """Test that structured answers skip the orchestrator's second model call."""
+
+    @pytest.mark.asyncio
+    async def test_answer_passes_through_orchestrator(self, api_stub):
+        """Test that the caller gets the specialist's typed answer directly."""
+        model = make_model(structured=True)
+        result = await Runner.run(
+            create_orchestrator(structured=True),
+            QUERY,
+            run_config=RunConfig(model=model, tracing_disabled=True),
+        )
+
+        answer = result.final_output
+        assert isinstance(answer, SpecialistAnswer)
+        assert answer.entity("part_number") == "5304495391"
+        assert str(answer) == ANSWER["answer"]
+        assert len(model.inputs) == 3
+        assert result.context_wrapper.usage.total_tokens == 330
+
+    @pytest.mark.asyncio
+    async def test_text_output_unchanged(self, api_stub):
+        """Test that text specialists are still rephrased by the orchestrator."""
+        model = make_model(structured=False)
+        result = await Runner.run(
+            create_orchestrator(structured=False),
+            QUERY,
+            run_config=RunConfig(model=model, tracing_disabled=True),
+        )
+
+        assert result.final_output == "Rephrased: " + ANSWER["answer"]
+        assert len(model.inputs) == 4
+
+    @pytest.mark.asyncio
+    async def test_handler_returns_answer_text(self, api_stub, structured_config):
+        """Test that the session handler and its history keep plain text."""
+        handler = OrchestratorSessionHandler(
+            RunConfig(model=make_model(structured=True), tracing_disabled=True)
+        )
+
+        assert await handler.handle("s1", QUERY) == ANSWER["answer"]
+
+    def test_orchestrator_uses_specialists_of_its_mode(self):
+        """Test that each orchestrator routes to specialists of the same mode."""
+        for structured in (False, True):
+            support, sales = specialist_agents(structured)
+            expected = SpecialistAnswer if structured else None
+            assert support.output_type is expected
+            assert sales.output_type is expected
+            assert create_orchestrator(structured=structured).tools == list(
+                routing_tools(structured)
+            )
+        assert routing_tools(True) != routing_tools(False)
+
+    def test_config_enables_structured_output(self, monkeypatch):
+        """Test that STRUCTURED_SPECIALIST_OUTPUT switches the default."""
+        assert create_sales_agent().output_type is None
+        assert create_orchestrator().output_type is None
+        monkeypatch.setattr(
+            "src.api.config.openai_config.structured_specialist_output", True
+        )
+        agent = create_sales_agent()
+        assert agent.output_type is SpecialistAnswer
+        assert "follow_up_needed" in agent.instructions
+        assert create_orchestrator().output_type is SpecialistAnswer
+
+    def test_merge_answers(self):
+        """Test combining the answers of two specialists called in one turn."""
+        merged = SpecialistAnswer.merge(
+            [
+                SpecialistAnswer(
+                    intent="order_status",
+                    entities=[Entity(kind="order_number", value="W174191")],
+                    answer="Your order has shipped.",
+                    follow_up_needed=False,
+                ),
+                SpecialistAnswer(
+                    intent="part_details",
+                    entities=[],
+                    answer="Which part number?",
+                    follow_up_needed=True,
+                ),
+            ]
+        )
+
+        assert merged.intent == "order_status,part_details"
+        assert merged.entity("order_number") == "W174191"
+        assert merged.answer == "Your order has shipped.\n\nWhich part number?"
+        assert merged.follow_up_needed
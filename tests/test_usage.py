@@ -0,0 +1,108 @@
+"""
+Tests for per-request token accounting across nested agent runs.
+"""
+
+import pytest
+from agents import RunConfig, Runner, Usage
+
+from src.agents.orchestrator_agent import create_orchestrator
+from src.agents.usage import (
+    RequestUsage,
+    TokenBudgetExceeded,
+    usage_hooks,
+    usage_scope,
+)
+from src.serving.session import OrchestratorSessionHandler
+from src.testing.stubs import ToolThenAnswerModel
+
+QUERY = "Details on part 5304495391"
+
+
+def make_model() -> ToolThenAnswerModel:
+    """Route to the sales agent, look up the part, answer; 110 tokens per call."""
+    return ToolThenAnswerModel(
+        {
+            "parts_sales_tool": {"query": QUERY},
+            "get_part_details_tool": {"part_number": "5304495391"},
+        },
+        usage=Usage(requests=1, input_tokens=100, output_tokens=10, total_tokens=110),
+    )
+
+
+async def run(budget=0, prices=None):
+    """Run one request inside a usage scope."""
+    with usage_scope(budget, prices) as usage:
+        result = await Runner.run(
+            create_orchestrator(),
+            QUERY,
+            run_config=RunConfig(model=make_model(), tracing_disabled=True),
+            hooks=usage_hooks,
+        )
+    return result, usage
+
+
+class TestRequestUsage:
+    """Test aggregation per request, agent and tool."""
+
+    @pytest.mark.asyncio
+    async def test_nested_runs_are_accounted(self, api_stub):
+        """Test that specialist calls count toward the request and its result."""
+        result, usage = await run()
+
+        assert usage.total.requests == 4
+        assert usage.total.total_tokens == 440
+        assert usage.by_agent["PartsOrchestratorAgent"].total_tokens == 220
+        assert usage.by_agent["PartsSalesAgent"].total_tokens == 220
+        assert set(usage.by_tool) == {"parts_sales_tool"}
+        assert usage.by_tool["parts_sales_tool"].requests == 2
+        # The orchestrator's RunResult includes the nested specialist run
+        assert result.context_wrapper.usage.total_tokens == 440
+
+    def test_cost_uses_model_prices(self):
+        """Test that calls are priced per model and per token direction."""
+        usage = RequestUsage(prices={"small": (1.0, 4.0)})
+        call = Usage(
+            requests=1, input_tokens=1000, output_tokens=500, total_tokens=1500
+        )
+        usage.record("Router", "small", call)
+        usage.record("Specialist", "unpriced", call)
+
+        assert usage.total.cost == pytest.approx(0.003)
+        assert usage.by_agent["Specialist"].cost == 0
+        assert "$0.0030" in usage.summary()
+
+
+class TestTokenBudget:
+    """Test that a request stops once its budget is used up."""
+
+    @pytest.mark.asyncio
+    async def test_budget_aborts_before_next_model_call(self, api_stub):
+        """Test that no model call starts after the budget is exhausted."""
+        with usage_scope(budget=150) as usage, pytest.raises(TokenBudgetExceeded):
+            await Runner.run(
+                create_orchestrator(),
+                QUERY,
+                run_config=RunConfig(model=make_model(), tracing_disabled=True),
+                hooks=usage_hooks,
+            )
+
+        # Routing and the first specialist call ran; the tool loop stopped there
+        assert usage.total.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_handler_records_metrics(self, api_stub, monkeypatch):
+        """Test that the session handler aggregates usage and counts aborts."""
+        handler = OrchestratorSessionHandler(
+            RunConfig(model=make_model(), tracing_disabled=True)
+        )
+        await handler.handle("s1", QUERY)
+
+        monkeypatch.setattr("src.agents.usage.openai_config.token_budget", 150)
+        with pytest.raises(TokenBudgetExceeded):
+            await handler.handle("s2", QUERY)
+
+        metrics = handler.usage_metrics
+        assert metrics.requests == 2
+        assert metrics.budget_exceeded == 1
+        assert metrics.by_agent["PartsSalesAgent"].requests == 3
+        assert metrics.total.total_tokens == 660
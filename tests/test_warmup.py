@@ -0,0 +1,142 @@
+"""
+Tests for startup warm-up.
+"""
+
+import socket
+
+import pytest
+
+from src.api.client import APIClient
+from src.api.config import APIConfig
+from src.serving import warmup as warmup_module
+from src.serving.warmup import DNSCache, Warmup
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeModelClient:
+    """Stands in for AsyncOpenAI: counts ``models.list`` calls."""
+
+    base_url = "http://127.0.0.1:9/v1/"
+
+    def __init__(self):
+        self.calls = 0
+        self.models = self
+
+    async def list(self):
+        self.calls += 1
+
+
+@pytest.fixture
+def dns_cache():
+    cache = DNSCache(ttl_seconds=60, clock=FakeClock(), hosts=["api.example.com"])
+    yield cache
+    cache.uninstall()
+
+
+class TestDNSCache:
+    """Test cached name resolution."""
+
+    def test_results_reused_until_ttl(self, dns_cache, monkeypatch):
+        """Test that repeat lookups skip the resolver until the TTL expires."""
+        lookups = []
+        monkeypatch.setattr(
+            socket, "getaddrinfo", lambda *args: lookups.append(args) or [args]
+        )
+        dns_cache.install()
+
+        socket.getaddrinfo("api.example.com", 443, 0, socket.SOCK_STREAM)
+        socket.getaddrinfo("api.example.com", 443, 0, socket.SOCK_STREAM)
+        assert len(lookups) == 1
+        assert dns_cache.hits == 1
+
+        dns_cache.clock.now = 61
+        socket.getaddrinfo("api.example.com", 443, 0, socket.SOCK_STREAM)
+        assert len(lookups) == 2
+
+        dns_cache.uninstall()
+        assert socket.getaddrinfo is not dns_cache.getaddrinfo
+
+    def test_only_known_hosts_are_cached(self, dns_cache, monkeypatch):
+        """Test that other hosts resolve normally and entries are bounded."""
+        lookups = []
+        monkeypatch.setattr(
+            socket, "getaddrinfo", lambda *args: lookups.append(args) or [args]
+        )
+        dns_cache.max_entries = 2
+        dns_cache.install()
+
+        for _ in range(2):
+            socket.getaddrinfo("other.example.com", 443)
+        assert len(lookups) == 2
+        assert dns_cache.hits == dns_cache.misses == 0
+
+        for port in (80, 443, 8080):
+            socket.getaddrinfo("api.example.com", port)
+        socket.getaddrinfo("api.example.com", 80)
+        assert len(dns_cache._entries) == 2
+        assert len(lookups) == 6
+        dns_cache.uninstall()
+
+
+class TestWarmup:
+    """Test the warm-up steps and readiness."""
+
+    @pytest.mark.asyncio
+    async def test_run_warms_everything_and_signals_ready(
+        self, api_stub, dns_cache, monkeypatch
+    ):
+        """Test graph, DNS and connections are prepared before ready."""
+        installed = []
+        monkeypatch.setattr(
+            warmup_module, "set_default_openai_client", installed.append
+        )
+        config = APIConfig()
+        config.base_url = api_stub.base_url
+        model_client = FakeModelClient()
+        warmup = Warmup(
+            APIClient(config),
+            connections=3,
+            model_client=model_client,
+            dns_cache=dns_cache,
+        )
+        assert not warmup.ready
+
+        report = await warmup.run()
+
+        assert warmup.ready and warmup.wait_ready(0)
+        assert warmup.orchestrator is not None
+        assert dns_cache.installed and dns_cache.misses >= 1
+        assert "127.0.0.1" in dns_cache.hosts
+        assert report.api_connections == 3
+        assert model_client.calls == 3
+        assert installed == [model_client]
+        assert set(report.timings) == {
+            "agent_graph",
+            "dns",
+            "api_connections",
+            "model_connections",
+        }
+
+        warmup.shutdown()
+        assert not dns_cache.installed
+
+    @pytest.mark.asyncio
+    async def test_unreachable_api_is_reported_not_raised(self, dns_cache):
+        """Test that warm-up still completes when the API is down."""
+        config = APIConfig()
+        config.base_url = "http://127.0.0.1:9"
+        client = APIClient(config)
+        warmup = Warmup(client, connections=2, dns_cache=dns_cache)
+
+        report = await warmup.run()
+
+        assert warmup.ready
+        assert report.api_connections == 0
+        assert len(report.errors) == 2
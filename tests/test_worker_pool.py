@@ -0,0 +1,168 @@
+"""
+Tests for the multi-process worker pool.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+from agents import RunConfig
+
+from src.serving.session import OrchestratorSessionHandler, build_context_aware_query
+from src.serving.worker_pool import (
+    WorkerCrashedError,
+    WorkerPool,
+    WorkerRequestError,
+    WorkerUnavailableError,
+)
+from src.testing.stubs import ToolThenAnswerModel
+
+
+class CountingHandler:
+    """Answers with the worker PID and the number of turns seen in the session."""
+
+    def __init__(self):
+        self.turns = {}
+
+    async def handle(self, session_id: str, query: str) -> str:
+        if query == "crash":
+            os._exit(1)
+        if query == "fail":
+            raise ValueError("bad query")
+        if query == "slow":
+            await asyncio.sleep(0.3)
+        self.turns[session_id] = self.turns.get(session_id, 0) + 1
+        return f"{os.getpid()}:{self.turns[session_id]}"
+
+
+class CrashingHandler:
+    """Crashes while the worker starts up."""
+
+    def __init__(self):
+        os._exit(1)
+
+
+@pytest.fixture
+def pool():
+    with WorkerPool(CountingHandler, num_workers=2, monitor_interval=0.05) as pool:
+        yield pool
+
+
+class TestWorkerPool:
+    """Test sticky routing, error propagation and crash recovery."""
+
+    def test_sessions_stick_to_one_worker(self, pool):
+        """Test that a session's turns land on the same worker with local state."""
+        answers = [pool.submit("session-a", "hi").result(timeout=10) for _ in range(3)]
+        pids = {answer.split(":")[0] for answer in answers}
+        assert pids == {str(pool.worker_pid(pool.worker_for("session-a")))}
+        assert [answer.split(":")[1] for answer in answers] == ["1", "2", "3"]
+
+    def test_handler_errors_propagate(self, pool):
+        """Test that handler exceptions surface on the caller's future."""
+        with pytest.raises(WorkerRequestError, match="bad query"):
+            pool.submit("session-a", "fail").result(timeout=10)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_stop_responses(self, pool):
+        """Test that a response for a cancelled request doesn't break the pool."""
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.run("session-a", "slow"), 0.05)
+        await asyncio.sleep(0.5)  # the late response has arrived
+
+        assert all(thread.is_alive() for thread in pool._threads)
+        assert pool.submit("session-a", "hi").result(timeout=3)
+
+    def test_ready_after_every_worker_started(self, pool):
+        """Test that the pool reports ready once each worker is serving."""
+        assert pool.wait_ready(timeout=10)
+        assert pool.ready
+
+    def test_crashed_worker_is_restarted(self, pool):
+        """Test that a dead worker fails its in-flight requests and is replaced."""
+        index = pool.worker_for("session-a")
+        old_pid = pool.worker_pid(index)
+
+        with pytest.raises(WorkerCrashedError):
+            pool.submit("session-a", "crash").result(timeout=10)
+
+        answer = pool.submit("session-a", "hi").result(timeout=10)
+        assert pool.wait_ready(timeout=10)
+        assert pool.restarts == 1
+        assert pool.worker_pid(index) != old_pid
+        assert answer == f"{pool.worker_pid(index)}:1"
+
+    def test_startup_crashes_back_off_then_give_up(self):
+        """Test that a worker crashing on startup isn't restarted in a tight loop."""
+        pool = WorkerPool(
+            CrashingHandler,
+            num_workers=1,
+            monitor_interval=0.01,
+            restart_backoff=0.1,
+            max_startup_failures=3,
+        )
+        start = time.perf_counter()
+        with pool:
+            assert not pool.wait_ready(timeout=10)
+            # Two restarts, 0.1 s then 0.2 s after the previous crash
+            assert time.perf_counter() - start >= 0.3
+            assert pool.restarts == 2
+            with pytest.raises(WorkerUnavailableError, match="3 times"):
+                pool.submit("session-a", "hi")
+
+    def test_submit_before_start(self):
+        """Test that submitting to a pool that isn't running fails clearly."""
+        with pytest.raises(RuntimeError, match="not started"):
+            WorkerPool(CountingHandler, num_workers=1).submit("session-a", "hi")
+
+
+class TestOrchestratorSessionHandler:
+    """Test the per-session orchestrator handler."""
+
+    def test_context_aware_query(self):
+        """Test the conversation context format."""
+        assert build_context_aware_query([], "60179") == "60179"
+        assert build_context_aware_query(
+            [{"query": "Check order W174191", "response": "Zip code?"}], "60179"
+        ) == (
+            "Previous query: Check order W174191\nPrevious response: Zip code?"
+            "\n\nCurrent query: 60179"
+        )
+
+    @pytest.mark.asyncio
+    async def test_history_is_kept_per_session(self, api_stub):
+        """Test that history is bounded and isolated per session."""
+        model = ToolThenAnswerModel(
+            {
+                "parts_sales_tool": {"query": "Details on part 1366"},
+                "get_part_details_tool": {"part_number": "1366"},
+            }
+        )
+        handler = OrchestratorSessionHandler(
+            RunConfig(model=model, tracing_disabled=True), history_turns=2
+        )
+        for _ in range(3):
+            assert await handler.handle("a", "Details on part 1366") == "done"
+        await handler.handle("b", "Details on part 1366")
+
+        assert len(handler.histories["a"]) == 2
+        assert len(handler.histories["b"]) == 1
+        assert api_stub.calls_to("/parts/lookup") == 4
+
+    @pytest.mark.asyncio
+    async def test_least_recent_sessions_are_forgotten(self, api_stub):
+        """Test that only the most recently active sessions keep history."""
+        model = ToolThenAnswerModel(
+            {
+                "parts_sales_tool": {"query": "Details on part 1366"},
+                "get_part_details_tool": {"part_number": "1366"},
+            }
+        )
+        handler = OrchestratorSessionHandler(
+            RunConfig(model=model, tracing_disabled=True), max_sessions=2
+        )
+        for session_id in ("a", "b", "a", "c"):
+            await handler.handle(session_id, "Details on part 1366")
+
+        assert list(handler.histories) == ["a", "c"]